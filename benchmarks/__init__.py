@@ -0,0 +1,12 @@
+"""
+Benchmarks & regression checks of this package's conversions.
+
+Every module is run from the root of the repository (E.g. `python -m benchmarks.checks`).
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__: "Sequence[str]" = ()
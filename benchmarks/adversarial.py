@@ -0,0 +1,170 @@
+"""
+Worst-case throughput benchmark of the downdoc pre-processing & post-processing rewrites.
+
+Every rewrite applied to user-provided content must run in linear time,
+so crafted inputs (long runs of whitespace, asterisks, unclosed summary elements, etc.)
+must never be able to pin a conversion worker.
+This script measures the throughput of the rewrites over each crafted input,
+as well as over randomly generated (fuzzed) documents,
+and exits with a non-zero status if any throughput falls below the given threshold.
+
+Run with: `uv run python -m benchmarks.adversarial --minimum-throughput 2`
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from pydowndoc.conversion_backends import DowndocMarkdownConversionBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from typing import Final
+
+__all__: "Sequence[str]" = ()
+
+
+ADVERSARIAL_INPUTS: "Final[Mapping[str, Callable[[int], str]]]" = {
+    "whitespace-before-admonition": lambda size: f"a{' ' * size}**💡 TIP**\\\n",
+    "whitespace-after-admonition-label": lambda size: f"**💡 TIP{' ' * size}**\\",
+    "repeated-admonition-openings": lambda size: "**💡 TIP " * (size // 8),
+    "asterisk-run": lambda size: f"{'*' * size}**\\\n",
+    "unclosed-strong-text": lambda size: f"**{'a' * size}",
+    "unclosed-summary-elements": lambda size: f"{'<summary>' * (size // 9)}\n</summary>",
+    "unclosed-summary-lines": lambda size: ("<summary>x\n" * (size // 11)) + "</summary>",
+    "summary-code-span-openings": lambda size: f"<summary>{'`+x' * (size // 3)}</summary>",
+    "unclosed-passthrough-links": lambda size: f"[{'](pass:a) ' * (size // 10)}[x",
+    "unterminated-source-block": lambda size: f"\n[source{']' * size}",
+}
+FUZZ_TOKENS: "Final[Sequence[str]]" = (
+    "\n",
+    " ",
+    "\t",
+    "*",
+    "**",
+    "****",
+    "\n****\n",
+    "\n[source",
+    ",python]",
+    "[",
+    "]",
+    "(pass:q)",
+    "pass",
+    ":",
+    "`",
+    "`+",
+    "+`",
+    "_",
+    ">",
+    "💡",
+    "TIP",
+    "NOTE",
+    "**\\\n",
+    "<summary>",
+    "</summary>",
+    "----",
+    "a",
+)
+
+
+def _measure_throughput(content: str, *, repeats: int) -> float:
+    """Return the best throughput (in megabytes per second) of rewriting the content."""
+    fastest_duration: float = float("inf")
+
+    for _ in range(repeats):
+        start_time: float = time.perf_counter()
+        DowndocMarkdownConversionBackend._pre_process(content)  # noqa: SLF001
+        DowndocMarkdownConversionBackend._post_process(content)  # noqa: SLF001
+        fastest_duration = min(fastest_duration, time.perf_counter() - start_time)
+
+    return len(content.encode()) / 1_000_000 / max(fastest_duration, 1e-9)
+
+
+def _generate_fuzzed_document(random_generator: random.Random, *, size: int) -> str:
+    tokens: list[str] = []
+    total_length: int = 0
+
+    while total_length < size:
+        token: str = random_generator.choice(FUZZ_TOKENS)
+        tokens.append(
+            token * random_generator.choice((1, 1, 1, random_generator.randint(2, 4096)))
+        )
+        total_length += len(tokens[-1])
+
+    return "".join(tokens)
+
+
+def _parse_arguments(arguments: "Sequence[str] | None") -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=1_000_000,
+        help="Approximate length, in characters, of each generated input.",
+    )
+    parser.add_argument(
+        "--minimum-throughput",
+        type=float,
+        default=1.0,
+        help="Lowest acceptable throughput, in megabytes per second.",
+    )
+    parser.add_argument(
+        "--fuzz-iterations",
+        type=int,
+        default=50,
+        help="Number of randomly generated documents to measure.",
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(arguments)
+
+
+def main(arguments: "Sequence[str] | None" = None) -> int:
+    """Run the benchmark, writing JSON results to stdout & returning the exit status."""
+    parsed_arguments: argparse.Namespace = _parse_arguments(arguments)
+
+    throughputs: dict[str, float] = {
+        input_name: _measure_throughput(
+            generate_input(parsed_arguments.size), repeats=parsed_arguments.repeats
+        )
+        for input_name, generate_input in ADVERSARIAL_INPUTS.items()
+    }
+
+    random_generator: random.Random = random.Random(parsed_arguments.seed)  # noqa: S311
+    throughputs["fuzzed-documents"] = min(
+        (
+            _measure_throughput(
+                _generate_fuzzed_document(random_generator, size=parsed_arguments.size),
+                repeats=1,
+            )
+            for _ in range(parsed_arguments.fuzz_iterations)
+        ),
+        default=float("inf"),
+    )
+
+    failures: list[str] = sorted(
+        input_name
+        for input_name, throughput in throughputs.items()
+        if throughput < parsed_arguments.minimum_throughput
+    )
+
+    json.dump(
+        {
+            "size": parsed_arguments.size,
+            "minimum_throughput": parsed_arguments.minimum_throughput,
+            "throughputs": throughputs,
+            "failures": failures,
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,167 @@
+"""
+Regression corpus & speed-up benchmark of converting many short fragments in batches.
+
+Every fragment within the regression corpus (crafted to contain cross-references, anchors,
+section titles, attribute entries & delimited blocks that could interact with the fragments
+batched around them) is converted both within batches & on its own,
+by the `downdoc-md` conversion backend.
+The script exits with a non-zero status if any batched conversion differs
+from the conversion of its fragment on its own.
+The duration of both conversions of the generated fragments is also reported.
+
+Run with: `uv run python -m benchmarks.batching --fragments 300 --max-workers 4`
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from pydowndoc.conversion_backends import DowndocMarkdownConversionBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: "Sequence[str]" = ("check_batching",)
+
+
+REGRESSION_FRAGMENTS: "Final[Sequence[str]]" = (
+    "See <<intro>> for details.",
+    "[[intro]]\n== Intro\n\nIntroduction.\n",
+    "Refer to xref:_intro[] & <<_intro>>.\n",
+    "== Intro\n\nAnother introduction.\n",
+    "Jump to <<foo>>.\n",
+    "[#foo]\nAnchored paragraph.\n",
+    "anchor:bar[]Inline anchor.\n",
+    "<<bar,The inline anchor>>\n",
+    "# Markdown-style title\n\nBody.\n",
+    ":product: Pydowndoc\n",
+    "Uses the {product} attribute.\n",
+    "----\nAn unclosed listing block.\n",
+    "Text following an unclosed listing block.\n",
+    "Plain *strong* & _emphasised_ text.\n",
+    "* A list item\n* Another list item\n",
+    "TIP: An admonition.\n",
+    "[source,python]\n----\nprint('Hello')\n----\n",
+    "A fragment without a trailing newline",
+    "Text with a footnote:[The footnote.]\n",
+    "`+monospaced+` text & a https://example.com[link].\n",
+    "trailing spaces   ",
+    "Trailing spaces before a newline   \n",
+    "Trailing blank lines\n\n  \n",
+    "Trailing newlines\n\n\n",
+    "Trailing tab\t",
+    "  Leading spaces\n",
+)
+GENERATED_FRAGMENT_TEMPLATES: "Final[Sequence[str]]" = (
+    "Fixed *{number}* issues within the `+converter+` module.\n",
+    "* Added support for {number} new options.\n* Removed a deprecated option.\n",
+    "NOTE: Release {number} requires a newer https://example.com[runtime].\n",
+    "Return the _{number}th_ item of the sequence.",
+    "[source,python]\n----\nitem = items[{number}]\n----\n",
+)
+
+
+def _convert_separately(fragments: "Sequence[str]") -> tuple[list[str], float]:
+    start_time: float = time.perf_counter()
+    converted_fragments: list[str] = [
+        DowndocMarkdownConversionBackend.convert_string(fragment) for fragment in fragments
+    ]
+    return converted_fragments, time.perf_counter() - start_time
+
+
+def _convert_batched(
+    fragments: "Sequence[str]", *, max_workers: int
+) -> tuple[list[str], float]:
+    start_time: float = time.perf_counter()
+    converted_fragments: list[str] = DowndocMarkdownConversionBackend.convert_strings(
+        fragments, max_workers=max_workers
+    )
+    return converted_fragments, time.perf_counter() - start_time
+
+
+def check_batching(*, max_workers: int = 4, seeds: int = 5) -> list[str]:
+    """Return every regression corpus fragment that converts differently within a batch."""
+    expected_outputs: dict[str, str] = dict(
+        zip(REGRESSION_FRAGMENTS, _convert_separately(REGRESSION_FRAGMENTS)[0], strict=True)
+    )
+
+    mismatches: list[str] = []
+    for seed in range(seeds):
+        fragments: list[str] = list(REGRESSION_FRAGMENTS)
+        random.Random(seed).shuffle(fragments)  # noqa: S311
+
+        # NOTE: A single worker places every batchable fragment within the same batch, so any interaction between fragments is exposed
+        for workers_count in dict.fromkeys((1, max_workers)):
+            batched_outputs, _ = _convert_batched(fragments, max_workers=workers_count)
+            mismatches.extend(
+                f"seed {seed}, {workers_count} workers: {fragment!r}"
+                for fragment, batched_output in zip(fragments, batched_outputs, strict=True)
+                if batched_output != expected_outputs[fragment]
+            )
+
+    return mismatches
+
+
+def _parse_arguments(arguments: "Sequence[str] | None") -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--fragments", type=int, default=200, help="Number of generated fragments to time."
+    )
+    parser.add_argument(
+        "--max-workers", type=int, default=4, help="Number of batches to convert at once."
+    )
+    parser.add_argument(
+        "--seeds",
+        type=int,
+        default=5,
+        help="Number of shuffled orders of the regression corpus to check.",
+    )
+    return parser.parse_args(arguments)
+
+
+def main(arguments: "Sequence[str] | None" = None) -> int:
+    """Run the regression corpus & benchmark, writing JSON results to stdout."""
+    parsed_arguments: argparse.Namespace = _parse_arguments(arguments)
+
+    mismatches: list[str] = check_batching(
+        max_workers=parsed_arguments.max_workers, seeds=parsed_arguments.seeds
+    )
+
+    generated_fragments: list[str] = [
+        GENERATED_FRAGMENT_TEMPLATES[number % len(GENERATED_FRAGMENT_TEMPLATES)].format(
+            number=number
+        )
+        for number in range(parsed_arguments.fragments)
+    ]
+    separate_outputs, separate_duration = _convert_separately(generated_fragments)
+    batched_outputs, batched_duration = _convert_batched(
+        generated_fragments, max_workers=parsed_arguments.max_workers
+    )
+    if batched_outputs != separate_outputs:
+        mismatches.append("generated-fragments")
+
+    json.dump(
+        {
+            "fragments": parsed_arguments.fragments,
+            "max_workers": parsed_arguments.max_workers,
+            "durations": {
+                "separate_seconds": separate_duration,
+                "batched_seconds": batched_duration,
+                "speed_up": separate_duration / batched_duration,
+            },
+            "mismatches": mismatches,
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
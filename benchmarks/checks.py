@@ -0,0 +1,64 @@
+"""
+Regression checks of the equivalence of this package's optimised conversions.
+
+* `rewriting` - The precompiled pre/post-processing rewrites equal the reference rewrites.
+* `sections` - The split & incremental output of a document equals its whole-document output.
+* `batching` - The batched output of a fragment equals its single output.
+
+The `sections` & `batching` checks require the downdoc executable.
+The script exits with a non-zero status if any check finds a mismatch.
+
+Run with: `uv run python -m benchmarks.checks`
+"""
+
+import argparse
+import json
+import sys
+from typing import TYPE_CHECKING
+
+from benchmarks.batching import check_batching
+from benchmarks.rewriting import check_rewriting
+from benchmarks.sections import check_section_splitting
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from typing import Final
+
+__all__: "Sequence[str]" = ()
+
+
+CHECKS: "Final[Mapping[str, Callable[[], list[str]]]]" = {
+    "rewriting": check_rewriting,
+    "sections": check_section_splitting,
+    "batching": check_batching,
+}
+
+
+def _parse_arguments(arguments: "Sequence[str] | None") -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "checks",
+        nargs="*",
+        choices=tuple(CHECKS),
+        help="The checks to run (defaults to every check).",
+    )
+    return parser.parse_args(arguments)
+
+
+def main(arguments: "Sequence[str] | None" = None) -> int:
+    """Run the selected regression checks, writing JSON mismatches to stdout."""
+    parsed_arguments: argparse.Namespace = _parse_arguments(arguments)
+
+    mismatches: dict[str, list[str]] = {
+        check_name: CHECKS[check_name]()
+        for check_name in dict.fromkeys(parsed_arguments.checks or CHECKS)
+    }
+
+    json.dump({"mismatches": mismatches}, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+    return 1 if any(mismatches.values()) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
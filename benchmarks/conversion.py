@@ -0,0 +1,433 @@
+"""
+Reproducible throughput benchmark of every conversion backend.
+
+A deterministic corpus of AsciiDoc documents (containing tables, source blocks,
+admonitions & collapsible blocks that become `<summary>` elements) is generated
+at each of the requested sizes.
+Both `convert_string()` & `convert_file()` are then timed for every backend,
+with the Python-side processing cost (measured by tracing the Python stages
+that each operation runs) reported separately from the cost
+of the external conversion subprocesses.
+
+Passing `--fake-executables` replaces downdoc, Asciidoctor & pandoc
+with local stand-in executables that copy their input straight to their output,
+so that the pure overhead of this package can be tracked on machines
+where none of the real executables are installed.
+
+Results are written as JSON. Passing the results of a previous run as `--baseline`
+additionally reports every measurement that has become slower than the given threshold.
+
+Run with: `uv run python -m benchmarks.conversion --sizes 1KB 1MB --output results.json`
+"""
+
+import argparse
+import datetime
+import inspect
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pydowndoc import conversion_backends, tracing
+from pydowndoc.conversion_backends import BaseConversionBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+    from typing import Final
+
+    from pydowndoc.tracing import TraceSpan
+
+__all__: "Sequence[str]" = ()
+
+
+DEFAULT_CORPUS_SIZES: "Final[Sequence[str]]" = ("1KB", "64KB", "1MB", "10MB", "50MB")
+SIZE_SUFFIXES: "Final[Mapping[str, int]]" = {"KB": 1024, "MB": 1024**2, "B": 1}
+PYTHON_PROCESSING_STAGES: "Final[frozenset[str]]" = frozenset(
+    {"resolve_executable", "read", "pre_process", "post_process", "write"}
+)
+
+CORPUS_SECTION_TEMPLATE: "Final[str]" = """== Section {number}
+
+This is the *introduction* to section {number}, with `+inline code+`, _emphasis_
+& a link to https://example.com/section/{number}[the section's reference page].
+
+TIP: Remember that section {number} builds upon the previous section.
+
+[NOTE]
+====
+Section {number} contains a table, a source block & a collapsible block.
+====
+
+[cols="1,3"]
+|===
+|Name |Description
+
+|`+alpha-{number}+`
+|The *first* entry within section {number}.
+
+|`+beta-{number}+`
+|The _second_ entry within section {number}.
+|===
+
+[source,python]
+----
+def section_{number}() -> int:
+    return {number} ** 2
+----
+
+.Details of `+section-{number}+` & *more*
+[%collapsible]
+====
+* The first hidden point of section {number}.
+* The second hidden point of section {number}.
+====
+
+"""
+
+FAKE_EXECUTABLE_SCRIPT: "Final[str]" = """#!/bin/sh
+# Stand-in for downdoc, asciidoctor & pandoc that copies its input to its output.
+output=-
+source_directory=
+destination_directory=
+while [ "$#" -gt 0 ]; do
+    case "$1" in
+        --version) echo "fake 0.0.0"; exit 0 ;;
+        --list-output-formats)
+            printf '%s\n' markdown markdown_mmd markdown_phpextra plain rst; exit 0 ;;
+        --output|--out-file) output="$2"; shift ;;
+        --source-dir) source_directory="$2"; shift ;;
+        --destination-dir) destination_directory="$2"; shift ;;
+        --) shift; break ;;
+    esac
+    shift
+done
+if [ -n "$destination_directory" ]; then
+    for input in "$@"; do
+        relative_input="${input#"$source_directory"/}"
+        mkdir -p "$destination_directory/$(dirname "$relative_input")" || exit 1
+        cat -- "$input" > "$destination_directory/${relative_input%.*}.xml" || exit 1
+    done
+    exit 0
+fi
+input="${1:--}"
+if [ "$input" = - ]; then input=/dev/stdin; fi
+if [ "$output" = - ]; then exec cat -- "$input"; fi
+exec cat -- "$input" > "$output"
+"""
+FAKE_EXECUTABLE_NAMES: "Final[Sequence[str]]" = ("asciidoctor", "downdoc", "pandoc")
+
+
+def parse_size(raw_size: str) -> int:
+    """Convert a human-readable size (E.g. "64KB") to a number of bytes."""
+    normalised_size: str = raw_size.strip().upper()
+
+    for suffix, multiplier in SIZE_SUFFIXES.items():
+        if normalised_size.endswith(suffix):
+            return int(float(normalised_size.removesuffix(suffix)) * multiplier)
+
+    return int(normalised_size)
+
+
+def generate_corpus_document(size: int) -> str:
+    """Generate a deterministic AsciiDoc document of at least the given size in bytes."""
+    sections: list[str] = ["= Benchmark Corpus Document\n\n"]
+    total_size: int = len(sections[0])
+    section_number: int = 1
+
+    while total_size < size:
+        sections.append(CORPUS_SECTION_TEMPLATE.format(number=section_number))
+        total_size += len(sections[-1].encode())
+        section_number += 1
+
+    return "".join(sections)
+
+
+def install_fake_executables(directory: Path) -> None:
+    """
+    Create stand-in executables within the given directory & put it first on the PATH.
+
+    Each stand-in is also selected by its overriding environment variable,
+    so that it is used even when the downdoc binary of `Pydowndoc-bin` is installed.
+    """
+    if sys.platform == "win32":
+        FAKE_EXECUTABLES_UNSUPPORTED_MESSAGE: Final[str] = (
+            "Fake executables are only supported on POSIX platforms."
+        )
+        raise OSError(FAKE_EXECUTABLES_UNSUPPORTED_MESSAGE)
+
+    for executable_name in FAKE_EXECUTABLE_NAMES:
+        executable_path: Path = directory / executable_name
+        executable_path.write_text(FAKE_EXECUTABLE_SCRIPT)
+        executable_path.chmod(0o755)
+        os.environ[f"PYDOWNDOC_{executable_name.upper()}_EXECUTABLE"] = str(executable_path)
+
+    os.environ["PATH"] = os.pathsep.join((str(directory), os.environ.get("PATH", "")))
+
+
+def get_backends(
+    backend_ids: "Iterable[str] | None" = None,
+) -> "Sequence[type[BaseConversionBackend]]":
+    """Retrieve every concrete conversion backend, optionally filtered by ID."""
+    selected_backend_ids: frozenset[str] | None = (
+        frozenset(backend_ids) if backend_ids is not None else None
+    )
+    backends: list[type[BaseConversionBackend]] = []
+
+    for backend_name in conversion_backends.__all__:
+        backend: object = getattr(conversion_backends, backend_name)
+        if not isinstance(backend, type) or not issubclass(backend, BaseConversionBackend):
+            continue
+        if inspect.isabstract(backend):
+            continue
+        if selected_backend_ids is not None and backend.ID not in selected_backend_ids:
+            continue
+        backends.append(backend)
+
+    return backends
+
+
+def _get_backend_version(backend: type[BaseConversionBackend]) -> str | None:
+    try:
+        return backend.get_version()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _time_call(function: "Callable[[], object]", *, repeats: int) -> list[float]:
+    durations: list[float] = []
+
+    for _ in range(repeats):
+        start_time: float = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start_time)
+
+    return durations
+
+
+def _measure_python_processing(function: "Callable[[], object]") -> float:
+    """
+    Return the time spent by this package processing the input & output of a conversion.
+
+    The conversion is traced, so that only the Python stages that the conversion really runs
+    (E.g. reading, pre-processing, post-processing & writing) are measured.
+    """
+    spans: list[TraceSpan] = []
+    tracing.register_tracer(spans.append)
+    try:
+        function()
+    finally:
+        tracing.unregister_tracer(spans.append)
+
+    return sum((span.duration for span in spans if span.name in PYTHON_PROCESSING_STAGES), 0.0)
+
+
+def _summarise_durations(
+    backend: type[BaseConversionBackend],
+    operation: str,
+    *,
+    size: int,
+    durations: "Sequence[float]",
+    python_processing_duration: float,
+) -> dict[str, object]:
+    minimum_duration: float = min(durations)
+
+    return {
+        "backend": backend.ID,
+        "operation": operation,
+        "size_bytes": size,
+        "durations_seconds": list(durations),
+        "minimum_seconds": minimum_duration,
+        "median_seconds": statistics.median(durations),
+        "throughput_megabytes_per_second": size / 1_000_000 / max(minimum_duration, 1e-9),
+        "python_processing_seconds": python_processing_duration,
+        "subprocess_seconds": max(minimum_duration - python_processing_duration, 0.0),
+    }
+
+
+def benchmark_backend(
+    backend: type[BaseConversionBackend],
+    asciidoc_content: str,
+    *,
+    working_directory: Path,
+    repeats: int,
+) -> list[dict[str, object]]:
+    """Time both string & file conversions of the given content with the given backend."""
+    size: int = len(asciidoc_content.encode())
+
+    input_path: Path = working_directory / f"corpus-{size}.adoc"
+    input_path.write_text(asciidoc_content)
+    output_path: Path = working_directory / f"corpus-{size}{backend.FILE_SUFFIX}"
+
+    operations: Mapping[str, Callable[[], object]] = {
+        "convert_string": lambda: backend.convert_string(asciidoc_content),
+        "convert_file": lambda: backend.convert_file(input_path, output_location=output_path),
+    }
+
+    return [
+        _summarise_durations(
+            backend,
+            operation,
+            size=size,
+            durations=_time_call(function, repeats=repeats),
+            python_processing_duration=_measure_python_processing(function),
+        )
+        for operation, function in operations.items()
+    ]
+
+
+def find_regressions(
+    results: "Iterable[Mapping[str, object]]",
+    baseline_results: "Iterable[Mapping[str, object]]",
+    *,
+    threshold: float,
+) -> list[dict[str, object]]:
+    """Report every measurement that has become slower than its baseline by the threshold."""
+    baseline_durations: dict[tuple[object, object, object], object] = {
+        (result["backend"], result["operation"], result["size_bytes"]): result[
+            "minimum_seconds"
+        ]
+        for result in baseline_results
+    }
+    regressions: list[dict[str, object]] = []
+
+    for result in results:
+        baseline_duration: object = baseline_durations.get(
+            (result["backend"], result["operation"], result["size_bytes"])
+        )
+        duration: object = result["minimum_seconds"]
+        if not isinstance(baseline_duration, float) or not isinstance(duration, float):
+            continue
+
+        slowdown: float = duration / max(baseline_duration, 1e-9)
+        if slowdown > 1 + threshold:
+            regressions.append(
+                {
+                    "backend": result["backend"],
+                    "operation": result["operation"],
+                    "size_bytes": result["size_bytes"],
+                    "slowdown": slowdown,
+                }
+            )
+
+    return regressions
+
+
+def _get_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ("git", "rev-parse", "HEAD"),  # noqa: S607
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _parse_arguments(arguments: "Sequence[str] | None") -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        default=DEFAULT_CORPUS_SIZES,
+        help="Sizes of the generated corpus documents (E.g. 1KB, 64KB, 50MB).",
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=None,
+        help="IDs of the conversion backends to measure (defaults to every backend).",
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--fake-executables",
+        action="store_true",
+        help="Replace every external executable with a local stand-in that copies its input.",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="File to write results to.")
+    parser.add_argument(
+        "--baseline", type=Path, default=None, help="Results of a previous run to compare to."
+    )
+    parser.add_argument(
+        "--regression-threshold",
+        type=float,
+        default=0.1,
+        help="Fractional slowdown, compared to the baseline, reported as a regression.",
+    )
+    return parser.parse_args(arguments)
+
+
+def main(arguments: "Sequence[str] | None" = None) -> int:
+    """Run the benchmark, writing JSON results & returning the exit status."""
+    parsed_arguments: argparse.Namespace = _parse_arguments(arguments)
+
+    with tempfile.TemporaryDirectory(prefix="pydowndoc-benchmark-") as raw_working_directory:
+        working_directory: Path = Path(raw_working_directory)
+
+        if parsed_arguments.fake_executables:
+            fake_executables_directory: Path = working_directory / "bin"
+            fake_executables_directory.mkdir()
+            install_fake_executables(fake_executables_directory)
+
+        backend_versions: dict[str, str | None] = {}
+        results: list[dict[str, object]] = []
+
+        for backend in get_backends(parsed_arguments.backends):
+            backend_versions[backend.ID] = _get_backend_version(backend)
+            if backend_versions[backend.ID] is None:
+                continue
+
+            for raw_size in parsed_arguments.sizes:
+                results.extend(
+                    benchmark_backend(
+                        backend,
+                        generate_corpus_document(parse_size(raw_size)),
+                        working_directory=working_directory,
+                        repeats=parsed_arguments.repeats,
+                    )
+                )
+
+    regressions: list[dict[str, object]] = []
+    if parsed_arguments.baseline is not None:
+        baseline: object = json.loads(parsed_arguments.baseline.read_text())
+        if isinstance(baseline, dict) and isinstance(baseline.get("results"), list):
+            regressions = find_regressions(
+                results,
+                baseline["results"],
+                threshold=parsed_arguments.regression_threshold,
+            )
+
+    serialised_results: str = json.dumps(
+        {
+            "commit": _get_commit(),
+            "created_at": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "fake_executables": parsed_arguments.fake_executables,
+            "repeats": parsed_arguments.repeats,
+            "backend_versions": backend_versions,
+            "results": results,
+            "regressions": regressions,
+        },
+        indent=2,
+    )
+
+    if parsed_arguments.output is None:
+        sys.stdout.write(f"{serialised_results}\n")
+    else:
+        parsed_arguments.output.write_text(f"{serialised_results}\n")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,147 @@
+"""
+Benchmark of resolving the downdoc executable, on a long `PATH` of mostly missing directories.
+
+The number of filesystem lookups (`stat()` & `access()` calls) & the duration
+of every resolution are measured, both for the previous behaviour
+of searching the `PATH` on every call & for the cached resolution.
+The script exits with a non-zero status if any cached resolution accesses the filesystem.
+
+Run with: `uv run python -m benchmarks.executables --path-entries 30 --calls 10000`
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pydowndoc import executables
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from types import FrameType
+    from typing import Final
+
+__all__: "Sequence[str]" = ()
+
+
+FILESYSTEM_LOOKUP_FUNCTIONS: "Final[Sequence[object]]" = (
+    os.stat,
+    os.lstat,
+    os.access,
+    os.scandir,
+    os.listdir,
+)
+
+
+class _FilesystemLookupCounter:
+    """Profiler counting every call to a filesystem lookup function."""
+
+    def __init__(self) -> None:
+        self.count: int = 0
+
+    def __call__(self, _frame: "FrameType", event: str, arg: object) -> None:
+        """Count the called function, if it looks up the filesystem."""
+        if event == "c_call" and arg in FILESYSTEM_LOOKUP_FUNCTIONS:
+            self.count += 1
+
+
+def _measure(function: "Callable[[], object]", *, calls: int) -> dict[str, float]:
+    filesystem_lookup_counter: _FilesystemLookupCounter = _FilesystemLookupCounter()
+
+    sys.setprofile(filesystem_lookup_counter)
+    try:
+        function()
+    finally:
+        sys.setprofile(None)
+    first_call_filesystem_lookups: int = filesystem_lookup_counter.count
+
+    filesystem_lookup_counter.count = 0
+    sys.setprofile(filesystem_lookup_counter)
+    try:
+        for _ in range(calls):
+            function()
+    finally:
+        sys.setprofile(None)
+    repeated_calls_filesystem_lookups: int = filesystem_lookup_counter.count
+
+    start_time: float = time.perf_counter()
+    for _ in range(calls):
+        function()
+    repeated_calls_duration: float = time.perf_counter() - start_time
+
+    return {
+        "first_call_filesystem_lookups": first_call_filesystem_lookups,
+        "repeated_call_filesystem_lookups": repeated_calls_filesystem_lookups / calls,
+        "repeated_call_seconds": repeated_calls_duration / calls,
+    }
+
+
+def _parse_arguments(arguments: "Sequence[str] | None") -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--path-entries",
+        type=int,
+        default=30,
+        help="Number of missing directories placed on the PATH before the executable.",
+    )
+    parser.add_argument(
+        "--calls", type=int, default=10000, help="Number of repeated resolutions to time."
+    )
+    return parser.parse_args(arguments)
+
+
+def main(arguments: "Sequence[str] | None" = None) -> int:
+    """Run the benchmark, writing JSON results to stdout & returning the exit status."""
+    parsed_arguments: argparse.Namespace = _parse_arguments(arguments)
+
+    with tempfile.TemporaryDirectory() as raw_temporary_directory:
+        temporary_directory: Path = Path(raw_temporary_directory)
+
+        executable_path: Path = temporary_directory / "bin" / "downdoc"
+        executable_path.parent.mkdir()
+        executable_path.write_text("#!/bin/sh\n")
+        executable_path.chmod(0o755)
+
+        os.environ.pop("PYDOWNDOC_DOWNDOC_EXECUTABLE", None)
+        os.environ["PATH"] = os.pathsep.join(
+            (
+                *(
+                    str(temporary_directory / f"missing-{index}")
+                    for index in range(parsed_arguments.path_entries)
+                ),
+                str(executable_path.parent),
+            )
+        )
+        executables.clear_executable_cache()
+
+        results: dict[str, dict[str, float]] = {
+            "uncached": _measure(
+                lambda: shutil.which("downdoc"), calls=parsed_arguments.calls
+            ),
+            "cached": _measure(
+                lambda: executables.get_executable_path("downdoc"),
+                calls=parsed_arguments.calls,
+            ),
+        }
+
+    json.dump(
+        {
+            "path_entries": parsed_arguments.path_entries,
+            "calls": parsed_arguments.calls,
+            "results": results,
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+    return 1 if results["cached"]["repeated_call_filesystem_lookups"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,104 @@
+"""
+Benchmark of repeated metadata updates by the `downdoc-readme` Hatch build hook.
+
+Hatchling requests a project's metadata many times within a single build process,
+so every `update()` call after the first must be nearly free.
+The given README file is copied into a temporary project, using an empty persistent cache,
+then the hook's first (converting) call is timed separately from the repeated calls.
+
+Run with: `uv run python -m benchmarks.hatch_hook --calls 1000`
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from benchmarks.conversion import install_fake_executables
+from pydowndoc.hatch_hooks import DowndocReadmeMetadataHook
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__: "Sequence[str]" = ()
+
+
+def _time_update(hook: DowndocReadmeMetadataHook) -> float:
+    metadata: dict[str, object] = {"dynamic": ["readme"]}
+
+    start_time: float = time.perf_counter()
+    hook.update(metadata)
+    return time.perf_counter() - start_time
+
+
+def _parse_arguments(arguments: "Sequence[str] | None") -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--readme",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent / "README.adoc",
+        help="AsciiDoc README file to convert.",
+    )
+    parser.add_argument(
+        "--calls", type=int, default=1000, help="Number of repeated `update()` calls."
+    )
+    parser.add_argument(
+        "--fake-executables",
+        action="store_true",
+        help="Replace every conversion executable with a stand-in that copies its input.",
+    )
+    return parser.parse_args(arguments)
+
+
+def main(arguments: "Sequence[str] | None" = None) -> int:
+    """Run the benchmark, writing JSON results to stdout & returning the exit status."""
+    parsed_arguments: argparse.Namespace = _parse_arguments(arguments)
+
+    with tempfile.TemporaryDirectory() as raw_temporary_directory:
+        temporary_directory: Path = Path(raw_temporary_directory)
+        os.environ["XDG_CACHE_HOME"] = str(temporary_directory / "cache")
+
+        if parsed_arguments.fake_executables:
+            executables_directory: Path = temporary_directory / "bin"
+            executables_directory.mkdir()
+            install_fake_executables(executables_directory)
+
+        project_directory: Path = temporary_directory / "project"
+        project_directory.mkdir()
+        shutil.copyfile(parsed_arguments.readme, project_directory / "README.adoc")
+
+        hook: DowndocReadmeMetadataHook = DowndocReadmeMetadataHook(str(project_directory), {})
+
+        first_call_duration: float = _time_update(hook)
+        repeated_call_durations: list[float] = [
+            _time_update(hook) for _ in range(parsed_arguments.calls)
+        ]
+
+    json.dump(
+        {
+            "readme": str(parsed_arguments.readme),
+            "calls": parsed_arguments.calls,
+            "first_call_seconds": first_call_duration,
+            "repeated_call_seconds": {
+                "mean": statistics.mean(repeated_call_durations),
+                "median": statistics.median(repeated_call_durations),
+                "max": max(repeated_call_durations),
+                "total": sum(repeated_call_durations),
+            },
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,229 @@
+"""
+Regression corpus & CPU/memory benchmark of the downdoc pre/post-processing rewrites.
+
+Every document within the regression corpus (crafted to contain sidebars, source blocks,
+strong text, admonitions, passthrough links & `<summary>` elements,
+both on their own & interacting with each other), along with randomly generated documents,
+is rewritten both by the precompiled rewrites of the downdoc conversion backend
+& by the original chain of one `re.sub()` call per rule, which they replaced.
+The script exits with a non-zero status if any output differs between the two.
+
+The CPU time & peak memory allocated by both implementations
+are also reported for each generated multi-megabyte corpus document.
+
+Run with: `uv run python -m benchmarks.rewriting --sizes 1MB 10MB`
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from benchmarks.adversarial import FUZZ_TOKENS
+from benchmarks.conversion import generate_corpus_document, parse_size
+from pydowndoc.conversion_backends import DowndocMarkdownConversionBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from typing import Final
+
+__all__: "Sequence[str]" = ("check_rewriting",)
+
+
+POST_PROCESSING_SECTION_TEMPLATE: "Final[str]" = """## Section {number}
+
+This is the ***introduction*** to section {number}, with `inline code`.
+
+**💡 TIP**\\
+Remember that section {number} builds upon the previous section.
+
+> **🔥 CAUTION**\\
+> Section {number} contains a passthrough [link](pass:q) [https://example.com/{number}].
+
+<details>
+<summary>Details of `+section-{number}+`, _emphasis_ & *more*</summary>
+
+* ****Strong****text within section {number}.
+
+</details>
+
+"""
+
+REGRESSION_CORPUS: "Final[Mapping[str, str]]" = {
+    "sidebar": "Before\n****\nWithin a sidebar.\n****\nAfter\n",
+    "sidebar-within-source-block": "Before\n[source]\n****\nAfter\n",
+    "source-block": "Before\n[source,python]\nprint('**strong**text')\nAfter\n",
+    "delimited-source-block": "Before\n[source,python]\n----\nprint('Hello')\n----\n",
+    "strong-text": "**Strong**text & **not strong** text.\n",
+    "admonitions": (
+        "**💡 TIP**\\\nA tip.\n\nText **⚠️ WARNING:**\\\nA warning.\n\n"
+        "> **🔥 CAUTION**\\\nAlready quoted.\n"
+    ),
+    "passthrough-links": "A [link](pass:q) [https://example.com] & [text]( pass : a )[x].\n",
+    "double-strong-text": "****Double****strong & ****not double**** strong.\n",
+    "summary-titles": (
+        "<summary>`+code+`, `code`, _emphasis_ & *strong*</summary>\n"
+        "<summary></summary><summary>Empty</summary>\n"
+        "<summary>Unclosed\n</summary>\n"
+    ),
+    "without-trailing-newline": "**💡 TIP**\\\n****Double****strong",
+}
+
+
+def _replace_reference_summary_title(match: "re.Match[str]") -> str:
+    replaced_summary_title: str = re.sub(r"`(\+?)(.*?)\1`", r"<code>\2</code>", match.group())
+    replaced_summary_title = re.sub(r"_(.*?)_", r"<em>\1</em>", replaced_summary_title)
+    return re.sub(r"\*(.*?)\*", r"<strong>\1</strong>", replaced_summary_title)
+
+
+def _reference_pre_process(readme_content: str) -> str:
+    readme_content = readme_content.replace("\n****\n", "\n____\n")
+    readme_content = re.sub(
+        r"(?<=\n\[source)([^]\n]*]\n)(.+)(?=\n)",
+        (
+            lambda match: (
+                match.group()
+                if (
+                    re.search(r"\A(?:-{2,}|_{2,}|={2,}|\.{3,})(?=\n|\Z)", match.group(2))
+                    is not None
+                )
+                else f"{match.group(1)}----\n{match.group(2)}\n----"
+            )
+        ),
+        readme_content,
+    )
+    return re.sub(r"(\*{2})([^*\n]+)\1(?=[A-Za-z0-9])", r"***\2***", readme_content)
+
+
+def _reference_post_process(converted_readme: str) -> str:
+    post_processed_readme: str = re.sub(
+        r"(?<=<summary>).*?(?=</summary>)", _replace_reference_summary_title, converted_readme
+    )
+    post_processed_readme = re.sub(
+        r"([^>]\s+|\A)(\*\*)(?=[^\w\s!\"^*()_+='@#~;:.><,`-]\s*(?:TIP|NOTE|HINT|WARNING|INFO|INFORMATION|HAZARD|CAUTION|IMPORTANT)\s*:?\s*\*\*\\\n)",
+        r"\1> \2",
+        post_processed_readme,
+    )
+    post_processed_readme = re.sub(
+        r"\[([^[]+)]\(\s*pass\s*:\s*[a-z]+\)\s*\[([^[]+)]", r"[\2](\1)", post_processed_readme
+    )
+    return re.sub(r"(\*{4})([^*\n]+)\1(?=[A-Za-z0-9])", r"**\2**", post_processed_readme)
+
+
+def _rewrite(content: str) -> str:
+    return DowndocMarkdownConversionBackend._post_process(  # noqa: SLF001
+        DowndocMarkdownConversionBackend._pre_process(content)  # noqa: SLF001
+    )
+
+
+def _reference_rewrite(content: str) -> str:
+    return _reference_post_process(_reference_pre_process(content))
+
+
+def _generate_fuzzed_document(random_generator: random.Random, *, size: int) -> str:
+    # NOTE: Tokens are only repeated a few times, because the reference chain takes quadratic time upon long runs of repeated tokens
+    tokens: list[str] = []
+    total_length: int = 0
+
+    while total_length < size:
+        tokens.append(random_generator.choice(FUZZ_TOKENS) * random_generator.randint(1, 4))
+        total_length += len(tokens[-1])
+
+    return "".join(tokens)
+
+
+def _measure(
+    rewrite: "Callable[[str], str]", content: str, *, repeats: int
+) -> dict[str, float]:
+    fastest_cpu_time: float = float("inf")
+    for _ in range(repeats):
+        start_cpu_time: float = time.process_time()
+        rewrite(content)
+        fastest_cpu_time = min(fastest_cpu_time, time.process_time() - start_cpu_time)
+
+    tracemalloc.start()
+    try:
+        rewrite(content)
+        _, peak_allocated_size = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "cpu_seconds": fastest_cpu_time,
+        "peak_allocated_megabytes": peak_allocated_size / 1024**2,
+    }
+
+
+def check_rewriting(*, fuzz_iterations: int = 2000, seed: int = 0) -> list[str]:
+    """Return every regression corpus & randomly generated document rewritten wrongly."""
+    mismatches: list[str] = [
+        document_name
+        for document_name, content in REGRESSION_CORPUS.items()
+        if _rewrite(content) != _reference_rewrite(content)
+    ]
+
+    random_generator: random.Random = random.Random(seed)  # noqa: S311
+    for fuzz_iteration in range(fuzz_iterations):
+        fuzzed_content: str = _generate_fuzzed_document(random_generator, size=256)
+        if _rewrite(fuzzed_content) != _reference_rewrite(fuzzed_content):
+            mismatches.append(f"fuzzed-document-{fuzz_iteration}: {fuzzed_content!r}")
+
+    return mismatches
+
+
+def _parse_arguments(arguments: "Sequence[str] | None") -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        default=("1MB", "10MB"),
+        help="Sizes of the generated corpus documents to time (E.g. 1MB 40MB).",
+    )
+    parser.add_argument(
+        "--fuzz-iterations",
+        type=int,
+        default=2000,
+        help="Number of randomly generated documents to compare.",
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(arguments)
+
+
+def main(arguments: "Sequence[str] | None" = None) -> int:
+    """Run the regression corpus & benchmark, writing JSON results to stdout."""
+    parsed_arguments: argparse.Namespace = _parse_arguments(arguments)
+
+    mismatches: list[str] = check_rewriting(
+        fuzz_iterations=parsed_arguments.fuzz_iterations, seed=parsed_arguments.seed
+    )
+
+    measurements: dict[str, dict[str, dict[str, float]]] = {}
+    for raw_size in parsed_arguments.sizes:
+        size: int = parse_size(raw_size)
+        content: str = generate_corpus_document(size // 2) + "".join(
+            POST_PROCESSING_SECTION_TEMPLATE.format(number=number)
+            for number in range(size // 2 // len(POST_PROCESSING_SECTION_TEMPLATE))
+        )
+        if _rewrite(content) != _reference_rewrite(content):
+            mismatches.append(f"generated-corpus-{raw_size}")
+
+        measurements[raw_size] = {
+            "precompiled": _measure(_rewrite, content, repeats=parsed_arguments.repeats),
+            "reference": _measure(
+                _reference_rewrite, content, repeats=parsed_arguments.repeats
+            ),
+        }
+
+    json.dump({"measurements": measurements, "mismatches": mismatches}, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,215 @@
+"""
+Regression corpus & speed-up benchmark of converting large documents as concurrent sections.
+
+Every document within the regression corpus (crafted to contain document-header attributes,
+delimited blocks, conditionals & discrete headings around its section boundaries)
+is converted both whole & split into sections, by the `downdoc-md` conversion backend.
+Each document, followed by an edited version of it, is also converted incrementally.
+The script exits with a non-zero status if any split or incremental conversion differs
+from its whole-document conversion.
+The duration of both conversions of each generated corpus document is also reported.
+
+Run with: `uv run python -m benchmarks.sections --sizes 1MB 40MB --max-workers 8`
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from benchmarks.conversion import generate_corpus_document, parse_size
+from pydowndoc import sections
+from pydowndoc.conversion_backends import DowndocMarkdownConversionBackend
+from pydowndoc.incremental import IncrementalConverter
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from typing import Final
+
+__all__: "Sequence[str]" = ("check_section_splitting",)
+
+
+REGRESSION_SECTION_TEMPLATE: "Final[str]" = """== Section {number} of {{product}}
+
+Introduction to section {number}, using the {{audience}} attribute.
+
+IMPORTANT: Section {number} contains blocks that resemble section headings.
+
+----
+== Not a section heading, within a listing block
+----
+
+....
+== Not a section heading, within a literal block
+....
+
+////
+== Not a section heading, within a comment block
+////
+
+```asciidoc
+== Not a section heading, within a fenced code block
+```
+
+[discrete]
+== Discrete heading {number}
+
+ifdef::show-extras[]
+== Conditional section {number}
+
+Only shown when the show-extras attribute is set.
+endif::[]
+
+ifndef::hide-details[]
+Details of section {number}.
+endif::[]
+
+:audience: readers of section {number}
+
+[[section-{number}-anchor]]
+.The anchored example of section {number}
+====
+Anchored example content.
+====
+
+[%collapsible]
+.Collapsible *details* of `+section-{number}+`
+====
+* Hidden point within section {number}.
+====
+
+"""
+
+REGRESSION_CORPUS: "Final[Mapping[str, str]]" = {
+    "header-with-author-&-revision": (
+        "= Regression Document\n"
+        "Jane Doe <jane@example.com>\n"
+        "v1.0, 2024-01-01\n"
+        ":product: Pydowndoc\n"
+        ":audience: everyone\n"
+        "ifdef::env-github[]\n"
+        ":tip-caption: :bulb:\n"
+        "endif::[]\n"
+        "\n"
+        "Preamble of {doctitle}.\n"
+        "\n"
+        + "".join(REGRESSION_SECTION_TEMPLATE.format(number=number) for number in range(12))
+    ),
+    "attributes-without-title": (
+        ":product: Pydowndoc\n:audience: everyone\n:show-extras:\n\n"
+        + "".join(REGRESSION_SECTION_TEMPLATE.format(number=number) for number in range(12))
+    ),
+    "no-trailing-newline": (
+        "= Regression Document\n:product: Pydowndoc\n:audience: everyone\n\n"
+        + "".join(REGRESSION_SECTION_TEMPLATE.format(number=number) for number in range(12))
+    ).rstrip(),
+    "generated-corpus": generate_corpus_document(256 * 1024),
+}
+
+
+def _convert(asciidoc_content: str, *, max_workers: int | None) -> tuple[str, float]:
+    if max_workers is None:
+        sections.disable_section_splitting()
+    else:
+        sections.enable_section_splitting(max_workers, minimum_size=0)
+
+    start_time: float = time.perf_counter()
+    converted_content: str = DowndocMarkdownConversionBackend.convert_string(asciidoc_content)
+    return converted_content, time.perf_counter() - start_time
+
+
+def check_section_splitting(*, max_workers: int = 4) -> list[str]:
+    """
+    Return every regression corpus document that converts differently once split.
+
+    Documents are also reported if they cannot be split,
+    or if converting them incrementally differs from converting them whole.
+    """
+    mismatches: list[str] = []
+
+    try:
+        for document_name, asciidoc_content in REGRESSION_CORPUS.items():
+            chunks: list[str] | None = sections.split_document(
+                asciidoc_content, maximum_chunks=max_workers
+            )
+            if chunks is None:
+                mismatches.append(f"{document_name} (not split)")
+                continue
+
+            whole_output, _ = _convert(asciidoc_content, max_workers=None)
+            split_output, _ = _convert(asciidoc_content, max_workers=max_workers)
+            if split_output != whole_output:
+                mismatches.append(document_name)
+
+            incremental_converter: IncrementalConverter = IncrementalConverter(
+                max_workers=max_workers
+            )
+            edited_content: str = asciidoc_content.replace("section 3", "section III")
+            if any(
+                incremental_converter.convert(version)
+                != _convert(version, max_workers=None)[0]
+                for version in (asciidoc_content, edited_content)
+            ):
+                mismatches.append(f"{document_name} (incremental)")
+    finally:
+        sections.disable_section_splitting()
+
+    return mismatches
+
+
+def _parse_arguments(arguments: "Sequence[str] | None") -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        default=("1MB", "10MB"),
+        help="Sizes of the generated corpus documents to time (E.g. 64KB 40MB).",
+    )
+    parser.add_argument(
+        "--max-workers", type=int, default=4, help="Number of sections to split into."
+    )
+    return parser.parse_args(arguments)
+
+
+def main(arguments: "Sequence[str] | None" = None) -> int:
+    """Run the regression corpus & benchmark, writing JSON results to stdout."""
+    parsed_arguments: argparse.Namespace = _parse_arguments(arguments)
+
+    mismatches: list[str] = check_section_splitting(max_workers=parsed_arguments.max_workers)
+
+    durations: dict[str, dict[str, float]] = {}
+    for raw_size in parsed_arguments.sizes:
+        asciidoc_content = generate_corpus_document(parse_size(raw_size))
+
+        whole_output, whole_duration = _convert(asciidoc_content, max_workers=None)
+        split_output, split_duration = _convert(
+            asciidoc_content, max_workers=parsed_arguments.max_workers
+        )
+        if split_output != whole_output:
+            mismatches.append(f"generated-corpus-{raw_size}")
+
+        durations[raw_size] = {
+            "whole_seconds": whole_duration,
+            "split_seconds": split_duration,
+            "speed_up": whole_duration / split_duration,
+        }
+
+    sections.disable_section_splitting()
+
+    json.dump(
+        {
+            "max_workers": parsed_arguments.max_workers,
+            "durations": durations,
+            "mismatches": mismatches,
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
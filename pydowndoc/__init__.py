@@ -2,12 +2,15 @@
 
 from typing import TYPE_CHECKING, overload
 
-from ._utils import OUTPUT_CONVERSION_TO_STRING, ConversionError
+from . import conversion_backends
+from ._utils import OUTPUT_CONVERSION_TO_STRING, ConversionError, FileConversionResult
 from .conversion_backends import DowndocMarkdownConversionBackend
+from .sessions import Converter
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
     from pathlib import Path
+    from typing import Final
 
     from ._utils import ConversionOutputDestinationFlag
     from .conversion_backends import BaseConversionBackend
@@ -15,8 +18,16 @@ if TYPE_CHECKING:
 __all__: "Sequence[str]" = (
     "OUTPUT_CONVERSION_TO_STRING",
     "ConversionError",
+    "Converter",
+    "FileConversionResult",
+    "aconvert_file",
+    "aconvert_string",
     "convert_file",
+    "convert_file_to_formats",
+    "convert_files",
     "convert_string",
+    "convert_string_to_formats",
+    "convert_strings",
     "get_version",
 )
 
@@ -27,6 +38,9 @@ def get_version(
     """
     Retrieve the current version of the given conversion backend.
 
+    The version is only probed once per process for each installed executable,
+    or once per machine whilst a disk cache is enabled.
+
     Arguments:
         backend: The conversion backend to get the version of, defaults to `DOWNDOC_MD`.
 
@@ -104,6 +118,45 @@ def convert_file(
     )
 
 
+def convert_files(
+    file_paths: "Iterable[Path]",
+    *,
+    attributes: "Mapping[str, str] | None" = None,
+    output_locations: "Mapping[Path, Path | ConversionOutputDestinationFlag] | None" = None,
+    backend: "type[BaseConversionBackend]" = DowndocMarkdownConversionBackend,
+    max_workers: int | None = None,
+) -> "Iterator[FileConversionResult]":
+    """
+    Execute the downdoc converter upon many input file paths concurrently.
+
+    With the pandoc backends, batches of files are converted to DocBook
+    by a single Asciidoctor run each, so Ruby's startup time is only paid once per batch.
+
+    Arguments:
+        file_paths: The locations of the files to convert from AsciiDoc to Markdown.
+        attributes: AsciiDoc attributes to be set while rendering AsciiDoc files.
+        output_locations: A mapping of input file paths to the location to save
+            each converted Markdown output, or `OUTPUT_CONVERSION_TO_STRING`
+            to return that output within its result.
+            Any file path not within this mapping will use the same name as the input file,
+            with the extension changed to `.md`.
+        backend: The conversion backend to use, defaults to `downdoc-md`.
+        max_workers: The maximum number of conversion subprocesses to run at once,
+            defaults to the number of CPUs available.
+
+    Returns:
+        An iterator of the result of each file's conversion, in the order of completion.
+        Failed conversions are reported with the raised exception as their `error`,
+        without aborting the conversion of the remaining files.
+    """
+    return backend.convert_files(
+        file_paths,
+        attributes=attributes,
+        output_locations=output_locations,
+        max_workers=max_workers,
+    )
+
+
 def convert_string(
     asciidoc_content: str,
     *,
@@ -125,3 +178,251 @@ def convert_string(
         ConversionError: When calling the downdoc subprocess exited with an error.
     """
     return backend.convert_string(asciidoc_content=asciidoc_content, attributes=attributes)
+
+
+def convert_strings(
+    asciidoc_contents: "Iterable[str]",
+    *,
+    attributes: "Mapping[str, str] | None" = None,
+    backend: "type[BaseConversionBackend]" = DowndocMarkdownConversionBackend,
+    max_workers: int | None = None,
+) -> list[str]:
+    """
+    Execute the downdoc converter upon many short AsciiDoc content strings.
+
+    With the `downdoc-md` backend, many strings are converted within each subprocess
+    (pre/post-processed once per subprocess),
+    with each string's output split back out at unambiguous separators.
+    Strings that could affect, or be affected by, the conversion of the strings around them
+    (E.g. those containing attribute entries, unclosed delimited blocks,
+    section titles, anchors or cross-references, or ending with whitespace)
+    are converted on their own instead.
+
+    Arguments:
+        asciidoc_contents: The string AsciiDoc contents to convert.
+        attributes: AsciiDoc attributes to be set while rendering AsciiDoc files.
+        backend: The conversion backend to use, defaults to `downdoc-md`.
+        max_workers: The maximum number of conversion subprocesses to run at once,
+            defaults to the number of CPUs available.
+
+    Returns:
+        The converted Markdown output of each string, in the given order.
+
+    Raises:
+        ConversionError: When calling the downdoc subprocess exited with an error.
+    """
+    return backend.convert_strings(
+        asciidoc_contents, attributes=attributes, max_workers=max_workers
+    )
+
+
+def convert_string_to_formats(
+    asciidoc_content: str,
+    *,
+    backends: "Iterable[type[BaseConversionBackend]]",
+    attributes: "Mapping[str, str] | None" = None,
+) -> "Mapping[str, str]":
+    """
+    Convert the given AsciiDoc content string to many formats, using a single Asciidoctor run.
+
+    The DocBook output of Asciidoctor is shared between every given pandoc conversion backend,
+    whose pandoc subprocesses are run concurrently.
+
+    Arguments:
+        asciidoc_content: The string AsciiDoc content to convert.
+        backends: The pandoc conversion backends to use.
+        attributes: AsciiDoc attributes to be set while rendering AsciiDoc files.
+
+    Returns:
+        A mapping of each conversion backend's ID to its converted output.
+
+    Raises:
+        TypeError: When any of the given conversion backends does not use pandoc.
+        subprocess.CalledProcessError: When calling any conversion subprocess exited
+            with a non-zero exit code.
+    """
+    if not asciidoc_content.strip():
+        INVALID_ASCIIDOC_CONTENT_MESSAGE: Final[str] = "Cannot convert empty string content."
+        raise ValueError(INVALID_ASCIIDOC_CONTENT_MESSAGE)
+
+    return conversion_backends._convert_to_pandoc_formats(  # noqa: SLF001
+        backends, attributes=attributes, input_text=asciidoc_content, input_path=None
+    )
+
+
+@overload
+def convert_file_to_formats(
+    file_path: "Path",
+    *,
+    backends: "Iterable[type[BaseConversionBackend]]",
+    output_location: "ConversionOutputDestinationFlag",
+    attributes: "Mapping[str, str] | None" = ...,
+) -> "Mapping[str, str]": ...
+
+
+@overload
+def convert_file_to_formats(
+    file_path: "Path",
+    *,
+    backends: "Iterable[type[BaseConversionBackend]]",
+    attributes: "Mapping[str, str] | None" = ...,
+    output_location: None = ...,
+) -> None: ...
+
+
+def convert_file_to_formats(
+    file_path: "Path",
+    *,
+    backends: "Iterable[type[BaseConversionBackend]]",
+    attributes: "Mapping[str, str] | None" = None,
+    output_location: "ConversionOutputDestinationFlag | None" = None,
+) -> "Mapping[str, str] | None":
+    """
+    Convert the given input file to many formats, using a single Asciidoctor run.
+
+    The DocBook output of Asciidoctor is shared between every given pandoc conversion backend,
+    whose pandoc subprocesses are run concurrently.
+
+    Arguments:
+        file_path: The location of the file to convert from AsciiDoc.
+        backends: The pandoc conversion backends to use.
+        attributes: AsciiDoc attributes to be set while rendering AsciiDoc files.
+        output_location: `OUTPUT_CONVERSION_TO_STRING` to return every converted output.
+            By default (or when `None`), each output file will use the same name
+            as the input file, with the extension changed to its backend's file suffix.
+
+    Returns:
+        `None`, or a mapping of each conversion backend's ID to its converted output
+        when `output_location` is `OUTPUT_CONVERSION_TO_STRING`.
+
+    Raises:
+        TypeError: When any of the given conversion backends does not use pandoc.
+        ValueError: When writing output files for many conversion backends
+            that share the same file suffix.
+        subprocess.CalledProcessError: When calling any conversion subprocess exited
+            with a non-zero exit code.
+    """
+    if not file_path.is_file():
+        raise FileNotFoundError(file_path)
+
+    backends = tuple(backends)
+
+    if output_location is None:
+        file_suffixes: set[str] = {backend.FILE_SUFFIX for backend in backends}
+        if len(file_suffixes) < len({backend.ID for backend in backends}):
+            DUPLICATE_FILE_SUFFIX_MESSAGE: Final[str] = (
+                "Cannot write the output of many conversion backends "
+                "that share the same file suffix."
+            )
+            raise ValueError(DUPLICATE_FILE_SUFFIX_MESSAGE)
+
+    converted_outputs: Mapping[str, str] = conversion_backends._convert_to_pandoc_formats(  # noqa: SLF001
+        backends, attributes=attributes, input_text=None, input_path=file_path
+    )
+
+    if output_location is OUTPUT_CONVERSION_TO_STRING:
+        return converted_outputs
+
+    for backend in backends:
+        backend._output_converted_file(  # noqa: SLF001
+            file_path, converted_outputs[backend.ID], output_location=output_location
+        )
+
+    return None
+
+
+@overload
+async def aconvert_file(
+    file_path: "Path",
+    *,
+    output_location: "ConversionOutputDestinationFlag",
+    backend: "type[BaseConversionBackend]" = ...,
+    attributes: "Mapping[str, str] | None" = ...,
+    postpublish: bool = ...,
+    prepublish: bool = ...,
+) -> str: ...
+
+
+@overload
+async def aconvert_file(
+    file_path: "Path",
+    *,
+    attributes: "Mapping[str, str] | None" = ...,
+    output_location: "Path | None" = ...,
+    backend: "type[BaseConversionBackend]" = ...,
+    postpublish: bool = ...,
+    prepublish: bool = ...,
+) -> None: ...
+
+
+async def aconvert_file(
+    file_path: "Path",
+    *,
+    attributes: "Mapping[str, str] | None" = None,
+    output_location: "Path | ConversionOutputDestinationFlag | None" = None,
+    backend: "type[BaseConversionBackend]" = DowndocMarkdownConversionBackend,
+    postpublish: bool = False,
+    prepublish: bool = False,
+) -> str | None:
+    """
+    Asynchronously execute the downdoc converter upon the given input file path.
+
+    The conversion subprocesses are run without blocking the event loop,
+    and are killed if the awaiting task is cancelled.
+
+    Arguments:
+        file_path: The location of the file to convert from AsciiDoc to Markdown.
+        attributes: AsciiDoc attributes to be set while rendering AsciiDoc files.
+        output_location: The location to save the converted Markdown output,
+            or `OUTPUT_CONVERSION_TO_STRING` to return as a string.
+            By default (or when `None`), the output file will use the same name
+            as the input file, with the extension changed to `.md`.
+        backend: The conversion backend to use, defaults to `downdoc-md`.
+        postpublish: Whether to run the postpublish lifecycle routine (restore the input file).
+        prepublish: Whether to run the prepublish lifecycle routine
+            (convert and hide the input file).
+
+    Returns:
+        `None`, or the converted Markdown output
+        when `output_location` is `OUTPUT_CONVERSION_TO_STRING`.
+
+    Raises:
+        subprocess.CalledProcessError: When calling the downdoc subprocess exited
+            with a non-zero exit code.
+    """
+    return await backend.aconvert_file(
+        file_path=file_path,
+        attributes=attributes,
+        output_location=output_location,
+        postpublish=postpublish,
+        prepublish=prepublish,
+    )
+
+
+async def aconvert_string(
+    asciidoc_content: str,
+    *,
+    attributes: "Mapping[str, str] | None" = None,
+    backend: "type[BaseConversionBackend]" = DowndocMarkdownConversionBackend,
+) -> str:
+    """
+    Asynchronously execute the downdoc converter upon the given AsciiDoc content string.
+
+    The conversion subprocesses are run without blocking the event loop,
+    and are killed if the awaiting task is cancelled.
+
+    Arguments:
+        asciidoc_content: The string AsciiDoc content to convert.
+        attributes: AsciiDoc attributes to be set while rendering AsciiDoc files.
+        backend: The conversion backend to use, defaults to `downdoc-md`.
+
+    Returns:
+        The converted Markdown output.
+
+    Raises:
+        subprocess.CalledProcessError: When calling the downdoc subprocess exited
+            with a non-zero exit code.
+    """
+    return await backend.aconvert_string(
+        asciidoc_content=asciidoc_content, attributes=attributes
+    )
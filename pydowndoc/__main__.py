@@ -0,0 +1,307 @@
+"""Command-line interface to convert many AsciiDoc files within a single process."""
+
+import argparse
+import glob
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from . import dependencies
+from .conversion_backends import (
+    DowndocMarkdownConversionBackend,
+    PandocMarkdownConversionBackend,
+    PandocMultiMarkdownConversionBackend,
+    PandocPHPMarkdownExtraConversionBackend,
+    PandocRSTConversionBackend,
+    PandocTXTConversionBackend,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+    from typing import Final
+
+    from .conversion_backends import BaseConversionBackend
+
+__all__: "Sequence[str]" = ("main",)
+
+
+_CONVERSION_BACKENDS: "Final[Mapping[str, type[BaseConversionBackend]]]" = {
+    conversion_backend.ID: conversion_backend
+    for conversion_backend in (
+        DowndocMarkdownConversionBackend,
+        PandocMarkdownConversionBackend,
+        PandocMultiMarkdownConversionBackend,
+        PandocPHPMarkdownExtraConversionBackend,
+        PandocTXTConversionBackend,
+        PandocRSTConversionBackend,
+    )
+}
+
+
+class _ConversionTiming(NamedTuple):
+    file_path: Path
+    duration: float
+    input_size: int
+
+
+def _parse_attribute(raw_attribute: str) -> tuple[str, str]:
+    name, _, value = raw_attribute.partition("=")
+
+    if not name.strip():
+        INVALID_ATTRIBUTE_MESSAGE: Final[str] = (
+            f"Invalid attribute: {raw_attribute!r} (expected NAME=VALUE)."
+        )
+        raise argparse.ArgumentTypeError(INVALID_ATTRIBUTE_MESSAGE)
+
+    return name.strip(), value
+
+
+def _parse_jobs(raw_jobs: str) -> int:
+    try:
+        jobs: int = int(raw_jobs)
+    except ValueError:
+        jobs = 0
+
+    if jobs < 1:
+        INVALID_JOBS_MESSAGE: Final[str] = f"Invalid number of jobs: {raw_jobs!r}."
+        raise argparse.ArgumentTypeError(INVALID_JOBS_MESSAGE)
+
+    return jobs
+
+
+def _parse_arguments(arguments: "Sequence[str] | None") -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="pydowndoc",
+        description=(
+            "Convert AsciiDoc files, directories (recursively) & glob patterns, "
+            "writing each output file next to its input file."
+        ),
+    )
+    parser.add_argument(
+        "paths", nargs="+", help="AsciiDoc files, directories or glob patterns to convert."
+    )
+    parser.add_argument(
+        "-b",
+        "--backend",
+        choices=tuple(_CONVERSION_BACKENDS),
+        default=DowndocMarkdownConversionBackend.ID,
+        help="ID of the conversion backend to use (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-a",
+        "--attribute",
+        dest="attributes",
+        action="append",
+        type=_parse_attribute,
+        default=[],
+        metavar="NAME=VALUE",
+        help="AsciiDoc attribute to set for every conversion (can be given many times).",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_parse_jobs,
+        default=os.cpu_count() or 1,
+        help="Number of files to convert concurrently (default: the number of CPUs).",
+    )
+    parser.add_argument(
+        "-s",
+        "--suffix",
+        dest="suffixes",
+        action="append",
+        default=None,
+        help="Suffix of the files to convert within directories (default: .adoc).",
+    )
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Convert every file, even if its output is newer than it & its dependencies.",
+    )
+    parser.add_argument(
+        "--slowest",
+        type=int,
+        default=5,
+        help="Number of the slowest files to report (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Do not report the throughput summary."
+    )
+    return parser.parse_args(arguments)
+
+
+def _expand_paths(raw_paths: "Iterable[str]", *, suffixes: tuple[str, ...]) -> list[Path]:
+    """Expand every directory & glob pattern into the AsciiDoc files that it contains."""
+    file_paths: dict[Path, None] = {}
+
+    for raw_path in raw_paths:
+        path: Path = Path(raw_path)
+
+        matched_paths: Iterable[Path] = (
+            (path,)
+            if path.exists() or not glob.has_magic(raw_path)
+            else (
+                Path(matched_path)
+                for matched_path in sorted(glob.glob(raw_path, recursive=True))  # noqa: PTH207
+            )
+        )
+
+        for matched_path in matched_paths:
+            if matched_path.is_dir():
+                file_paths.update(
+                    (file_path, None)
+                    for file_path in sorted(matched_path.rglob("*"))
+                    if file_path.name.endswith(suffixes) and file_path.is_file()
+                )
+            else:
+                file_paths[matched_path] = None
+
+    return list(file_paths)
+
+
+def _is_output_up_to_date(
+    file_path: Path,
+    backend: "type[BaseConversionBackend]",
+    *,
+    attributes: "Mapping[str, str]",
+) -> bool:
+    """Return whether the output file is newer than the input file & all its dependencies."""
+    try:
+        output_modified_time: int = (
+            file_path.with_suffix(backend.FILE_SUFFIX).stat().st_mtime_ns
+        )
+        input_modified_time: int = file_path.stat().st_mtime_ns
+    except OSError:
+        return False
+
+    if input_modified_time > output_modified_time:
+        return False
+
+    # NOTE: Dependencies that do not exist cannot be newer than the output file
+    return not any(
+        dependency_snapshot is not None and dependency_snapshot[0] > output_modified_time
+        for dependency_snapshot in map(
+            dependencies._get_file_snapshot,  # noqa: SLF001
+            dependencies.get_dependencies(file_path, attributes=attributes),
+        )
+    )
+
+
+def _get_file_size(file_path: Path) -> int:
+    try:
+        return file_path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+
+    return f"{size:.1f} GiB"
+
+
+def _write_summary(
+    timings: "Sequence[_ConversionTiming]",
+    *,
+    skipped_count: int,
+    failed_count: int,
+    duration: float,
+    slowest_count: int,
+) -> None:
+    total_input_size: int = sum(timing.input_size for timing in timings)
+
+    sys.stderr.write(
+        f"Converted {len(timings)} file(s) ({skipped_count} up to date, "
+        f"{failed_count} failed) in {duration:.2f}s: "
+        f"{len(timings) / duration:.1f} files/s, "
+        f"{_format_size(total_input_size / duration)}/s\n"
+    )
+
+    slowest_timings: list[_ConversionTiming] = sorted(
+        timings, key=lambda timing: timing.duration, reverse=True
+    )[:slowest_count]
+    if slowest_timings:
+        sys.stderr.write("Slowest files:\n")
+        for timing in slowest_timings:
+            sys.stderr.write(
+                f"  {timing.duration:8.3f}s  {_format_size(timing.input_size):>10}  "
+                f"{timing.file_path}\n"
+            )
+
+
+def main(arguments: "Sequence[str] | None" = None) -> int:
+    """Convert every given AsciiDoc file, returning the exit status."""
+    parsed_arguments: argparse.Namespace = _parse_arguments(arguments)
+
+    backend: type[BaseConversionBackend] = _CONVERSION_BACKENDS[parsed_arguments.backend]
+    attributes: dict[str, str] = dict(parsed_arguments.attributes)
+    suffixes: tuple[str, ...] = tuple(parsed_arguments.suffixes or (".adoc",))
+
+    start_time: float = time.perf_counter()
+
+    file_paths: list[Path] = _expand_paths(parsed_arguments.paths, suffixes=suffixes)
+    if not file_paths:
+        sys.stderr.write("pydowndoc: No AsciiDoc files found.\n")
+        return 1
+
+    outdated_file_paths: list[Path] = (
+        file_paths
+        if parsed_arguments.force
+        else [
+            file_path
+            for file_path in file_paths
+            if not _is_output_up_to_date(file_path, backend, attributes=attributes)
+        ]
+    )
+
+    timings: list[_ConversionTiming] = []
+    failed_count: int = 0
+
+    for file_conversion_result in backend.convert_files(
+        outdated_file_paths, attributes=attributes or None, max_workers=parsed_arguments.jobs
+    ):
+        error: Exception | None = file_conversion_result.error
+        if error is None:
+            timings.append(
+                _ConversionTiming(
+                    file_path=file_conversion_result.file_path,
+                    duration=file_conversion_result.duration or 0.0,
+                    input_size=_get_file_size(file_conversion_result.file_path),
+                )
+            )
+            continue
+
+        if not isinstance(error, (subprocess.SubprocessError, OSError, ValueError)):
+            raise error
+
+        failed_count += 1
+        error_message: str = (
+            error.stderr
+            if isinstance(error, subprocess.CalledProcessError) and error.stderr
+            else str(error)
+        )
+        sys.stderr.write(
+            f"pydowndoc: Failed to convert {file_conversion_result.file_path}: "
+            f"{error_message.strip()}\n"
+        )
+
+    if not parsed_arguments.quiet:
+        _write_summary(
+            timings,
+            skipped_count=len(file_paths) - len(outdated_file_paths),
+            failed_count=failed_count,
+            duration=max(time.perf_counter() - start_time, 1e-9),
+            slowest_count=parsed_arguments.slowest,
+        )
+
+    return 1 if failed_count else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
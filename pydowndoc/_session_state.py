@@ -0,0 +1,35 @@
+"""State of the conversion session that is active within the current context."""
+
+import contextvars
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    from .caching import DiskConversionCache, MemoryConversionCache
+    from .tracing import TraceSpan
+    from .workers import _AsciidoctorWorkerPool, _PrespawnedProcessPool
+
+__all__: "Sequence[str]" = ()
+
+
+class _SessionState(NamedTuple):
+    """
+    Everything a `Converter` resolved ahead of time, or owns, for the lifetime of its session.
+
+    Caches & pools that are `None` fall back to those enabled for the whole process.
+    """
+
+    attributes: "Mapping[str, str] | None"
+    attribute_arguments: tuple[str, ...]
+    executable_paths: "Mapping[str, str]"
+    memory_cache: "MemoryConversionCache | None"
+    disk_cache: "DiskConversionCache | None"
+    tracers: "tuple[Callable[[TraceSpan], object], ...]"
+    downdoc_process_pool: "_PrespawnedProcessPool | None"
+    asciidoctor_worker_pool: "_AsciidoctorWorkerPool | None"
+
+
+_current_session: "contextvars.ContextVar[_SessionState | None]" = contextvars.ContextVar(
+    "pydowndoc_current_session", default=None
+)
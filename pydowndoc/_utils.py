@@ -1,7 +1,7 @@
 """Common utility classes internal to this project."""
 
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 if sys.version_info >= (3, 12):
     from typing import override
@@ -10,12 +10,14 @@ else:
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from pathlib import Path
     from typing import Final
 
 __all__: "Sequence[str]" = (
     "OUTPUT_CONVERSION_TO_STRING",
     "ConversionError",
     "ConversionOutputDestinationFlag",
+    "FileConversionResult",
 )
 
 
@@ -42,3 +44,16 @@ class ConversionError(RuntimeError):
         self.message: str | None = message
         self.subprocess_return_code: int | None = subprocess_return_code
         self.subprocess_stderr: str | None = subprocess_stderr
+
+
+class FileConversionResult(NamedTuple):
+    """
+    The outcome of converting a single file as part of a batch of file conversions.
+
+    The duration is the number of seconds that the successful conversion took.
+    """
+
+    file_path: "Path"
+    output: str | None = None
+    error: Exception | None = None
+    duration: float | None = None
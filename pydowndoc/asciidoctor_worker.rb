@@ -0,0 +1,67 @@
+# frozen_string_literal: true
+
+# Long-lived Asciidoctor worker, used by Pydowndoc to avoid paying the Ruby interpreter
+# & gem load startup cost for every conversion to DocBook.
+#
+# Requests & responses are JSON objects, each framed by a 4-byte big-endian length prefix.
+# Once Asciidoctor has loaded, a handshake is sent before any request is read:
+# Handshake: {"status": "ready", "version": "<Asciidoctor version>"}
+# Request: {"attributes": ["name=value", ...], "input_path": "..." | null, "content": "..." | null}
+# Response: {"status": "ok" | "error", "output": "...", "messages": "..."}
+
+require 'asciidoctor'
+require 'json'
+
+$VERBOSE = true
+$stdin.binmode
+$stdout.binmode
+$stdout.sync = true
+
+def read_request
+  header = $stdin.read 4
+  return nil if header.nil? || header.bytesize < 4
+
+  body = $stdin.read header.unpack1('N')
+  return nil if body.nil?
+
+  JSON.parse body.force_encoding(Encoding::UTF_8)
+end
+
+def write_response(response)
+  body = JSON.generate(response).b
+  $stdout.write [body.bytesize].pack('N'), body
+end
+
+def format_messages(logger)
+  logger.messages.map { |entry| "asciidoctor: #{entry[:severity]}: #{entry[:message]}\n" }.join
+end
+
+def convert(request)
+  logger = Asciidoctor::MemoryLogger.new
+  Asciidoctor::LoggerManager.logger = logger
+
+  options = {
+    safe: :unsafe,
+    backend: 'docbook5',
+    standalone: true,
+    to_file: false,
+    attributes: request['attributes'] || []
+  }
+
+  output = if request['input_path']
+             Asciidoctor.convert_file request['input_path'], options
+           else
+             Asciidoctor.convert request['content'] || '', options
+           end
+
+  status = logger.max_severity && logger.max_severity >= Logger::Severity::WARN ? 'error' : 'ok'
+  { status: status, output: output.to_s, messages: format_messages(logger) }
+rescue StandardError, SyntaxError => e
+  { status: 'error', output: '', messages: "asciidoctor: FAILED: #{e.message}\n" }
+end
+
+write_response({ status: 'ready', version: Asciidoctor::VERSION })
+
+while (request = read_request)
+  write_response convert(request)
+end
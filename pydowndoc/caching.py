@@ -0,0 +1,469 @@
+"""Opt-in in-process & persistent caches to reuse the output of identical conversions."""
+
+import collections
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if sys.version_info >= (3, 12):
+    from typing import override
+else:
+    from typing_extensions import override
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+from . import _session_state, dependencies
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+    from typing import Final
+
+    from .conversion_backends import BaseConversionBackend
+
+__all__: "Sequence[str]" = (
+    "CacheStatistics",
+    "DiskConversionCache",
+    "MemoryConversionCache",
+    "disable_disk_cache",
+    "disable_memory_cache",
+    "enable_disk_cache",
+    "enable_memory_cache",
+    "get_conversion_cache_key",
+    "get_default_cache_directory",
+    "get_disk_cache",
+    "get_memory_cache",
+)
+
+# NOTE: Increment whenever the pre/post-processing of any conversion backend changes its output
+_PROCESSING_REVISION: "Final[int]" = 1
+
+
+class CacheStatistics(NamedTuple):
+    """Counters describing the usage of a conversion cache, used to size the cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maximum_size: int
+    entries: int
+
+
+class MemoryConversionCache:
+    """Thread-safe, in-process least-recently-used cache, bounded by its size in bytes."""
+
+    @override
+    def __init__(self, maximum_size: int) -> None:
+        if maximum_size < 1:
+            INVALID_MAXIMUM_SIZE_MESSAGE: Final[str] = "'maximum_size' must be at least 1."
+            raise ValueError(INVALID_MAXIMUM_SIZE_MESSAGE)
+
+        self.maximum_size: int = maximum_size
+        self._entries: collections.OrderedDict[str, str] = collections.OrderedDict()
+        self._size: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def _get_entry_size(cls, key: str, value: str) -> int:
+        return sys.getsizeof(key) + sys.getsizeof(value)
+
+    def get(self, key: str) -> str | None:
+        """Retrieve the cached conversion output for the given key, if it exists."""
+        with self._lock:
+            value: str | None = self._entries.get(key)
+
+            if value is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store the given conversion output, evicting the least recently used entries."""
+        entry_size: int = self._get_entry_size(key, value)
+        if entry_size > self.maximum_size:
+            return
+
+        with self._lock:
+            existing_value: str | None = self._entries.pop(key, None)
+            if existing_value is not None:
+                self._size -= self._get_entry_size(key, existing_value)
+
+            self._entries[key] = value
+            self._size += entry_size
+
+            while self._size > self.maximum_size:
+                evicted_key, evicted_value = self._entries.popitem(last=False)
+                self._size -= self._get_entry_size(evicted_key, evicted_value)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove every cached entry, without resetting the usage counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def get_statistics(self) -> CacheStatistics:
+        """Retrieve the current hit, miss & eviction counters and the size of the cache."""
+        with self._lock:
+            return CacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=self._size,
+                maximum_size=self.maximum_size,
+                entries=len(self._entries),
+            )
+
+
+def get_default_cache_directory() -> Path:
+    """Retrieve the platform's conventional user cache directory for this package."""
+    raw_xdg_cache_home: str = os.environ.get("XDG_CACHE_HOME", "").strip()
+    if raw_xdg_cache_home:
+        return Path(raw_xdg_cache_home) / "pydowndoc"
+
+    if sys.platform == "win32":
+        raw_local_app_data: str = os.environ.get("LOCALAPPDATA", "").strip()
+        if raw_local_app_data:
+            return Path(raw_local_app_data) / "pydowndoc" / "Cache"
+
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "pydowndoc"
+
+    return Path.home() / ".cache" / "pydowndoc"
+
+
+class DiskConversionCache:
+    """
+    Persistent content-addressed cache, safe to share between many concurrent processes.
+
+    Each entry is stored compressed within its own file, written by an atomic rename.
+    A small index of entry sizes is maintained under an exclusive file lock,
+    so that the least recently used entries can be evicted
+    once the cache grows beyond its maximum size.
+    """
+
+    @override
+    def __init__(
+        self, directory: Path | None = None, *, maximum_size: int = 512 * 1024 * 1024
+    ) -> None:
+        if maximum_size < 1:
+            INVALID_MAXIMUM_SIZE_MESSAGE: Final[str] = "'maximum_size' must be at least 1."
+            raise ValueError(INVALID_MAXIMUM_SIZE_MESSAGE)
+
+        self.directory: Path = (
+            directory if directory is not None else get_default_cache_directory()
+        )
+        self.maximum_size: int = maximum_size
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._counters_lock: threading.Lock = threading.Lock()
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self.directory / "entries" / key[:2] / f"{key}.zlib"
+
+    @contextlib.contextmanager
+    def _lock(self) -> "Iterator[None]":
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        with (self.directory / ".lock").open("a+b") as lock_file:
+            if sys.platform == "win32":
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _read_index(self) -> dict[str, int]:
+        try:
+            raw_index: object = json.loads((self.directory / "index.json").read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(raw_index, dict):
+            return {}
+
+        return {
+            key: size
+            for key, size in raw_index.items()
+            if isinstance(key, str) and isinstance(size, int)
+        }
+
+    def _write_atomically(self, path: Path, content: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        file_descriptor, raw_temporary_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                temporary_file.write(content)
+            Path(raw_temporary_path).replace(path)
+        except BaseException:
+            Path(raw_temporary_path).unlink(missing_ok=True)
+            raise
+
+    def _get_entry_last_used_time(self, key: str) -> float | None:
+        try:
+            return self._get_entry_path(key).stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def _evict(self, index: dict[str, int]) -> int:
+        entry_ages: dict[str, float] = {}
+        for key in tuple(index):
+            last_used_time: float | None = self._get_entry_last_used_time(key)
+            if last_used_time is None:
+                del index[key]
+            else:
+                entry_ages[key] = last_used_time
+
+        total_size: int = sum(index.values())
+        evictions: int = 0
+
+        for key in sorted(entry_ages, key=entry_ages.__getitem__):
+            if total_size <= self.maximum_size:
+                break
+
+            self._get_entry_path(key).unlink(missing_ok=True)
+            total_size -= index.pop(key)
+            evictions += 1
+
+        return evictions
+
+    def get(self, key: str) -> str | None:
+        """Retrieve the cached conversion output for the given key, if it exists."""
+        entry_path: Path = self._get_entry_path(key)
+
+        try:
+            value: str | None = zlib.decompress(entry_path.read_bytes()).decode()
+        except FileNotFoundError:
+            value = None
+        except (OSError, zlib.error, UnicodeDecodeError):
+            with contextlib.suppress(OSError):
+                entry_path.unlink(missing_ok=True)
+            value = None
+        else:
+            with contextlib.suppress(OSError):
+                os.utime(entry_path)
+
+        with self._counters_lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store the given conversion output, evicting the least recently used entries."""
+        compressed_value: bytes = zlib.compress(value.encode())
+        if len(compressed_value) > self.maximum_size:
+            return
+
+        self._write_atomically(self._get_entry_path(key), compressed_value)
+
+        with self._lock():
+            index: dict[str, int] = self._read_index()
+            index[key] = len(compressed_value)
+
+            evictions: int = (
+                self._evict(index) if sum(index.values()) > self.maximum_size else 0
+            )
+
+            self._write_atomically(self.directory / "index.json", json.dumps(index).encode())
+
+        if evictions:
+            with self._counters_lock:
+                self._evictions += evictions
+
+    def clear(self) -> None:
+        """Remove every cached entry, without resetting the usage counters."""
+        with self._lock():
+            for key in self._read_index():
+                self._get_entry_path(key).unlink(missing_ok=True)
+
+            (self.directory / "index.json").unlink(missing_ok=True)
+
+    def get_statistics(self) -> CacheStatistics:
+        """Retrieve this process's hit, miss & eviction counters and the size of the cache."""
+        with self._lock():
+            index: dict[str, int] = self._read_index()
+
+        with self._counters_lock:
+            return CacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=sum(index.values()),
+                maximum_size=self.maximum_size,
+                entries=len(index),
+            )
+
+
+_memory_cache: MemoryConversionCache | None = None
+_disk_cache: DiskConversionCache | None = None
+
+
+def enable_memory_cache(maximum_size: int = 64 * 1024 * 1024) -> MemoryConversionCache:
+    """
+    Enable the in-process cache of string conversions.
+
+    Arguments:
+        maximum_size: The maximum number of bytes of memory to use for cached entries.
+
+    Returns:
+        The newly enabled cache, which can be used to retrieve its usage statistics.
+    """
+    global _memory_cache  # noqa: PLW0603
+    _memory_cache = MemoryConversionCache(maximum_size)
+    return _memory_cache
+
+
+def disable_memory_cache() -> None:
+    """Disable & discard the in-process cache of string conversions."""
+    global _memory_cache  # noqa: PLW0603
+    _memory_cache = None
+
+
+def get_memory_cache() -> MemoryConversionCache | None:
+    """Retrieve the currently enabled in-process cache of string conversions, if any."""
+    return _memory_cache
+
+
+def enable_disk_cache(
+    directory: Path | None = None, *, maximum_size: int = 512 * 1024 * 1024
+) -> DiskConversionCache:
+    """
+    Enable the persistent, cross-process cache of string & file conversions.
+
+    Arguments:
+        directory: The directory to store cached entries within,
+            defaults to `pydowndoc` within the user's cache directory
+            (E.g. `$XDG_CACHE_HOME/pydowndoc`).
+        maximum_size: The maximum number of bytes of compressed entries to store.
+
+    Returns:
+        The newly enabled cache, which can be used to retrieve its usage statistics.
+    """
+    global _disk_cache  # noqa: PLW0603
+    _disk_cache = DiskConversionCache(directory, maximum_size=maximum_size)
+    return _disk_cache
+
+
+def disable_disk_cache() -> None:
+    """Disable the persistent cache of conversions, without deleting any stored entries."""
+    global _disk_cache  # noqa: PLW0603
+    _disk_cache = None
+
+
+def get_disk_cache() -> DiskConversionCache | None:
+    """Retrieve the currently enabled persistent cache of conversions, if any."""
+    return _disk_cache
+
+
+def _get_caches() -> tuple[MemoryConversionCache | None, DiskConversionCache | None]:
+    """Retrieve the caches in use, preferring those owned by the current `Converter`."""
+    memory_cache: MemoryConversionCache | None = _memory_cache
+    disk_cache: DiskConversionCache | None = _disk_cache
+
+    session: _session_state._SessionState | None = _session_state._current_session.get()  # noqa: SLF001
+    if session is not None:
+        if session.memory_cache is not None:
+            memory_cache = session.memory_cache
+        if session.disk_cache is not None:
+            disk_cache = session.disk_cache
+
+    return memory_cache, disk_cache
+
+
+def _is_caching_enabled() -> bool:
+    return _get_caches() != (None, None)
+
+
+def _get_cached_conversion(key: str) -> str | None:
+    memory_cache, disk_cache = _get_caches()
+
+    if memory_cache is not None:
+        cached_value: str | None = memory_cache.get(key)
+        if cached_value is not None:
+            return cached_value
+
+    if disk_cache is not None:
+        cached_value = disk_cache.get(key)
+        if cached_value is not None and memory_cache is not None:
+            memory_cache.set(key, cached_value)
+        return cached_value
+
+    return None
+
+
+def _cache_conversion(key: str, value: str) -> None:
+    memory_cache, disk_cache = _get_caches()
+
+    if memory_cache is not None:
+        memory_cache.set(key, value)
+
+    if disk_cache is not None:
+        disk_cache.set(key, value)
+
+
+def get_conversion_cache_key(
+    backend: "type[BaseConversionBackend]",
+    asciidoc_content: str,
+    *,
+    attributes: "Mapping[str, str] | None",
+    file_path: Path | None = None,
+) -> str:
+    """
+    Calculate the key identifying the output of a single conversion.
+
+    The key covers a hash of the AsciiDoc content, the conversion backend's ID,
+    the version of the backend's resolved executables, the given AsciiDoc attributes
+    and the revision of this package's pre/post-processing.
+    When converting a file, its resolved location is also included,
+    because relative references within the content are resolved against it,
+    as is the content of every file that it includes or embeds as an image.
+    """
+    dependencies_fingerprint: list[tuple[str, str | None]] | None = (
+        dependencies._get_dependencies_fingerprint(file_path, attributes=attributes)  # noqa: SLF001
+        if file_path is not None
+        else None
+    )
+
+    return hashlib.sha256(
+        json.dumps(
+            (
+                hashlib.sha256(asciidoc_content.encode()).hexdigest(),
+                backend.ID,
+                backend.get_version(),
+                sorted((attributes or {}).items()),
+                _PROCESSING_REVISION,
+                str(file_path.resolve()) if file_path is not None else None,
+                dependencies_fingerprint,
+            ),
+            separators=(",", ":"),
+        ).encode()
+    ).hexdigest()
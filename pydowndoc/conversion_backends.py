@@ -1,12 +1,22 @@
 """Conversion backend classes relating to alternative executable conversion programs."""
 
 import abc
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
 import itertools
+import locale
+import os
 import re
+import secrets
 import shlex
-import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, final, overload
 
@@ -17,10 +27,15 @@ else:
 
 from typed_classproperties import classproperty
 
-from ._utils import OUTPUT_CONVERSION_TO_STRING, ConversionOutputDestinationFlag
+from . import _session_state, caching, executables, sections, tracing, workers
+from ._utils import (
+    OUTPUT_CONVERSION_TO_STRING,
+    ConversionOutputDestinationFlag,
+    FileConversionResult,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping, Sequence
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
     from typing import Final, NoReturn
 
     if sys.version_info >= (3, 11):
@@ -48,11 +63,26 @@ class BaseConversionBackend(abc.ABC):
     def ID(cls) -> "LiteralString":  # noqa: D102, N802
         pass
 
+    @classproperty
+    @abc.abstractmethod
+    def FILE_SUFFIX(cls) -> "LiteralString":  # noqa: D102, N802
+        pass
+
     @classmethod
     @abc.abstractmethod
     def get_version(cls) -> str:
         """Retrieve the version of the executable used by this conversion backend."""
 
+    @classmethod
+    @abc.abstractmethod
+    def _get_executable_names(cls) -> tuple[str, ...]:
+        pass
+
+    @classmethod
+    @abc.abstractmethod
+    def _get_executable_paths(cls) -> tuple[str, ...]:
+        pass
+
     @classmethod
     @abc.abstractmethod
     def _convert_string(
@@ -72,7 +102,135 @@ class BaseConversionBackend(abc.ABC):
             )
             raise ValueError(INVALID_ASCIIDOC_CONTENT_MESSAGE)
 
-        return cls._convert_string(asciidoc_content=asciidoc_content, attributes=attributes)
+        with tracing._trace(  # noqa: SLF001
+            "convert_string",
+            backend_id=cls.ID,
+            attributes=attributes,
+            input_content=asciidoc_content,
+        ) as span:
+            cache_key: str | None = None
+            converted_string: str | None = None
+
+            if caching._is_caching_enabled():  # noqa: SLF001
+                cache_key = caching.get_conversion_cache_key(
+                    cls, asciidoc_content, attributes=attributes
+                )
+                converted_string = caching._get_cached_conversion(cache_key)  # noqa: SLF001
+
+            if converted_string is None:
+                converted_string = cls._convert_string(
+                    asciidoc_content=asciidoc_content, attributes=attributes
+                )
+                if cache_key is not None:
+                    caching._cache_conversion(cache_key, converted_string)  # noqa: SLF001
+
+            span.record_output(converted_string)
+
+        return converted_string
+
+    @classmethod
+    def _convert_strings(
+        cls,
+        asciidoc_contents: "Sequence[str]",
+        *,
+        attributes: "Mapping[str, str] | None",
+        max_workers: int,
+    ) -> list[str]:
+        """Convert each of the given contents separately, within concurrent subprocesses."""
+        if len(asciidoc_contents) == 1:
+            return [cls._convert_string(asciidoc_contents[0], attributes=attributes)]
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(asciidoc_contents)),
+            thread_name_prefix="pydowndoc",
+        ) as executor:
+            pending_conversions: list[concurrent.futures.Future[str]] = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    cls._convert_string,
+                    asciidoc_content,
+                    attributes=attributes,
+                )
+                for asciidoc_content in asciidoc_contents
+            ]
+
+        return [pending_conversion.result() for pending_conversion in pending_conversions]
+
+    @final
+    @classmethod
+    def convert_strings(
+        cls,
+        asciidoc_contents: "Iterable[str]",
+        *,
+        attributes: "Mapping[str, str] | None" = None,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """
+        Convert many AsciiDoc strings, returning each converted output in the given order.
+
+        Identical strings are only converted once.
+        Backends that support it convert many strings within each subprocess,
+        so that each string costs only a small fraction of a process startup.
+        """
+        asciidoc_contents = tuple(asciidoc_contents)
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        if max_workers < 1:
+            INVALID_MAX_WORKERS_MESSAGE: Final[str] = "'max_workers' must be at least 1."
+            raise ValueError(INVALID_MAX_WORKERS_MESSAGE)
+
+        if not all(asciidoc_content.strip() for asciidoc_content in asciidoc_contents):
+            INVALID_ASCIIDOC_CONTENT_MESSAGE: Final[str] = (
+                "Cannot convert empty string content."
+            )
+            raise ValueError(INVALID_ASCIIDOC_CONTENT_MESSAGE)
+
+        with tracing._trace(  # noqa: SLF001
+            "convert_strings", backend_id=cls.ID, attributes=attributes
+        ):
+            unique_asciidoc_contents: tuple[str, ...] = tuple(dict.fromkeys(asciidoc_contents))
+            converted_strings: dict[str, str] = {}
+            cache_keys: dict[str, str] = {}
+
+            if caching._is_caching_enabled():  # noqa: SLF001
+                for asciidoc_content in unique_asciidoc_contents:
+                    cache_keys[asciidoc_content] = caching.get_conversion_cache_key(
+                        cls, asciidoc_content, attributes=attributes
+                    )
+                    cached_string: str | None = caching._get_cached_conversion(  # noqa: SLF001
+                        cache_keys[asciidoc_content]
+                    )
+                    if cached_string is not None:
+                        converted_strings[asciidoc_content] = cached_string
+
+            unconverted_asciidoc_contents: tuple[str, ...] = tuple(
+                asciidoc_content
+                for asciidoc_content in unique_asciidoc_contents
+                if asciidoc_content not in converted_strings
+            )
+
+            if unconverted_asciidoc_contents:
+                converted_strings.update(
+                    zip(
+                        unconverted_asciidoc_contents,
+                        cls._convert_strings(
+                            unconverted_asciidoc_contents,
+                            attributes=attributes,
+                            max_workers=max_workers,
+                        ),
+                        strict=True,
+                    )
+                )
+
+            for asciidoc_content in unconverted_asciidoc_contents:
+                if asciidoc_content in cache_keys:
+                    caching._cache_conversion(  # noqa: SLF001
+                        cache_keys[asciidoc_content], converted_strings[asciidoc_content]
+                    )
+
+        return [converted_strings[asciidoc_content] for asciidoc_content in asciidoc_contents]
 
     @overload
     @classmethod
@@ -152,18 +310,387 @@ class BaseConversionBackend(abc.ABC):
         if not file_path.is_file():
             raise FileNotFoundError(file_path)
 
-        return cls._convert_file(
-            file_path=file_path,
+        with tracing._trace(  # noqa: SLF001
+            "convert_file", backend_id=cls.ID, attributes=attributes
+        ) as span:
+            if postpublish or prepublish or not caching._is_caching_enabled():  # noqa: SLF001
+                converted_file_output: str | None = cls._convert_file(
+                    file_path=file_path,
+                    attributes=attributes,
+                    output_location=output_location,
+                    postpublish=postpublish,
+                    prepublish=prepublish,
+                )
+                span.record_output(converted_file_output)
+                return converted_file_output
+
+            cache_key: str = caching.get_conversion_cache_key(
+                cls, _read_asciidoc_file(file_path), attributes=attributes, file_path=file_path
+            )
+
+            converted_file_content: str | None = caching._get_cached_conversion(cache_key)  # noqa: SLF001
+            if converted_file_content is None:
+                converted_file_content = cls._convert_file(
+                    file_path=file_path,
+                    attributes=attributes,
+                    output_location=OUTPUT_CONVERSION_TO_STRING,
+                )
+                caching._cache_conversion(cache_key, converted_file_content)  # noqa: SLF001
+
+            span.record_output(converted_file_content)
+
+            return cls._output_converted_file(
+                file_path, converted_file_content, output_location=output_location
+            )
+
+    @classmethod
+    @abc.abstractmethod
+    async def _aconvert_string(
+        cls, asciidoc_content: str, *, attributes: "Mapping[str, str] | None" = None
+    ) -> str:
+        pass
+
+    @final
+    @classmethod
+    async def aconvert_string(
+        cls, asciidoc_content: str, *, attributes: "Mapping[str, str] | None" = None
+    ) -> str:
+        """Asynchronously convert AsciiDoc string content to a documentation format."""
+        if not asciidoc_content.strip():
+            INVALID_ASCIIDOC_CONTENT_MESSAGE: Final[str] = (
+                "Cannot convert empty string content."
+            )
+            raise ValueError(INVALID_ASCIIDOC_CONTENT_MESSAGE)
+
+        with tracing._trace(  # noqa: SLF001
+            "aconvert_string",
+            backend_id=cls.ID,
             attributes=attributes,
-            output_location=output_location,
-            postpublish=postpublish,
-            prepublish=prepublish,
+            input_content=asciidoc_content,
+        ) as span:
+            cache_key: str | None = None
+            converted_string: str | None = None
+
+            # NOTE: Computing cache keys can probe executable versions & read dependency files, and the disk cache blocks upon file locks, so neither is run within the event loop
+            if caching._is_caching_enabled():  # noqa: SLF001
+                cache_key, converted_string = await asyncio.to_thread(
+                    cls._lookup_cached_conversion,
+                    asciidoc_content=asciidoc_content,
+                    attributes=attributes,
+                )
+
+            if converted_string is None:
+                converted_string = await cls._aconvert_string(
+                    asciidoc_content=asciidoc_content, attributes=attributes
+                )
+                if cache_key is not None:
+                    await asyncio.to_thread(
+                        caching._cache_conversion,  # noqa: SLF001
+                        cache_key,
+                        converted_string,
+                    )
+
+            span.record_output(converted_string)
+
+        return converted_string
+
+    @overload
+    @classmethod
+    @abc.abstractmethod
+    async def _aconvert_file(
+        cls,
+        file_path: "Path",
+        *,
+        output_location: "ConversionOutputDestinationFlag",
+        attributes: "Mapping[str, str] | None" = ...,
+        postpublish: bool = ...,
+        prepublish: bool = ...,
+    ) -> str: ...
+
+    @overload
+    @classmethod
+    @abc.abstractmethod
+    async def _aconvert_file(
+        cls,
+        file_path: "Path",
+        *,
+        attributes: "Mapping[str, str] | None" = ...,
+        output_location: "Path | None" = ...,
+        postpublish: bool = ...,
+        prepublish: bool = ...,
+    ) -> None: ...
+
+    @classmethod
+    @abc.abstractmethod
+    async def _aconvert_file(
+        cls,
+        file_path: "Path",
+        *,
+        attributes: "Mapping[str, str] | None" = None,
+        output_location: "Path | ConversionOutputDestinationFlag | None" = None,
+        postpublish: bool = False,
+        prepublish: bool = False,
+    ) -> str | None:
+        pass
+
+    @overload
+    @classmethod
+    async def aconvert_file(
+        cls,
+        file_path: "Path",
+        *,
+        output_location: "ConversionOutputDestinationFlag",
+        attributes: "Mapping[str, str] | None" = ...,
+        postpublish: bool = ...,
+        prepublish: bool = ...,
+    ) -> str: ...
+
+    @overload
+    @classmethod
+    async def aconvert_file(
+        cls,
+        file_path: "Path",
+        *,
+        attributes: "Mapping[str, str] | None" = ...,
+        output_location: "Path | None" = ...,
+        postpublish: bool = ...,
+        prepublish: bool = ...,
+    ) -> None: ...
+
+    @final
+    @classmethod
+    async def aconvert_file(
+        cls,
+        file_path: "Path",
+        *,
+        attributes: "Mapping[str, str] | None" = None,
+        output_location: "Path | ConversionOutputDestinationFlag | None" = None,
+        postpublish: bool = False,
+        prepublish: bool = False,
+    ) -> str | None:
+        """Asynchronously convert an AsciiDoc file to a documentation format."""
+        if not file_path.is_file():
+            raise FileNotFoundError(file_path)
+
+        with tracing._trace(  # noqa: SLF001
+            "aconvert_file", backend_id=cls.ID, attributes=attributes
+        ) as span:
+            if postpublish or prepublish or not caching._is_caching_enabled():  # noqa: SLF001
+                converted_file_output: str | None = await cls._aconvert_file(
+                    file_path=file_path,
+                    attributes=attributes,
+                    output_location=output_location,
+                    postpublish=postpublish,
+                    prepublish=prepublish,
+                )
+                span.record_output(converted_file_output)
+                return converted_file_output
+
+            cache_key: str
+            converted_file_content: str | None
+            cache_key, converted_file_content = await asyncio.to_thread(
+                cls._lookup_cached_conversion, file_path=file_path, attributes=attributes
+            )
+            if converted_file_content is None:
+                converted_file_content = await cls._aconvert_file(
+                    file_path=file_path,
+                    attributes=attributes,
+                    output_location=OUTPUT_CONVERSION_TO_STRING,
+                )
+                await asyncio.to_thread(
+                    caching._cache_conversion,  # noqa: SLF001
+                    cache_key,
+                    converted_file_content,
+                )
+
+            span.record_output(converted_file_content)
+
+            return await asyncio.to_thread(
+                cls._output_converted_file,
+                file_path,
+                converted_file_content,
+                output_location=output_location,
+            )
+
+    @classmethod
+    def _lookup_cached_conversion(
+        cls,
+        *,
+        asciidoc_content: str | None = None,
+        file_path: "Path | None" = None,
+        attributes: "Mapping[str, str] | None",
+    ) -> tuple[str, str | None]:
+        """
+        Compute the cache key of a conversion, along with any output cached under it.
+
+        The content of the given file is read when no content is given.
+        """
+        if asciidoc_content is None:
+            if file_path is None:
+                raise TypeError
+
+            asciidoc_content = _read_asciidoc_file(file_path)
+
+        cache_key: str = caching.get_conversion_cache_key(
+            cls, asciidoc_content, attributes=attributes, file_path=file_path
         )
+        return cache_key, caching._get_cached_conversion(cache_key)  # noqa: SLF001
+
+    @classmethod
+    def _output_converted_file(
+        cls,
+        file_path: "Path",
+        converted_file_content: str,
+        *,
+        output_location: "Path | ConversionOutputDestinationFlag | None",
+    ) -> str | None:
+        if output_location is OUTPUT_CONVERSION_TO_STRING:
+            return converted_file_content
+
+        if isinstance(output_location, ConversionOutputDestinationFlag):
+            raise TypeError
+
+        if output_location is None:
+            output_location = file_path.with_suffix(cls.FILE_SUFFIX)
+
+        with tracing._trace("write", input_content=converted_file_content):  # noqa: SLF001
+            output_location.write_text(converted_file_content)
+
+        return None
+
+    @final
+    @classmethod
+    def convert_files(
+        cls,
+        file_paths: "Iterable[Path]",
+        *,
+        attributes: "Mapping[str, str] | None" = None,
+        output_locations: (
+            "Mapping[Path, Path | ConversionOutputDestinationFlag] | None"
+        ) = None,
+        max_workers: int | None = None,
+    ) -> "Iterator[FileConversionResult]":
+        """
+        Convert many AsciiDoc files concurrently, yielding results in completion order.
+
+        A failure to convert any single file is reported within its yielded result,
+        rather than aborting the conversion of the remaining files.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        if max_workers < 1:
+            INVALID_MAX_WORKERS_MESSAGE: Final[str] = "'max_workers' must be at least 1."
+            raise ValueError(INVALID_MAX_WORKERS_MESSAGE)
+
+        if output_locations is None:
+            output_locations = {}
+
+        file_paths_iterator: Iterator[Path] = iter(file_paths)
+        pending_conversions: dict[
+            concurrent.futures.Future[tuple[str | None, float]], Path
+        ] = {}
+        executor: concurrent.futures.ThreadPoolExecutor = (
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="pydowndoc"
+            )
+        )
+
+        # NOTE: More files are only queued once a whole batch of them can be, so that backends which convert files together are given full batches
+        file_batch_size: int = cls._get_file_batch_size()
+        maximum_pending_conversions: int = 2 * max(max_workers, file_batch_size)
+
+        try:
+            while True:
+                if len(pending_conversions) <= maximum_pending_conversions - file_batch_size:
+                    file_batch: tuple[Path, ...] = tuple(
+                        itertools.islice(
+                            file_paths_iterator,
+                            maximum_pending_conversions - len(pending_conversions),
+                        )
+                    )
+
+                    with cls._batch_files(file_batch, attributes=attributes):
+                        for file_path in file_batch:
+                            pending_conversions[
+                                executor.submit(
+                                    contextvars.copy_context().run,
+                                    cls._convert_batched_file,
+                                    file_path,
+                                    attributes=attributes,
+                                    output_location=output_locations.get(file_path),
+                                )
+                            ] = file_path
+
+                if not pending_conversions:
+                    return
+
+                completed_conversions: set[
+                    concurrent.futures.Future[tuple[str | None, float]]
+                ] = concurrent.futures.wait(
+                    pending_conversions, return_when=concurrent.futures.FIRST_COMPLETED
+                ).done
+
+                for completed_conversion in completed_conversions:
+                    file_path = pending_conversions.pop(completed_conversion)
+
+                    try:
+                        output, duration = completed_conversion.result()
+                    except Exception as e:  # noqa: BLE001
+                        yield FileConversionResult(file_path=file_path, error=e)
+                    else:
+                        yield FileConversionResult(
+                            file_path=file_path, output=output, duration=duration
+                        )
+
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @classmethod
+    def _get_file_batch_size(cls) -> int:
+        """Retrieve the number of files that are worth converting together, within a batch."""
+        return 1
+
+    @classmethod
+    @contextlib.contextmanager
+    def _batch_files(
+        cls,
+        file_paths: "Sequence[Path]",  # noqa: ARG003
+        *,
+        attributes: "Mapping[str, str] | None",  # noqa: ARG003
+    ) -> "Iterator[None]":
+        """Prepare to convert the given files together, within the conversions started here."""
+        yield
+
+    @classmethod
+    def _convert_batched_file(
+        cls,
+        file_path: "Path",
+        *,
+        attributes: "Mapping[str, str] | None",
+        output_location: "Path | ConversionOutputDestinationFlag | None",
+    ) -> tuple[str | None, float]:
+        """Convert a single file of a batch, returning its output & the seconds it took."""
+        start_time: float = time.perf_counter()
+
+        output: str | None = None
+        if isinstance(output_location, ConversionOutputDestinationFlag):
+            output = cls.convert_file(
+                file_path, attributes=attributes, output_location=output_location
+            )
+        else:
+            cls.convert_file(file_path, attributes=attributes, output_location=output_location)
+
+        return output, time.perf_counter() - start_time
 
     @classmethod
     def _attributes_to_arguments(
         cls, attributes: "Mapping[str, str] | None"
     ) -> "Iterable[str]":
+        session: _session_state._SessionState | None = _session_state._current_session.get()  # noqa: SLF001
+        if session is not None and attributes is session.attributes:
+            return session.attribute_arguments
+
         if attributes is None:
             attributes = {}
 
@@ -182,6 +709,429 @@ class BaseConversionBackend(abc.ABC):
             raise RuntimeError(CANNOT_INSTANTIATE_OBJECTS_MESSAGE)
 
 
+def _read_asciidoc_file(file_path: "Path") -> str:
+    with tracing._trace("read") as span:  # noqa: SLF001
+        asciidoc_content: str = file_path.read_text()
+        span.record_output(asciidoc_content)
+
+    return asciidoc_content
+
+
+def _encode_subprocess_input(text: str) -> bytes:
+    return text.replace("\n", os.linesep).encode(locale.getpreferredencoding(False))  # noqa: FBT003
+
+
+def _decode_subprocess_output(output: bytes) -> str:
+    return (
+        output.decode(locale.getpreferredencoding(False))  # noqa: FBT003
+        .replace("\r\n", "\n")
+        .replace("\r", "\n")
+    )
+
+
+def _run_subprocess(arguments: "Sequence[str]", *, input_text: str | None) -> str:
+    """Run a subprocess to completion, killing it upon any interruption."""
+    with tracing._trace("spawn"):  # noqa: SLF001
+        process: subprocess.Popen[str] = tracing._ResourceAccountedPopen(  # noqa: SLF001
+            arguments,
+            stdin=(subprocess.PIPE if input_text is not None else subprocess.DEVNULL),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+    return _communicate_with_subprocess(process, arguments, input_text=input_text)
+
+
+def _communicate_with_subprocess(
+    process: "subprocess.Popen[str]", arguments: "Sequence[str]", *, input_text: str | None
+) -> str:
+    with process:
+        try:
+            with tracing._trace("subprocess_wait", input_content=input_text) as span:  # noqa: SLF001
+                stdout, stderr = process.communicate(input_text)
+                span.record_output(stdout)
+                span.record_child_resource_usage(process)
+        except BaseException:
+            process.kill()
+            raise
+
+    if process.returncode:
+        raise subprocess.CalledProcessError(
+            process.returncode, arguments, output=stdout, stderr=stderr
+        )
+
+    return stdout
+
+
+async def _run_async_subprocess(arguments: "Sequence[str]", *, input_text: str | None) -> str:
+    """Run a subprocess without blocking the event loop, killing it upon cancellation."""
+    with tracing._trace("spawn"):  # noqa: SLF001
+        process: asyncio.subprocess.Process = await asyncio.create_subprocess_exec(
+            *arguments,
+            stdin=(
+                asyncio.subprocess.PIPE
+                if input_text is not None
+                else asyncio.subprocess.DEVNULL
+            ),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+    try:
+        with tracing._trace("subprocess_wait", input_content=input_text) as span:  # noqa: SLF001
+            stdout, stderr = await process.communicate(
+                _encode_subprocess_input(input_text) if input_text is not None else None
+            )
+            span.record_output(stdout)
+    except BaseException:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+
+    if process.returncode:
+        raise subprocess.CalledProcessError(
+            process.returncode,
+            arguments,
+            output=_decode_subprocess_output(stdout),
+            stderr=_decode_subprocess_output(stderr),
+        )
+
+    return _decode_subprocess_output(stdout)
+
+
+def _get_pipeline_error(
+    arguments: "tuple[Sequence[str], Sequence[str]]",
+    return_codes: tuple[int, int],
+    stderrs: tuple[str, str],
+) -> subprocess.CalledProcessError | None:
+    """Select the failure of the earliest pipeline stage that was not killed by the other."""
+    first_return_code, second_return_code = return_codes
+
+    # NOTE: A first stage killed by a signal (E.g. SIGPIPE) failed because the second stage exited early
+    if first_return_code and not (second_return_code and first_return_code < 0):
+        return subprocess.CalledProcessError(
+            first_return_code, arguments[0], stderr=stderrs[0]
+        )
+
+    if second_return_code:
+        return subprocess.CalledProcessError(
+            second_return_code, arguments[1], stderr=f"{stderrs[0]}{stderrs[1]}"
+        )
+
+    return None
+
+
+@contextlib.contextmanager
+def _output_on_success(output_location: str | None) -> "Iterator[str | None]":
+    """
+    Yield a temporary output location, to replace the given output file once it succeeds.
+
+    A failed conversion (E.g. because Asciidoctor failed while pandoc was already running)
+    therefore never creates nor overwrites the output file.
+    """
+    if output_location is None or output_location == "-":
+        yield output_location
+        return
+
+    output_path: Path = Path(output_location)
+    # NOTE: The temporary file is left for pandoc to create, so it receives the same permissions as the output file would
+    temporary_output_path: Path = output_path.with_name(
+        f".tmp-{secrets.token_hex(8)}-{output_path.name}"
+    )
+
+    try:
+        yield str(temporary_output_path)
+        temporary_output_path.replace(output_path)
+    finally:
+        temporary_output_path.unlink(missing_ok=True)
+
+
+def _run_subprocess_pipeline(
+    first_arguments: "Sequence[str]",
+    second_arguments: "Sequence[str]",
+    *,
+    input_text: str | None,
+) -> str:
+    """
+    Run two subprocesses concurrently, connecting the first's stdout to the second's stdin.
+
+    The intermediate output is passed directly between the two subprocesses by an OS pipe,
+    so it is never held in memory by this process.
+    """
+    with tracing._trace("spawn"):  # noqa: SLF001
+        read_file_descriptor, write_file_descriptor = os.pipe()
+
+        try:
+            first_process: subprocess.Popen[str] = tracing._ResourceAccountedPopen(  # noqa: SLF001
+                first_arguments,
+                stdin=(subprocess.PIPE if input_text is not None else subprocess.DEVNULL),
+                stdout=write_file_descriptor,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        except BaseException:
+            os.close(read_file_descriptor)
+            raise
+        finally:
+            os.close(write_file_descriptor)
+
+        try:
+            second_process: subprocess.Popen[str] = tracing._ResourceAccountedPopen(  # noqa: SLF001
+                second_arguments,
+                stdin=read_file_descriptor,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        except BaseException:
+            first_process.kill()
+            first_process.communicate()
+            raise
+        finally:
+            os.close(read_file_descriptor)
+
+    with (
+        tracing._trace("subprocess_wait", input_content=input_text) as span,  # noqa: SLF001
+        first_process,
+        second_process,
+    ):
+        first_stderrs: list[str] = []
+        first_process_communicator: threading.Thread = threading.Thread(
+            target=lambda: first_stderrs.append(first_process.communicate(input_text)[1]),
+            name="pydowndoc-pipeline",
+            daemon=True,
+        )
+
+        try:
+            first_process_communicator.start()
+            second_stdout, second_stderr = second_process.communicate()
+            first_process_communicator.join()
+        except BaseException:
+            first_process.kill()
+            second_process.kill()
+            first_process_communicator.join()
+            raise
+
+        span.record_output(second_stdout)
+        span.record_child_resource_usage(first_process, second_process)
+
+    pipeline_error: subprocess.CalledProcessError | None = _get_pipeline_error(
+        (first_arguments, second_arguments),
+        (first_process.returncode, second_process.returncode),
+        ("".join(first_stderrs), second_stderr),
+    )
+    if pipeline_error is not None:
+        raise pipeline_error
+
+    return second_stdout
+
+
+async def _run_async_subprocess_pipeline(
+    first_arguments: "Sequence[str]",
+    second_arguments: "Sequence[str]",
+    *,
+    input_text: str | None,
+) -> str:
+    """Run a two-stage subprocess pipeline without blocking the event loop."""
+    with tracing._trace("spawn"):  # noqa: SLF001
+        read_file_descriptor, write_file_descriptor = os.pipe()
+
+        try:
+            first_process: asyncio.subprocess.Process = await asyncio.create_subprocess_exec(
+                *first_arguments,
+                stdin=(
+                    asyncio.subprocess.PIPE
+                    if input_text is not None
+                    else asyncio.subprocess.DEVNULL
+                ),
+                stdout=write_file_descriptor,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except BaseException:
+            os.close(read_file_descriptor)
+            raise
+        finally:
+            os.close(write_file_descriptor)
+
+        try:
+            second_process: asyncio.subprocess.Process = await asyncio.create_subprocess_exec(
+                *second_arguments,
+                stdin=read_file_descriptor,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except BaseException:
+            first_process.kill()
+            await first_process.wait()
+            raise
+        finally:
+            os.close(read_file_descriptor)
+
+    try:
+        with tracing._trace("subprocess_wait", input_content=input_text) as span:  # noqa: SLF001
+            (_, first_stderr), (second_stdout, second_stderr) = await asyncio.gather(
+                first_process.communicate(
+                    _encode_subprocess_input(input_text) if input_text is not None else None
+                ),
+                second_process.communicate(),
+            )
+            span.record_output(second_stdout)
+    except BaseException:
+        for process in (first_process, second_process):
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+        raise
+
+    pipeline_error: subprocess.CalledProcessError | None = _get_pipeline_error(
+        (first_arguments, second_arguments),
+        (first_process.returncode or 0, second_process.returncode or 0),
+        (_decode_subprocess_output(first_stderr), _decode_subprocess_output(second_stderr)),
+    )
+    if pipeline_error is not None:
+        raise pipeline_error
+
+    return _decode_subprocess_output(second_stdout)
+
+
+_SOURCE_BLOCK_PATTERN: "Final[re.Pattern[str]]" = re.compile(
+    r"(?<=\n\[source)([^]\n]*]\n)(.+)(?=\n)"
+)
+_SOURCE_BLOCK_DELIMITER_PATTERN: "Final[re.Pattern[str]]" = re.compile(
+    r"\A(?:-{2,}|_{2,}|={2,}|\.{3,})(?=\n|\Z)"
+)
+_PRE_PROCESSING_STRONG_PATTERN: "Final[re.Pattern[str]]" = re.compile(
+    r"(\*{2})([^*\n]+)\1(?=[A-Za-z0-9])"
+)
+_SUMMARY_TITLE_EMPHASIS_PATTERN: "Final[re.Pattern[str]]" = re.compile(r"_(.*?)_")
+_SUMMARY_TITLE_STRONG_PATTERN: "Final[re.Pattern[str]]" = re.compile(r"\*(.*?)\*")
+_ADMONITION_PATTERN: "Final[re.Pattern[str]]" = re.compile(
+    r"(?:\A|(?<=[^>]\s))\*\*(?=[^\w\s!\"^*()_+='@#~;:.><,`-]\s*(?:TIP|NOTE|HINT|WARNING|INFO|INFORMATION|HAZARD|CAUTION|IMPORTANT)\s*(?::\s*)?\*\*\\\n)"
+)
+_PASSTHROUGH_LINK_PATTERN: "Final[re.Pattern[str]]" = re.compile(
+    r"\[([^[]+)]\(\s*pass\s*:\s*[a-z]+\)\s*\[([^[]+)]"
+)
+_DOUBLE_STRONG_PATTERN: "Final[re.Pattern[str]]" = re.compile(
+    r"(\*{4})([^*\n]+)\1(?=[A-Za-z0-9])"
+)
+
+
+def _replace_source_block(match: "re.Match[str]") -> str:
+    if _SOURCE_BLOCK_DELIMITER_PATTERN.search(match.group(2)):
+        return match.group()
+
+    return f"{match.group(1)}----\n{match.group(2)}\n----"
+
+
+def _replace_summary_title_code_spans(summary_title: str) -> str:
+    # NOTE: The next "+`" delimiter is remembered between code spans, because searching for it again from every opening backtick would take quadratic time
+    replaced_pieces: list[str] = []
+    position: int = 0
+    next_plus_delimiter: int = -1
+
+    while True:
+        opening: int = summary_title.find("`", position)
+        if opening == -1:
+            break
+
+        if summary_title.startswith("+", opening + 1):
+            if next_plus_delimiter < opening + 2:
+                next_plus_delimiter = summary_title.find("+`", opening + 2)
+                if next_plus_delimiter == -1:
+                    next_plus_delimiter = len(summary_title)
+
+            if next_plus_delimiter < len(summary_title):
+                replaced_pieces.append(summary_title[position:opening])
+                replaced_pieces.append(
+                    f"<code>{summary_title[opening + 2 : next_plus_delimiter]}</code>"
+                )
+                position = next_plus_delimiter + 2
+                continue
+
+        closing: int = summary_title.find("`", opening + 1)
+        if closing == -1:
+            break
+
+        replaced_pieces.append(summary_title[position:opening])
+        replaced_pieces.append(f"<code>{summary_title[opening + 1 : closing]}</code>")
+        position = closing + 1
+
+    replaced_pieces.append(summary_title[position:])
+    return "".join(replaced_pieces)
+
+
+def _replace_summary_title(summary_title: str) -> str:
+    replaced_summary_title: str = _SUMMARY_TITLE_EMPHASIS_PATTERN.sub(
+        r"<em>\1</em>", _replace_summary_title_code_spans(summary_title)
+    )
+    return _SUMMARY_TITLE_STRONG_PATTERN.sub(r"<strong>\1</strong>", replaced_summary_title)
+
+
+def _replace_summary_titles(converted_readme: str) -> str:
+    # NOTE: Both the next closing tag & the next line ending are remembered between summary elements, so that every search only ever moves forwards through the text, even when it contains many unclosed summary elements
+    replaced_pieces: list[str] = []
+    position: int = 0
+    search_position: int = 0
+    next_closing: int = -1
+    next_line_ending: int = -1
+
+    while True:
+        opening: int = converted_readme.find("<summary>", search_position)
+        if opening == -1:
+            break
+
+        title_start: int = opening + len("<summary>")
+
+        if next_closing < title_start:
+            next_closing = converted_readme.find("</summary>", title_start)
+            if next_closing == -1:
+                break
+
+        if next_line_ending < title_start:
+            next_line_ending = converted_readme.find("\n", title_start)
+            if next_line_ending == -1:
+                next_line_ending = len(converted_readme)
+
+        if next_line_ending < next_closing:
+            search_position = next_line_ending
+            continue
+
+        if next_closing == title_start:
+            # NOTE: An empty title is immediately followed by a second, non-empty title that extends up to the next closing tag on the same line, to match how regular-expression substitution treats empty matches
+            next_closing = converted_readme.find("</summary>", title_start + 1)
+            if next_closing == -1 or next_line_ending < next_closing:
+                search_position = title_start
+                continue
+
+        replaced_pieces.append(converted_readme[position:title_start])
+        replaced_pieces.append(
+            _replace_summary_title(converted_readme[title_start:next_closing])
+        )
+        position = next_closing
+        search_position = next_closing - len("<summary>")
+
+    replaced_pieces.append(converted_readme[position:])
+    return "".join(replaced_pieces)
+
+
+# NOTE: downdoc's startup time dominates the conversion of short contents, so a batch of this many contents takes about as long to convert as a single content
+_DOWNDOC_MINIMUM_BATCH_SIZE: "Final[int]" = 32
+
+# NOTE: Attribute entries, titles, preprocessor directives & footnotes affect the conversion of any following content, cross-references are resolved against the anchors & sections of the whole input, and sidebar or source blocks at either end of the content are only pre-processed when they are not at an end of the whole input
+_UNBATCHABLE_CONTENT_PATTERN: "Final[re.Pattern[str]]" = re.compile(
+    r"^(?::!?\w[\w-]*!?:|(?:={1,6}|#{1,6})[ \t]|(?:ifn?def|ifeval|endif|include)::)"
+    r"|footnote:|<<|xref:|anchor:|\[\[|\[#"
+    r"|\A(?:\[source|\*{4}$)|^\*{4}\Z|^\[source[^\n]*\n.*\Z",
+    re.MULTILINE,
+)
+_BLOCK_DELIMITER_PATTERN: "Final[re.Pattern[str]]" = re.compile(
+    r"^(?P<delimiter>--|([-.=*_+/])\2{3,}|[|,:!]={3,}|`{3})(?:(?<=`)[^`\n]*)?[ \t]*$",
+    re.MULTILINE,
+)
+
+
 class DowndocMarkdownConversionBackend(BaseConversionBackend):
     """Backend to convert AsciiDoc content to Markdown using downdoc."""
 
@@ -191,12 +1141,13 @@ class DowndocMarkdownConversionBackend(BaseConversionBackend):
         return "downdoc-md"
 
     @classproperty
-    def FILE_SUFFIX(cls) -> "LiteralString":  # noqa: D102, N802
+    @override
+    def FILE_SUFFIX(cls) -> "LiteralString":
         return ".md"
 
     @classmethod
     def _get_downdoc_executable_path(cls) -> str:
-        downdoc_executable: str | None = shutil.which("downdoc")
+        downdoc_executable: str | None = executables.get_executable_path("downdoc")
 
         if downdoc_executable is None:
             DOWNDOC_NOT_INSTALLED_MESSAGE: Final[str] = (
@@ -207,98 +1158,396 @@ class DowndocMarkdownConversionBackend(BaseConversionBackend):
 
         return downdoc_executable
 
+    @classmethod
+    @override
+    def _get_executable_names(cls) -> tuple[str, ...]:
+        return ("downdoc",)
+
+    @classmethod
+    @override
+    def _get_executable_paths(cls) -> tuple[str, ...]:
+        return (cls._get_downdoc_executable_path(),)
+
     @classmethod
     def _pre_process(cls, readme_content: str) -> str:
-        readme_content = readme_content.replace("\n****\n", "\n____\n")
-        readme_content = re.sub(
-            r"(?<=\n\[source)([^]\n]*]\n)(.+)(?=\n)",
-            (
-                lambda match: (
-                    match.group()
-                    if (
-                        re.search(r"\A(?:-{2,}|_{2,}|={2,}|\.{3,})(?=\n|\Z)", match.group(2))
-                        is not None
+        with tracing._trace("pre_process", input_content=readme_content) as span:  # noqa: SLF001
+            # NOTE: Each rewrite is skipped when its pattern cannot match, to avoid copying the whole content
+            processed_readme_content: str = readme_content.replace("\n****\n", "\n____\n")
+            if "\n[source" in processed_readme_content:
+                processed_readme_content = _SOURCE_BLOCK_PATTERN.sub(
+                    _replace_source_block, processed_readme_content
+                )
+            if "**" in processed_readme_content:
+                processed_readme_content = _PRE_PROCESSING_STRONG_PATTERN.sub(
+                    r"***\2***", processed_readme_content
+                )
+            span.record_output(processed_readme_content)
+
+        return processed_readme_content
+
+    @classmethod
+    def _post_process(cls, converted_readme: str) -> str:
+        with tracing._trace("post_process", input_content=converted_readme) as span:  # noqa: SLF001
+            # NOTE: Each rewrite is skipped when its pattern cannot match, to avoid copying the whole content
+            processed_converted_readme: str = _replace_summary_titles(converted_readme)
+            if "**\\\n" in processed_converted_readme:
+                processed_converted_readme = _ADMONITION_PATTERN.sub(
+                    "> **", processed_converted_readme
+                )
+            if "pass" in processed_converted_readme:
+                processed_converted_readme = _PASSTHROUGH_LINK_PATTERN.sub(
+                    r"[\2](\1)", processed_converted_readme
+                )
+            if "****" in processed_converted_readme:
+                processed_converted_readme = _DOUBLE_STRONG_PATTERN.sub(
+                    r"**\2**", processed_converted_readme
+                )
+            span.record_output(processed_converted_readme)
+
+        return processed_converted_readme
+
+    @classmethod
+    @override
+    def get_version(cls) -> str:
+        downdoc_version: str
+        (downdoc_version,) = executables._probe_executables(  # noqa: SLF001
+            (cls._get_downdoc_executable_path(), "--version")
+        )
+        return downdoc_version
+
+    @classmethod
+    def _get_conversion_arguments(
+        cls,
+        attributes: "Mapping[str, str] | None",
+        *,
+        postpublish: bool = False,
+        prepublish: bool = False,
+    ) -> tuple[str, ...]:
+        optional_arguments: list[str] = []
+
+        if postpublish:
+            optional_arguments.append("--postpublish")
+        if prepublish:
+            optional_arguments.append("--prepublish")
+
+        return (
+            cls._get_downdoc_executable_path(),
+            *cls._attributes_to_arguments(attributes),
+            "--output",
+            "-",
+            *optional_arguments,
+            "--",
+            "-",
+        )
+
+    @classmethod
+    def _run_downdoc(cls, arguments: "Sequence[str]", *, input_text: str) -> str:
+        downdoc_process_pool: workers._PrespawnedProcessPool | None = (
+            workers._get_downdoc_process_pool()  # noqa: SLF001
+        )
+
+        if downdoc_process_pool is None:
+            return _run_subprocess(arguments, input_text=input_text)
+
+        with tracing._trace("spawn"):  # noqa: SLF001
+            process: subprocess.Popen[str] = downdoc_process_pool.acquire(arguments)
+
+        return _communicate_with_subprocess(process, arguments, input_text=input_text)
+
+    @classmethod
+    def _split_content(cls, asciidoc_content: str, *, allow_splitting: bool) -> list[str]:
+        chunks: list[str] | None = (
+            sections._split_large_document(asciidoc_content)  # noqa: SLF001
+            if allow_splitting
+            else None
+        )
+
+        return chunks if chunks is not None else [asciidoc_content]
+
+    @classmethod
+    def _join_converted_chunks(
+        cls, converted_chunks: "Sequence[str]", *, ends_with_newline: bool
+    ) -> str:
+        if not ends_with_newline:
+            converted_chunks = (
+                *converted_chunks[:-1],
+                converted_chunks[-1].removesuffix("\n"),
+            )
+
+        return "\n".join(
+            cls._post_process(converted_chunk) for converted_chunk in converted_chunks
+        )
+
+    @classmethod
+    def _convert_chunks(cls, chunks: "Sequence[str]", arguments: "Sequence[str]") -> list[str]:
+        """Convert each chunk within its own concurrent subprocess, without post-processing."""
+        if len(chunks) == 1:
+            return [cls._run_downdoc(arguments, input_text=cls._pre_process(chunks[0]))]
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(chunks), thread_name_prefix="pydowndoc"
+        ) as executor:
+            pending_conversions: list[concurrent.futures.Future[str]] = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    cls._run_downdoc,
+                    arguments,
+                    input_text=cls._pre_process(chunk),
+                )
+                for chunk in chunks
+            ]
+
+        return [pending_conversion.result() for pending_conversion in pending_conversions]
+
+    @classmethod
+    def _convert_content(
+        cls,
+        asciidoc_content: str,
+        arguments: "Sequence[str]",
+        *,
+        ends_with_newline: bool,
+        allow_splitting: bool = True,
+    ) -> str:
+        return cls._join_converted_chunks(
+            cls._convert_chunks(
+                cls._split_content(asciidoc_content, allow_splitting=allow_splitting),
+                arguments,
+            ),
+            ends_with_newline=ends_with_newline,
+        )
+
+    @classmethod
+    async def _aconvert_content(
+        cls,
+        asciidoc_content: str,
+        arguments: "Sequence[str]",
+        *,
+        ends_with_newline: bool,
+        allow_splitting: bool = True,
+    ) -> str:
+        return cls._join_converted_chunks(
+            await asyncio.gather(
+                *(
+                    _run_async_subprocess(arguments, input_text=cls._pre_process(chunk))
+                    for chunk in cls._split_content(
+                        asciidoc_content, allow_splitting=allow_splitting
                     )
-                    else f"{match.group(1)}----\n{match.group(2)}\n----"
                 )
             ),
-            readme_content,
+            ends_with_newline=ends_with_newline,
+        )
+
+    @classmethod
+    def _is_batchable(cls, asciidoc_content: str) -> bool:
+        """Return whether the content converts identically when surrounded by other content."""
+        if _UNBATCHABLE_CONTENT_PATTERN.search(asciidoc_content) is not None:
+            return False
+
+        # NOTE: downdoc removes the whitespace at the end of its whole input, which would be kept at the end of a content within a batch
+        if asciidoc_content.rstrip() != asciidoc_content.rstrip("\n"):
+            return False
+
+        # NOTE: A delimited block left open by one content would swallow the contents following it, which can also stop downdoc from ever completing
+        return all(
+            delimiter_count % 2 == 0
+            for delimiter_count in collections.Counter(
+                delimiter.group("delimiter")
+                for delimiter in _BLOCK_DELIMITER_PATTERN.finditer(asciidoc_content)
+            ).values()
         )
-        readme_content = re.sub(
-            r"(\*{2})([^*\n]+)\1(?=[A-Za-z0-9])", r"***\2***", readme_content
+
+    @classmethod
+    def _convert_batch(
+        cls, asciidoc_contents: "Sequence[str]", arguments: "Sequence[str]"
+    ) -> list[str]:
+        """
+        Convert many contents within a single subprocess, returning each content's output.
+
+        Contents are separated by uniquely titled section headings,
+        at which the pre-processed, converted & post-processed output is split.
+        If the output cannot be split (E.g. because a content left a delimited block open)
+        or the conversion fails, each half of the batch is converted separately instead,
+        so only the contents that cannot be batched are converted on their own.
+        """
+        if len(asciidoc_contents) == 1:
+            return [
+                cls._convert_content(
+                    asciidoc_contents[0],
+                    arguments,
+                    ends_with_newline=asciidoc_contents[0].endswith("\n"),
+                )
+            ]
+
+        boundary_title: str = f"PydowndocContentBoundary{secrets.token_hex(16)}"
+
+        with contextlib.suppress(subprocess.CalledProcessError):
+            converted_contents: list[str] = cls._post_process(
+                cls._run_downdoc(
+                    arguments,
+                    input_text=cls._pre_process(
+                        f"\n== {boundary_title}\n\n".join(
+                            asciidoc_content
+                            if asciidoc_content.endswith("\n")
+                            else f"{asciidoc_content}\n"
+                            for asciidoc_content in asciidoc_contents
+                        )
+                    ),
+                )
+            ).split(f"\n## {boundary_title}\n\n")
+
+            if len(converted_contents) == len(asciidoc_contents):
+                return [
+                    converted_content
+                    if asciidoc_content.endswith("\n")
+                    else converted_content.removesuffix("\n")
+                    for asciidoc_content, converted_content in zip(
+                        asciidoc_contents, converted_contents, strict=True
+                    )
+                ]
+
+        middle_index: int = len(asciidoc_contents) // 2
+        return [
+            *cls._convert_batch(asciidoc_contents[:middle_index], arguments),
+            *cls._convert_batch(asciidoc_contents[middle_index:], arguments),
+        ]
+
+    @classmethod
+    @override
+    def _convert_strings(
+        cls,
+        asciidoc_contents: "Sequence[str]",
+        *,
+        attributes: "Mapping[str, str] | None",
+        max_workers: int,
+    ) -> list[str]:
+        arguments: tuple[str, ...] = cls._get_conversion_arguments(attributes)
+
+        batchable_indices: list[int] = [
+            index
+            for index, asciidoc_content in enumerate(asciidoc_contents)
+            if cls._is_batchable(asciidoc_content)
+        ]
+        batch_count: int = min(
+            max_workers, -(-len(batchable_indices) // _DOWNDOC_MINIMUM_BATCH_SIZE)
         )
-        return readme_content  # noqa: RET504
+        index_groups: list[Sequence[int]] = [
+            *(
+                batchable_indices[
+                    (batch_index * len(batchable_indices)) // batch_count : (
+                        ((batch_index + 1) * len(batchable_indices)) // batch_count
+                    )
+                ]
+                for batch_index in range(batch_count)
+            ),
+            *(
+                (index,)
+                for index, asciidoc_content in enumerate(asciidoc_contents)
+                if not cls._is_batchable(asciidoc_content)
+            ),
+        ]
+
+        converted_index_groups: list[list[str]]
+        if len(index_groups) == 1:
+            converted_index_groups = [cls._convert_batch(asciidoc_contents, arguments)]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(max_workers, len(index_groups)), thread_name_prefix="pydowndoc"
+            ) as executor:
+                pending_conversions: list[concurrent.futures.Future[list[str]]] = [
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        cls._convert_batch,
+                        [asciidoc_contents[index] for index in index_group],
+                        arguments,
+                    )
+                    for index_group in index_groups
+                ]
+
+            converted_index_groups = [
+                pending_conversion.result() for pending_conversion in pending_conversions
+            ]
+
+        converted_contents: dict[int, str] = {}
+        for index_group, converted_index_group in zip(
+            index_groups, converted_index_groups, strict=True
+        ):
+            converted_contents.update(zip(index_group, converted_index_group, strict=True))
+
+        return [converted_contents[index] for index in range(len(asciidoc_contents))]
 
     @classmethod
-    def _replace_summary_title(cls, match: re.Match[str]) -> str:
-        replaced_summary_title: str = re.sub(
-            r"`(\+?)(.*?)\1`", r"<code>\2</code>", match.group()
-        )
-        replaced_summary_title = re.sub(r"_(.*?)_", r"<em>\1</em>", replaced_summary_title)
-        replaced_summary_title = re.sub(
-            r"\*(.*?)\*", r"<strong>\1</strong>", replaced_summary_title
+    @override
+    def _convert_string(
+        cls, asciidoc_content: str, *, attributes: "Mapping[str, str] | None" = None
+    ) -> str:
+        return cls._convert_content(
+            asciidoc_content,
+            cls._get_conversion_arguments(attributes),
+            ends_with_newline=asciidoc_content.endswith("\n"),
         )
-        return replaced_summary_title  # noqa: RET504
 
     @classmethod
-    def _post_process(cls, converted_readme: str) -> str:
-        post_processed_readme: str = re.sub(
-            r"(?<=<summary>).*?(?=</summary>)", cls._replace_summary_title, converted_readme
-        )
-        post_processed_readme = re.sub(
-            r"([^>]\s+|\A)(\*\*)(?=[^\w\s!\"^*()_+='@#~;:.><,`-]\s*(?:TIP|NOTE|HINT|WARNING|INFO|INFORMATION|HAZARD|CAUTION|IMPORTANT)\s*:?\s*\*\*\\\n)",
-            r"\1> \2",
-            post_processed_readme,
-        )
-        post_processed_readme = re.sub(
-            r"\[([^[]+)]\(\s*pass\s*:\s*[a-z]+\)\s*\[([^[]+)]",
-            r"[\2](\1)",
-            post_processed_readme,
-        )
-        post_processed_readme = re.sub(
-            r"(\*{4})([^*\n]+)\1(?=[A-Za-z0-9])", r"**\2**", post_processed_readme
+    @override
+    async def _aconvert_string(
+        cls, asciidoc_content: str, *, attributes: "Mapping[str, str] | None" = None
+    ) -> str:
+        return await cls._aconvert_content(
+            asciidoc_content,
+            cls._get_conversion_arguments(attributes),
+            ends_with_newline=asciidoc_content.endswith("\n"),
         )
-        return post_processed_readme  # noqa: RET504
 
+    @overload
     @classmethod
-    @override
-    def get_version(cls) -> str:
-        return subprocess.run(
-            (cls._get_downdoc_executable_path(), "--version"),
-            check=True,
-            text=True,
-            capture_output=True,
-        ).stdout.strip()
+    def _convert_file(
+        cls,
+        file_path: "Path",
+        *,
+        output_location: "ConversionOutputDestinationFlag",
+        attributes: "Mapping[str, str] | None" = ...,
+        postpublish: bool = ...,
+        prepublish: bool = ...,
+    ) -> str: ...
+
+    @overload
+    @classmethod
+    def _convert_file(
+        cls,
+        file_path: "Path",
+        *,
+        attributes: "Mapping[str, str] | None" = ...,
+        output_location: "Path | None" = ...,
+        postpublish: bool = ...,
+        prepublish: bool = ...,
+    ) -> None: ...
 
     @classmethod
     @override
-    def _convert_string(
-        cls, asciidoc_content: str, *, attributes: "Mapping[str, str] | None" = None
-    ) -> str:
-        ends_with_newline: bool = asciidoc_content.endswith("\n")
-
-        converted_string: str = subprocess.run(
-            (
-                cls._get_downdoc_executable_path(),
-                *cls._attributes_to_arguments(attributes),
-                "--output",
-                "-",
-                "--",
-                "-",
+    def _convert_file(
+        cls,
+        file_path: "Path",
+        *,
+        attributes: "Mapping[str, str] | None" = None,
+        output_location: "Path | ConversionOutputDestinationFlag | None" = None,
+        postpublish: bool = False,
+        prepublish: bool = False,
+    ) -> str | None:
+        converted_readme_content: str = cls._convert_content(
+            _read_asciidoc_file(file_path),
+            cls._get_conversion_arguments(
+                attributes, postpublish=postpublish, prepublish=prepublish
             ),
-            check=True,
-            input=cls._pre_process(asciidoc_content),
-            text=True,
-            capture_output=True,
-        ).stdout
+            ends_with_newline=True,
+            allow_splitting=not (postpublish or prepublish),
+        )
 
-        return cls._post_process(
-            converted_string if ends_with_newline else converted_string.removesuffix("\n")
+        return cls._output_converted_file(
+            file_path, converted_readme_content, output_location=output_location
         )
 
     @overload
     @classmethod
-    def _convert_file(
+    async def _aconvert_file(
         cls,
         file_path: "Path",
         *,
@@ -310,7 +1559,7 @@ class DowndocMarkdownConversionBackend(BaseConversionBackend):
 
     @overload
     @classmethod
-    def _convert_file(
+    async def _aconvert_file(
         cls,
         file_path: "Path",
         *,
@@ -322,7 +1571,7 @@ class DowndocMarkdownConversionBackend(BaseConversionBackend):
 
     @classmethod
     @override
-    def _convert_file(
+    async def _aconvert_file(
         cls,
         file_path: "Path",
         *,
@@ -331,43 +1580,58 @@ class DowndocMarkdownConversionBackend(BaseConversionBackend):
         postpublish: bool = False,
         prepublish: bool = False,
     ) -> str | None:
-        optional_arguments: list[str] = []
+        converted_readme_content: str = await cls._aconvert_content(
+            _read_asciidoc_file(file_path),
+            cls._get_conversion_arguments(
+                attributes, postpublish=postpublish, prepublish=prepublish
+            ),
+            ends_with_newline=True,
+            allow_splitting=not (postpublish or prepublish),
+        )
 
-        if postpublish:
-            optional_arguments.extend("--postpublish")
-        if prepublish:
-            optional_arguments.extend("--prepublish")
-
-        converted_readme_content: str = cls._post_process(
-            subprocess.run(
-                (
-                    cls._get_downdoc_executable_path(),
-                    *cls._attributes_to_arguments(attributes),
-                    "--output",
-                    "-",
-                    *optional_arguments,
-                    "--",
-                    "-",
-                ),
-                check=True,
-                text=True,
-                capture_output=True,
-                input=cls._pre_process(file_path.read_text()),
-            ).stdout
+        return cls._output_converted_file(
+            file_path, converted_readme_content, output_location=output_location
         )
 
-        if output_location is OUTPUT_CONVERSION_TO_STRING:
-            return converted_readme_content
 
-        if isinstance(output_location, ConversionOutputDestinationFlag):
-            raise TypeError
+# NOTE: Large enough for Ruby's startup time to become negligible, while still producing output for the first files soon after a batch conversion starts
+_ASCIIDOCTOR_BATCH_SIZE: "Final[int]" = 32
 
-        if output_location is None:
-            output_location = file_path.with_suffix(cls.FILE_SUFFIX)
+# NOTE: Asciidoctor sets the "outdir" & "outfile" attributes when writing into a destination directory, but not when writing to stdout
+_OUTPUT_LOCATION_ATTRIBUTE_PATTERN: "Final[re.Pattern[str]]" = re.compile(r"out(?:dir|file)")
 
-        output_location.write_text(converted_readme_content)
 
-        return None
+class _DocBookBatch:
+    """The DocBook output of many AsciiDoc files, converted by a single Asciidoctor run."""
+
+    @override
+    def __init__(
+        self,
+        backend: "type[_BasePandocConversionBackend]",
+        file_paths: "Sequence[Path]",
+        *,
+        attributes: "Mapping[str, str] | None",
+    ) -> None:
+        self.backend: type[_BasePandocConversionBackend] = backend
+        self.file_paths: Sequence[Path] = file_paths
+        self.attributes: Mapping[str, str] | None = attributes
+        self._docbook_contents: dict[Path, str] | None = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def pop_docbook_content(self, file_path: "Path") -> str | None:
+        """Remove & return the DocBook output of the given file, converting the batch first."""
+        with self._lock:
+            if self._docbook_contents is None:
+                self._docbook_contents = self.backend._run_batched_asciidoctor(  # noqa: SLF001
+                    self.file_paths, attributes=self.attributes
+                )
+
+            return self._docbook_contents.pop(file_path, None)
+
+
+_docbook_batches: "contextvars.ContextVar[Mapping[Path, _DocBookBatch] | None]" = (
+    contextvars.ContextVar("pydowndoc_docbook_batches", default=None)
+)
 
 
 class _BasePandocConversionBackend(BaseConversionBackend, abc.ABC):
@@ -376,14 +1640,9 @@ class _BasePandocConversionBackend(BaseConversionBackend, abc.ABC):
     def PANDOC_ID(cls) -> "LiteralString":  # noqa: N802
         pass
 
-    @classproperty
-    @abc.abstractmethod
-    def FILE_SUFFIX(cls) -> "LiteralString":  # noqa: N802
-        pass
-
     @classmethod
     def _get_asciidoctor_executable_path(cls) -> str:
-        asciidoctor_executable: str | None = shutil.which("asciidoctor")
+        asciidoctor_executable: str | None = executables.get_executable_path("asciidoctor")
 
         if asciidoctor_executable is None:
             ASCIIDOCTOR_NOT_INSTALLED_MESSAGE: Final[str] = (
@@ -396,7 +1655,7 @@ class _BasePandocConversionBackend(BaseConversionBackend, abc.ABC):
 
     @classmethod
     def _get_pandoc_executable_path(cls) -> str:
-        pandoc_executable: str | None = shutil.which("pandoc")
+        pandoc_executable: str | None = executables.get_executable_path("pandoc")
 
         if pandoc_executable is None:
             PANDOC_NOT_INSTALLED_MESSAGE: Final[str] = (
@@ -407,67 +1666,373 @@ class _BasePandocConversionBackend(BaseConversionBackend, abc.ABC):
 
         return pandoc_executable
 
+    @classmethod
+    @override
+    def _get_executable_names(cls) -> tuple[str, ...]:
+        return ("asciidoctor", "pandoc")
+
+    @classmethod
+    @override
+    def _get_executable_paths(cls) -> tuple[str, ...]:
+        return (cls._get_asciidoctor_executable_path(), cls._get_pandoc_executable_path())
+
     @classmethod
     @override
     def get_version(cls) -> str:
-        # NOTE: Intermediary variables are used to prevent 'Unterminated f-string literal' errors in older Python versions
-        asciidoctor_version: str = subprocess.run(
-            (cls._get_asciidoctor_executable_path(), "--version"),
-            check=True,
-            text=True,
-            capture_output=True,
-        ).stdout.strip()
+        return "\n".join(
+            executables._probe_executables(  # noqa: SLF001
+                (cls._get_asciidoctor_executable_path(), "--version"),
+                (cls._get_pandoc_executable_path(), "--version"),
+            )
+        )
 
-        pandoc_version: str = subprocess.run(
-            (cls._get_pandoc_executable_path(), "--version"),
-            check=True,
-            text=True,
-            capture_output=True,
-        ).stdout.strip()
+    @classmethod
+    def _get_asciidoctor_arguments(
+        cls,
+        attributes: "Mapping[str, str] | None",
+        *,
+        input_locations: "Sequence[str]",
+        output_arguments: "Sequence[str]" = ("--out-file", "-"),
+    ) -> tuple[str, ...]:
+        return (
+            cls._get_asciidoctor_executable_path(),
+            *cls._attributes_to_arguments(attributes),
+            *output_arguments,
+            "--backend",
+            "docbook5",
+            "--warnings",
+            "--failure-level",
+            "WARNING",
+            "--",
+            *input_locations,
+        )
+
+    @classmethod
+    def _check_pandoc_writer_is_available(cls, pandoc_executable: str) -> None:
+        try:
+            raw_output_formats: str
+            (raw_output_formats,) = executables._probe_executables(  # noqa: SLF001
+                (pandoc_executable, "--list-output-formats")
+            )
+        except subprocess.CalledProcessError:
+            # NOTE: Versions of pandoc older than 1.18 cannot list their output formats, so they are assumed to support every format
+            return
+
+        if cls.PANDOC_ID not in raw_output_formats.split():
+            PANDOC_WRITER_NOT_AVAILABLE_MESSAGE: Final[str] = (
+                f"The installed pandoc executable cannot output the {cls.PANDOC_ID!r} format. "
+                "Ensure a newer version is installed (https://pandoc.org/installing.html)."
+            )
+            raise OSError(PANDOC_WRITER_NOT_AVAILABLE_MESSAGE)
+
+    @classmethod
+    def _get_pandoc_arguments(cls, *, output_location: str | None) -> tuple[str, ...]:
+        pandoc_executable: str = cls._get_pandoc_executable_path()
+        cls._check_pandoc_writer_is_available(pandoc_executable)
+
+        return (
+            pandoc_executable,
+            "--from",
+            "docbook",
+            "--to",
+            cls.PANDOC_ID,
+            *(("--output", output_location) if output_location is not None else ()),
+            "--fail-if-warnings",
+        )
+
+    @classmethod
+    def _get_pandoc_output_location(
+        cls,
+        file_path: "Path",
+        *,
+        output_location: "Path | ConversionOutputDestinationFlag | None",
+        postpublish: bool,
+        prepublish: bool,
+    ) -> str | None:
+        if postpublish or prepublish:
+            INVALID_PREPUBLISH_OR_POSTPUBLISH_MESSAGE: Final[str] = (
+                "Neither 'postpublish' nor 'prepublish' can be used "
+                "for this conversion backend."
+            )
+            raise ValueError(INVALID_PREPUBLISH_OR_POSTPUBLISH_MESSAGE)
+
+        if output_location is None:
+            return str(file_path.with_suffix(cls.FILE_SUFFIX))
+
+        if output_location is OUTPUT_CONVERSION_TO_STRING:
+            return "-"
+
+        if isinstance(output_location, Path):
+            return str(output_location)
+
+        return None
+
+    @classmethod
+    @override
+    def _get_file_batch_size(cls) -> int:
+        # NOTE: Long-lived Asciidoctor workers already avoid Ruby's startup time for every file
+        if workers._get_asciidoctor_worker_pool() is not None:  # noqa: SLF001
+            return 1
+
+        return _ASCIIDOCTOR_BATCH_SIZE
+
+    @classmethod
+    @override
+    @contextlib.contextmanager
+    def _batch_files(
+        cls, file_paths: "Sequence[Path]", *, attributes: "Mapping[str, str] | None"
+    ) -> "Iterator[None]":
+        if len(file_paths) < 2 or cls._get_file_batch_size() < 2:
+            yield
+            return
+
+        batch_count: int = -(-len(file_paths) // _ASCIIDOCTOR_BATCH_SIZE)
+        docbook_batches: dict[Path, _DocBookBatch] = {}
+
+        for batch_index in range(batch_count):
+            docbook_batch: _DocBookBatch = _DocBookBatch(
+                cls,
+                file_paths[
+                    (batch_index * len(file_paths)) // batch_count : (
+                        ((batch_index + 1) * len(file_paths)) // batch_count
+                    )
+                ],
+                attributes=attributes,
+            )
+            docbook_batches.update(dict.fromkeys(docbook_batch.file_paths, docbook_batch))
+
+        token: contextvars.Token[Mapping[Path, _DocBookBatch] | None] = _docbook_batches.set(
+            docbook_batches
+        )
+        try:
+            yield
+        finally:
+            _docbook_batches.reset(token)
+
+    @classmethod
+    def _run_batched_asciidoctor(
+        cls, file_paths: "Sequence[Path]", *, attributes: "Mapping[str, str] | None"
+    ) -> dict[Path, str]:
+        """
+        Convert many AsciiDoc files to DocBook within a single Asciidoctor run.
+
+        Every file is omitted from the returned DocBook outputs if the run fails
+        (E.g. because any single file raised a warning), so each is converted on its own.
+        Files that would be written to the same DocBook output as another file
+        (E.g. `a.adoc` & `a.asciidoc`), or that reference the attributes describing
+        the output location, are never converted within the batch.
+        """
+        output_keys: list[tuple[Path, str]] = [
+            (file_path.resolve().parent, file_path.stem.casefold()) for file_path in file_paths
+        ]
+        output_key_counts: collections.Counter[tuple[Path, str]] = collections.Counter(
+            output_keys
+        )
+        batchable_file_paths: list[Path] = [
+            file_path
+            for file_path, output_key in zip(file_paths, output_keys, strict=True)
+            if output_key_counts[output_key] == 1
+            and not cls._references_output_location(file_path)
+        ]
+        if not batchable_file_paths:
+            return {}
+
+        resolved_file_paths: list[Path] = [
+            file_path.resolve() for file_path in batchable_file_paths
+        ]
+
+        with (
+            tempfile.TemporaryDirectory(prefix="pydowndoc-") as raw_destination_directory,
+            tracing._trace("asciidoctor_batch"),  # noqa: SLF001
+        ):
+            destination_directory: Path = Path(raw_destination_directory)
+
+            try:
+                source_directory: Path = Path(
+                    os.path.commonpath(
+                        [
+                            resolved_file_path.parent
+                            for resolved_file_path in resolved_file_paths
+                        ]
+                    )
+                )
+                _run_subprocess(
+                    cls._get_asciidoctor_arguments(
+                        attributes,
+                        input_locations=[
+                            str(resolved_file_path)
+                            for resolved_file_path in resolved_file_paths
+                        ],
+                        output_arguments=(
+                            "--source-dir",
+                            str(source_directory),
+                            "--destination-dir",
+                            str(destination_directory),
+                        ),
+                    ),
+                    input_text=None,
+                )
+            except (OSError, ValueError, subprocess.CalledProcessError):
+                return {}
+
+            docbook_contents: dict[Path, str] = {}
+
+            for file_path, resolved_file_path in zip(
+                batchable_file_paths, resolved_file_paths, strict=True
+            ):
+                with contextlib.suppress(OSError, UnicodeDecodeError):
+                    docbook_contents[file_path] = (
+                        (
+                            destination_directory
+                            / resolved_file_path.relative_to(source_directory)
+                        )
+                        .with_suffix(".xml")
+                        .read_text(encoding="utf-8")
+                    )
+
+        return docbook_contents
+
+    @classmethod
+    def _references_output_location(cls, file_path: "Path") -> bool:
+        try:
+            asciidoc_content: str = file_path.read_text()
+        except (OSError, UnicodeDecodeError):
+            # NOTE: Unreadable files are converted on their own, so that their error is reported
+            return True
+
+        return _OUTPUT_LOCATION_ATTRIBUTE_PATTERN.search(asciidoc_content) is not None
+
+    @classmethod
+    def _pop_batched_docbook_content(cls, input_path: "Path | None") -> str | None:
+        docbook_batches: Mapping[Path, _DocBookBatch] | None = _docbook_batches.get()
+
+        if input_path is None or docbook_batches is None or input_path not in docbook_batches:
+            return None
+
+        return docbook_batches[input_path].pop_docbook_content(input_path)
+
+    @classmethod
+    def _run_asciidoctor(
+        cls,
+        attributes: "Mapping[str, str] | None",
+        *,
+        input_text: str | None,
+        input_path: "Path | None",
+    ) -> str:
+        asciidoctor_worker_pool: workers._AsciidoctorWorkerPool | None = (
+            workers._get_asciidoctor_worker_pool()  # noqa: SLF001
+        )
+
+        if asciidoctor_worker_pool is None:
+            return _run_subprocess(
+                cls._get_asciidoctor_arguments(
+                    attributes,
+                    input_locations=(str(input_path) if input_path is not None else "-",),
+                ),
+                input_text=input_text,
+            )
+
+        with tracing._trace("asciidoctor_worker", input_content=input_text) as span:  # noqa: SLF001
+            docbook_content: str = asciidoctor_worker_pool.convert(
+                attributes=tuple(cls._attributes_to_arguments(attributes))[1::2],
+                input_path=str(input_path) if input_path is not None else None,
+                content=input_text,
+            )
+            span.record_output(docbook_content)
+
+        return docbook_content
+
+    @classmethod
+    def _run_conversion(
+        cls,
+        attributes: "Mapping[str, str] | None",
+        *,
+        input_text: str | None,
+        input_path: "Path | None",
+        output_location: str | None,
+    ) -> str:
+        batched_docbook_content: str | None = cls._pop_batched_docbook_content(input_path)
+
+        with _output_on_success(output_location) as pandoc_output_location:
+            if batched_docbook_content is not None:
+                return _run_subprocess(
+                    cls._get_pandoc_arguments(output_location=pandoc_output_location),
+                    input_text=batched_docbook_content,
+                )
+
+            if workers._get_asciidoctor_worker_pool() is None:  # noqa: SLF001
+                return _run_subprocess_pipeline(
+                    cls._get_asciidoctor_arguments(
+                        attributes,
+                        input_locations=(str(input_path) if input_path is not None else "-",),
+                    ),
+                    cls._get_pandoc_arguments(output_location=pandoc_output_location),
+                    input_text=input_text,
+                )
+
+            return _run_subprocess(
+                cls._get_pandoc_arguments(output_location=pandoc_output_location),
+                input_text=cls._run_asciidoctor(
+                    attributes, input_text=input_text, input_path=input_path
+                ),
+            )
+
+    @classmethod
+    async def _arun_conversion(
+        cls,
+        attributes: "Mapping[str, str] | None",
+        *,
+        input_text: str | None,
+        input_path: "Path | None",
+        output_location: str | None,
+    ) -> str:
+        asciidoctor_worker_pool: workers._AsciidoctorWorkerPool | None = (
+            workers._get_asciidoctor_worker_pool()  # noqa: SLF001
+        )
+
+        if asciidoctor_worker_pool is None:
+            with _output_on_success(output_location) as pandoc_output_location:
+                return await _run_async_subprocess_pipeline(
+                    cls._get_asciidoctor_arguments(
+                        attributes,
+                        input_locations=(str(input_path) if input_path is not None else "-",),
+                    ),
+                    cls._get_pandoc_arguments(output_location=pandoc_output_location),
+                    input_text=input_text,
+                )
+
+        with tracing._trace("asciidoctor_worker", input_content=input_text) as span:  # noqa: SLF001
+            docbook_content: str = await asyncio.to_thread(
+                asciidoctor_worker_pool.convert,
+                attributes=tuple(cls._attributes_to_arguments(attributes))[1::2],
+                input_path=str(input_path) if input_path is not None else None,
+                content=input_text,
+            )
+            span.record_output(docbook_content)
 
-        return f"{asciidoctor_version}\n{pandoc_version}"
+        with _output_on_success(output_location) as pandoc_output_location:
+            return await _run_async_subprocess(
+                cls._get_pandoc_arguments(output_location=pandoc_output_location),
+                input_text=docbook_content,
+            )
 
     @classmethod
     @override
     def _convert_string(
         cls, asciidoc_content: str, *, attributes: "Mapping[str, str] | None" = None
     ) -> str:
-        return subprocess.run(
-            (
-                cls._get_pandoc_executable_path(),
-                "--from",
-                "docbook",
-                "--to",
-                cls.PANDOC_ID,
-                "--output",
-                "-",
-                "--fail-if-warnings",
-            ),
-            check=True,
-            input=(
-                subprocess.run(
-                    (
-                        cls._get_asciidoctor_executable_path(),
-                        *cls._attributes_to_arguments(attributes),
-                        "--out-file",
-                        "-",
-                        "--backend",
-                        "docbook5",
-                        "--warnings",
-                        "--failure-level",
-                        "WARNING",
-                        "--",
-                        "-",
-                    ),
-                    check=True,
-                    input=asciidoc_content,
-                    text=True,
-                    capture_output=True,
-                ).stdout
-            ),
-            text=True,
-            capture_output=True,
-        ).stdout
+        return cls._run_conversion(
+            attributes, input_text=asciidoc_content, input_path=None, output_location="-"
+        )
+
+    @classmethod
+    @override
+    async def _aconvert_string(
+        cls, asciidoc_content: str, *, attributes: "Mapping[str, str] | None" = None
+    ) -> str:
+        return await cls._arun_conversion(
+            attributes, input_text=asciidoc_content, input_path=None, output_location="-"
+        )
 
     @overload
     @classmethod
@@ -504,58 +2069,66 @@ class _BasePandocConversionBackend(BaseConversionBackend, abc.ABC):
         postpublish: bool = False,
         prepublish: bool = False,
     ) -> str | None:
-        if postpublish or prepublish:
-            INVALID_PREPUBLISH_OR_POSTPUBLISH_MESSAGE: Final[str] = (
-                "Neither 'postpublish' nor 'prepublish' can be used "
-                "for this conversion backend."
-            )
-            raise ValueError(INVALID_PREPUBLISH_OR_POSTPUBLISH_MESSAGE)
+        subprocess_stdout: str = cls._run_conversion(
+            attributes,
+            input_text=None,
+            input_path=file_path,
+            output_location=cls._get_pandoc_output_location(
+                file_path,
+                output_location=output_location,
+                postpublish=postpublish,
+                prepublish=prepublish,
+            ),
+        )
 
-        optional_arguments: list[str] = []
+        return subprocess_stdout if output_location is OUTPUT_CONVERSION_TO_STRING else None
 
-        if output_location is None:
-            optional_arguments.extend(
-                ("--output", str(file_path.with_suffix(cls.FILE_SUFFIX)))
-            )
-        elif output_location is OUTPUT_CONVERSION_TO_STRING:
-            optional_arguments.extend(("--output", "-"))
-        elif isinstance(output_location, Path):
-            optional_arguments.extend(("--output", str(output_location)))
-
-        subprocess_stdout: str = subprocess.run(
-            (
-                cls._get_pandoc_executable_path(),
-                "--from",
-                "docbook",
-                "--to",
-                cls.PANDOC_ID,
-                *optional_arguments,
-                "--fail-if-warnings",
-            ),
-            check=True,
-            input=(
-                subprocess.run(
-                    (
-                        cls._get_asciidoctor_executable_path(),
-                        *cls._attributes_to_arguments(attributes),
-                        "--out-file",
-                        "-",
-                        "--backend",
-                        "docbook5",
-                        "--warnings",
-                        "--failure-level",
-                        "WARNING",
-                        "--",
-                        str(file_path),
-                    ),
-                    check=True,
-                    text=True,
-                    capture_output=True,
-                ).stdout
+    @overload
+    @classmethod
+    async def _aconvert_file(
+        cls,
+        file_path: "Path",
+        *,
+        output_location: "ConversionOutputDestinationFlag",
+        attributes: "Mapping[str, str] | None" = ...,
+        postpublish: bool = ...,
+        prepublish: bool = ...,
+    ) -> str: ...
+
+    @overload
+    @classmethod
+    async def _aconvert_file(
+        cls,
+        file_path: "Path",
+        *,
+        attributes: "Mapping[str, str] | None" = ...,
+        output_location: "Path | None" = ...,
+        postpublish: bool = ...,
+        prepublish: bool = ...,
+    ) -> None: ...
+
+    @classmethod
+    @override
+    async def _aconvert_file(
+        cls,
+        file_path: "Path",
+        *,
+        attributes: "Mapping[str, str] | None" = None,
+        output_location: "Path | ConversionOutputDestinationFlag | None" = None,
+        postpublish: bool = False,
+        prepublish: bool = False,
+    ) -> str | None:
+        subprocess_stdout: str = await cls._arun_conversion(
+            attributes,
+            input_text=None,
+            input_path=file_path,
+            output_location=cls._get_pandoc_output_location(
+                file_path,
+                output_location=output_location,
+                postpublish=postpublish,
+                prepublish=prepublish,
             ),
-            text=True,
-            capture_output=True,
-        ).stdout
+        )
 
         return subprocess_stdout if output_location is OUTPUT_CONVERSION_TO_STRING else None
 
@@ -653,3 +2226,94 @@ class PandocRSTConversionBackend(_BasePandocConversionBackend):
     @override
     def FILE_SUFFIX(cls) -> "LiteralString":
         return ".rst"
+
+
+def _convert_to_pandoc_formats(
+    backends: "Iterable[type[BaseConversionBackend]]",
+    *,
+    attributes: "Mapping[str, str] | None",
+    input_text: str | None,
+    input_path: "Path | None",
+) -> dict[str, str]:
+    """
+    Convert AsciiDoc content with many pandoc conversion backends, running Asciidoctor once.
+
+    The single DocBook output is then converted by every backend's pandoc writer concurrently.
+    """
+    pandoc_backends: dict[str, type[_BasePandocConversionBackend]] = {}
+    invalid_backend_ids: list[str] = []
+    for backend in backends:
+        if issubclass(backend, _BasePandocConversionBackend):
+            pandoc_backends[backend.ID] = backend
+        else:
+            invalid_backend_ids.append(backend.ID)
+
+    if invalid_backend_ids:
+        INVALID_BACKENDS_MESSAGE: Final[str] = (
+            f"Cannot convert to many formats using the conversion backends: "
+            f"{', '.join(invalid_backend_ids)}. "
+            "Only pandoc conversion backends can share a single Asciidoctor conversion."
+        )
+        raise TypeError(INVALID_BACKENDS_MESSAGE)
+
+    if not pandoc_backends:
+        EMPTY_BACKENDS_MESSAGE: Final[str] = "At least one conversion backend must be given."
+        raise ValueError(EMPTY_BACKENDS_MESSAGE)
+
+    with tracing._trace(  # noqa: SLF001
+        "convert_formats",
+        backend_id=",".join(pandoc_backends),
+        attributes=attributes,
+        input_content=input_text,
+    ):
+        converted_outputs: dict[str, str] = {}
+        cache_keys: dict[str, str] = {}
+
+        if caching._is_caching_enabled():  # noqa: SLF001
+            asciidoc_content: str = (
+                _read_asciidoc_file(input_path) if input_path is not None else input_text or ""
+            )
+
+            for backend_id, backend in pandoc_backends.items():
+                cache_keys[backend_id] = caching.get_conversion_cache_key(
+                    backend, asciidoc_content, attributes=attributes, file_path=input_path
+                )
+                cached_output: str | None = caching._get_cached_conversion(  # noqa: SLF001
+                    cache_keys[backend_id]
+                )
+                if cached_output is not None:
+                    converted_outputs[backend_id] = cached_output
+
+        uncached_backends: list[type[_BasePandocConversionBackend]] = [
+            backend
+            for backend_id, backend in pandoc_backends.items()
+            if backend_id not in converted_outputs
+        ]
+
+        if uncached_backends:
+            docbook_content: str = uncached_backends[0]._run_asciidoctor(  # noqa: SLF001
+                attributes, input_text=input_text, input_path=input_path
+            )
+
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(uncached_backends), thread_name_prefix="pydowndoc"
+            ) as executor:
+                pending_conversions: dict[str, concurrent.futures.Future[str]] = {
+                    backend.ID: executor.submit(
+                        contextvars.copy_context().run,
+                        _run_subprocess,
+                        backend._get_pandoc_arguments(output_location="-"),  # noqa: SLF001
+                        input_text=docbook_content,
+                    )
+                    for backend in uncached_backends
+                }
+
+            for backend_id, pending_conversion in pending_conversions.items():
+                converted_outputs[backend_id] = pending_conversion.result()
+
+                if backend_id in cache_keys:
+                    caching._cache_conversion(  # noqa: SLF001
+                        cache_keys[backend_id], converted_outputs[backend_id]
+                    )
+
+    return {backend_id: converted_outputs[backend_id] for backend_id in pandoc_backends}
@@ -0,0 +1,303 @@
+"""Extraction of the files that each AsciiDoc document depends upon, to invalidate outputs."""
+
+import hashlib
+import re
+import sys
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+
+if sys.version_info >= (3, 12):
+    from typing import override
+else:
+    from typing_extensions import override
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Mapping, Sequence
+    from os import stat_result
+    from pathlib import Path
+    from typing import Final
+
+__all__: "Sequence[str]" = ("DependencyGraph", "get_dependencies")
+
+
+_DIRECTIVE_PATTERN: "Final[re.Pattern[str]]" = re.compile(
+    r"(?P<directive>include|image)::(?P<target>[^\s\[][^\[]*)\[.*\][ \t]*"
+)
+_ATTRIBUTE_ENTRY_PATTERN: "Final[re.Pattern[str]]" = re.compile(
+    r":(?P<name>!?\w[\w-]*!?):(?:[ \t]+(?P<value>.*?))?[ \t]*"
+)
+_ATTRIBUTE_REFERENCE_PATTERN: "Final[re.Pattern[str]]" = re.compile(r"\{(?P<name>\w[\w-]*)\}")
+
+# NOTE: Matches the default `max-include-depth` of Asciidoctor, which also stops include cycles from recursing forever
+_MAXIMUM_INCLUDE_DEPTH: "Final[int]" = 64
+
+_FileSnapshot = tuple[int, int] | None
+
+
+class _CachedDependencies(NamedTuple):
+    file_snapshots: "Mapping[Path, _FileSnapshot]"
+    dependencies: "frozenset[Path]"
+
+
+_dependencies_cache: "dict[tuple[Path, frozenset[tuple[str, str]]], _CachedDependencies]" = {}
+_content_hashes: "dict[Path, tuple[int, int, str]]" = {}
+_cache_lock: threading.Lock = threading.Lock()
+
+
+def _get_file_snapshot(file_path: "Path") -> _FileSnapshot:
+    try:
+        file_stat: stat_result = file_path.stat()
+    except OSError:
+        return None
+
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def _resolve_target(target: str, attributes: "Mapping[str, str]") -> str | None:
+    """Substitute every attribute reference within the target, unless any are undefined."""
+    unresolved_reference: bool = False
+
+    def substitute(attribute_reference: "re.Match[str]") -> str:
+        nonlocal unresolved_reference
+
+        value: str | None = attributes.get(attribute_reference.group("name"))
+        if value is None:
+            unresolved_reference = True
+            return ""
+
+        return value
+
+    resolved_target: str = _ATTRIBUTE_REFERENCE_PATTERN.sub(substitute, target.strip())
+    if unresolved_reference or "://" in resolved_target:
+        return None
+
+    return resolved_target
+
+
+def _collect_dependencies(
+    file_path: "Path",
+    *,
+    document_directory: "Path",
+    attributes: dict[str, str],
+    dependencies: "dict[Path, _FileSnapshot]",
+    depth: int,
+) -> None:
+    """
+    Record every file that the given file depends upon, following its include directives.
+
+    Attribute entries are tracked in document order (including those within included files),
+    so that attribute references within the targets of directives can be resolved.
+    """
+    try:
+        asciidoc_content: str = file_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return
+
+    is_within_comment_block: bool = False
+
+    for line in asciidoc_content.splitlines():
+        if line.startswith("////") and not line.strip("/ \t"):
+            is_within_comment_block = not is_within_comment_block
+            continue
+
+        if is_within_comment_block or line.startswith("//"):
+            continue
+
+        attribute_entry: re.Match[str] | None = _ATTRIBUTE_ENTRY_PATTERN.fullmatch(line)
+        if attribute_entry is not None:
+            attribute_name: str = attribute_entry.group("name")
+            if "!" in attribute_name:
+                attributes.pop(attribute_name.strip("!"), None)
+            else:
+                resolved_value: str | None = _resolve_target(
+                    attribute_entry.group("value") or "", attributes
+                )
+                if resolved_value is not None:
+                    attributes[attribute_name] = resolved_value
+            continue
+
+        directive: re.Match[str] | None = _DIRECTIVE_PATTERN.fullmatch(line)
+        if directive is None:
+            continue
+
+        target: str | None = _resolve_target(directive.group("target"), attributes)
+        if target is None:
+            continue
+
+        if directive.group("directive") == "image":
+            dependency_path: Path = (
+                document_directory / attributes.get("imagesdir", "") / target
+            ).resolve()
+            dependencies.setdefault(dependency_path, _get_file_snapshot(dependency_path))
+            continue
+
+        dependency_path = (file_path.parent / target).resolve()
+        is_new_dependency: bool = dependency_path not in dependencies
+        dependencies.setdefault(dependency_path, _get_file_snapshot(dependency_path))
+
+        if is_new_dependency and depth < _MAXIMUM_INCLUDE_DEPTH:
+            _collect_dependencies(
+                dependency_path,
+                document_directory=document_directory,
+                attributes=attributes,
+                dependencies=dependencies,
+                depth=depth + 1,
+            )
+
+
+def get_dependencies(
+    file_path: "Path", *, attributes: "Mapping[str, str] | None" = None
+) -> "frozenset[Path]":
+    """
+    Retrieve the resolved paths of every file that the given AsciiDoc file depends upon.
+
+    Dependencies are the targets of `include::` directives (followed recursively,
+    so files of shared attribute entries are also included) and of `image::` directives.
+    Targets that do not exist yet are included,
+    because creating them would change the converted output.
+    Conditional directives are not evaluated,
+    so every dependency within any conditional block is included.
+    Remote targets & targets that reference undefined attributes are excluded.
+
+    The dependencies of each file are cached,
+    & only re-extracted once the file or any of its dependencies has been modified.
+
+    Arguments:
+        file_path: The AsciiDoc file to extract the dependencies of.
+        attributes: The AsciiDoc attributes given to the conversion,
+            which may be referenced by the targets of directives.
+    """
+    resolved_file_path: Path = file_path.resolve()
+    cache_key: tuple[Path, frozenset[tuple[str, str]]] = (
+        resolved_file_path,
+        frozenset((attributes or {}).items()),
+    )
+
+    with _cache_lock:
+        cached_dependencies: _CachedDependencies | None = _dependencies_cache.get(cache_key)
+
+    if cached_dependencies is not None and all(
+        _get_file_snapshot(dependency_path) == file_snapshot
+        for dependency_path, file_snapshot in cached_dependencies.file_snapshots.items()
+    ):
+        return cached_dependencies.dependencies
+
+    file_snapshots: dict[Path, _FileSnapshot] = {
+        resolved_file_path: _get_file_snapshot(resolved_file_path)
+    }
+    _collect_dependencies(
+        resolved_file_path,
+        document_directory=resolved_file_path.parent,
+        attributes={"docdir": str(resolved_file_path.parent), **(attributes or {})},
+        dependencies=file_snapshots,
+        depth=0,
+    )
+
+    dependencies: frozenset[Path] = frozenset(file_snapshots.keys() - {resolved_file_path})
+
+    with _cache_lock:
+        _dependencies_cache[cache_key] = _CachedDependencies(file_snapshots, dependencies)
+
+    return dependencies
+
+
+def _get_content_hash(file_path: "Path") -> str | None:
+    """Hash the content of the given file, reusing the hash while it remains unmodified."""
+    file_snapshot: _FileSnapshot = _get_file_snapshot(file_path)
+    if file_snapshot is None:
+        return None
+
+    with _cache_lock:
+        cached_content_hash: tuple[int, int, str] | None = _content_hashes.get(file_path)
+
+    if cached_content_hash is not None and cached_content_hash[:2] == file_snapshot:
+        return cached_content_hash[2]
+
+    try:
+        content_hash: str = hashlib.sha256(file_path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+    with _cache_lock:
+        _content_hashes[file_path] = (*file_snapshot, content_hash)
+
+    return content_hash
+
+
+def _get_dependencies_fingerprint(
+    file_path: "Path", *, attributes: "Mapping[str, str] | None"
+) -> list[tuple[str, str | None]]:
+    """Identify the current content of every dependency of the given file."""
+    return [
+        (str(dependency_path), _get_content_hash(dependency_path))
+        for dependency_path in sorted(get_dependencies(file_path, attributes=attributes))
+    ]
+
+
+class DependencyGraph:
+    """
+    The dependencies of many AsciiDoc documents, queried for the documents affected by changes.
+
+    Each document is added to the graph once,
+    after which its dependencies are kept up to date automatically,
+    whenever the graph is queried.
+    """
+
+    @override
+    def __init__(self, *, attributes: "Mapping[str, str] | None" = None) -> None:
+        self.attributes: Mapping[str, str] | None = attributes
+        self._documents: dict[Path, frozenset[Path]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def add(self, file_paths: "Iterable[Path]") -> None:
+        """Add the given documents to the graph, extracting each of their dependencies."""
+        extracted_dependencies: dict[Path, frozenset[Path]] = {
+            file_path: get_dependencies(file_path, attributes=self.attributes)
+            for file_path in file_paths
+        }
+
+        with self._lock:
+            self._documents.update(extracted_dependencies)
+
+    def remove(self, file_paths: "Iterable[Path]") -> None:
+        """Remove the given documents from the graph, if they had been added."""
+        with self._lock:
+            for file_path in file_paths:
+                self._documents.pop(file_path, None)
+
+    def get_dependencies(self) -> "frozenset[Path]":
+        """Retrieve every file that any document within the graph depends upon."""
+        with self._lock:
+            return frozenset().union(*self._documents.values())
+
+    def get_affected_documents(self, changed_paths: "Collection[Path]") -> "set[Path]":
+        """
+        Retrieve every document whose converted output may be changed by the given files.
+
+        A document is affected if it was changed itself,
+        or if any file it depended upon (before or after the changes) was changed.
+        """
+        resolved_changed_paths: set[Path] = {
+            changed_path.resolve() for changed_path in changed_paths
+        }
+
+        with self._lock:
+            previous_documents: dict[Path, frozenset[Path]] = dict(self._documents)
+
+        current_documents: dict[Path, frozenset[Path]] = {
+            file_path: get_dependencies(file_path, attributes=self.attributes)
+            for file_path in previous_documents
+        }
+
+        with self._lock:
+            for file_path, dependencies in current_documents.items():
+                if file_path in self._documents:
+                    self._documents[file_path] = dependencies
+
+        return {
+            file_path
+            for file_path, dependencies in current_documents.items()
+            if file_path.resolve() in resolved_changed_paths
+            or not resolved_changed_paths.isdisjoint(dependencies)
+            or not resolved_changed_paths.isdisjoint(previous_documents[file_path])
+        }
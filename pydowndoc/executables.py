@@ -0,0 +1,317 @@
+"""Resolution of the external executables used by conversions, cached for each process."""
+
+import concurrent.futures
+import contextlib
+import hashlib
+import importlib.metadata
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from . import _session_state, caching, tracing
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from os import stat_result
+    from typing import Final
+
+__all__: "Sequence[str]" = (
+    "clear_executable_cache",
+    "get_executable_path",
+    "set_executable_path",
+)
+
+
+# NOTE: The Pydowndoc-bin wheel installs the downdoc binary as a script, so its location is recorded within the distribution's metadata
+BUNDLED_EXECUTABLE_DISTRIBUTIONS: "Final[Mapping[str, str]]" = {"downdoc": "Pydowndoc-bin"}
+
+_PROBE_CACHE_MAXIMUM_SIZE: "Final[int]" = 1024 * 1024
+
+
+class _ResolvedExecutable(NamedTuple):
+    raw_path_variable: str | None
+    raw_override: str | None
+    executable_path: str
+
+
+_executable_overrides: dict[str, str] = {}
+_resolved_executables: dict[str, _ResolvedExecutable] = {}
+_resolved_executables_lock: threading.Lock = threading.Lock()
+_executable_identities: dict[str, tuple[str, int, int] | None] = {}
+_probe_outputs: dict[tuple[str, ...], str] = {}
+_probe_outputs_lock: threading.Lock = threading.Lock()
+
+
+def _get_override_environment_variable(executable_name: str) -> str:
+    return f"PYDOWNDOC_{executable_name.upper().replace('-', '_')}_EXECUTABLE"
+
+
+def set_executable_path(executable_name: str, executable_path: Path | None) -> None:
+    """
+    Use the given path for the named executable, instead of searching for it.
+
+    Arguments:
+        executable_name: The name of the executable (E.g. `downdoc` or `pandoc`).
+        executable_path: The path of the executable to use,
+            or `None` to remove any previously set path.
+    """
+    with _resolved_executables_lock:
+        if executable_path is None:
+            _executable_overrides.pop(executable_name, None)
+        else:
+            _executable_overrides[executable_name] = str(executable_path)
+
+        _executable_identities.clear()
+
+
+def clear_executable_cache() -> None:
+    """
+    Forget every executable path that has been resolved by this process.
+
+    The cache is invalidated automatically whenever the `PATH` environment variable changes,
+    so this is only required after installing, removing or replacing an executable
+    within a directory that is already on the `PATH`.
+    The versions of every executable are also probed again after the cache is cleared.
+    """
+    with _resolved_executables_lock:
+        _resolved_executables.clear()
+        _executable_identities.clear()
+
+
+def _get_bundled_executable_path(executable_name: str) -> str | None:
+    """Locate the named executable within its bundling distribution, if it is installed."""
+    distribution_name: str | None = BUNDLED_EXECUTABLE_DISTRIBUTIONS.get(executable_name)
+    if distribution_name is None:
+        return None
+
+    try:
+        distribution: importlib.metadata.Distribution = importlib.metadata.distribution(
+            distribution_name
+        )
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+    for distribution_file in distribution.files or ():
+        if distribution_file.name not in (executable_name, f"{executable_name}.exe"):
+            continue
+
+        executable_path: Path = Path(str(distribution.locate_file(distribution_file)))
+        if executable_path.is_file() and os.access(executable_path, os.X_OK):
+            return str(executable_path.resolve())
+
+    return None
+
+
+def get_executable_path(executable_name: str) -> str | None:
+    """
+    Resolve the path of the named executable, returning `None` if it cannot be found.
+
+    An executable path set by `set_executable_path()` is always used first,
+    followed by the `PYDOWNDOC_<NAME>_EXECUTABLE` environment variable
+    (E.g. `PYDOWNDOC_DOWNDOC_EXECUTABLE`), which can be a path or a command name.
+    Otherwise, the executable installed by its bundling distribution
+    (E.g. the downdoc binary of `Pydowndoc-bin`) is used if it is installed,
+    before falling back to searching the `PATH`.
+
+    Resolved paths are cached until the `PATH` or the overriding environment variable changes,
+    so repeated calls do not access the filesystem.
+    Within the conversions of a `Converter`,
+    the paths resolved when it was created are always used.
+    """
+    session: _session_state._SessionState | None = _session_state._current_session.get()  # noqa: SLF001
+    if session is not None and executable_name in session.executable_paths:
+        return session.executable_paths[executable_name]
+
+    executable_override: str | None = _executable_overrides.get(executable_name)
+    if executable_override is not None:
+        return executable_override
+
+    raw_path_variable: str | None = os.environ.get("PATH")
+    raw_override: str | None = os.environ.get(
+        _get_override_environment_variable(executable_name)
+    )
+
+    resolved_executable: _ResolvedExecutable | None = _resolved_executables.get(
+        executable_name
+    )
+    if (
+        resolved_executable is not None
+        and resolved_executable.raw_path_variable == raw_path_variable
+        and resolved_executable.raw_override == raw_override
+    ):
+        return resolved_executable.executable_path
+
+    with tracing._trace("resolve_executable"):  # noqa: SLF001
+        executable_path: str | None = (
+            shutil.which(raw_override)
+            if raw_override
+            else (
+                _get_bundled_executable_path(executable_name) or shutil.which(executable_name)
+            )
+        )
+
+    # NOTE: Executables that could not be found are not cached, so that installing them later within the same process is noticed
+    if executable_path is not None:
+        with _resolved_executables_lock:
+            # NOTE: Resolving again means that the `PATH` or an overriding environment variable changed, so any executable may have been replaced
+            _executable_identities.clear()
+            _resolved_executables[executable_name] = _ResolvedExecutable(
+                raw_path_variable=raw_path_variable,
+                raw_override=raw_override,
+                executable_path=executable_path,
+            )
+
+    return executable_path
+
+
+def _get_executable_identity(executable_path: str) -> tuple[str, int, int] | None:
+    """
+    Identify the executable by its resolved path, size & modification time.
+
+    Identities are cached until the resolved executable paths are next invalidated,
+    so that probing an executable only inspects the filesystem the first time.
+    """
+    executable_identity: tuple[str, int, int] | None = _executable_identities.get(
+        executable_path
+    )
+    if executable_identity is not None:
+        return executable_identity
+
+    resolved_executable_path: Path = Path(executable_path).resolve()
+
+    try:
+        executable_stat: stat_result = resolved_executable_path.stat()
+    except OSError:
+        return None
+
+    executable_identity = (
+        str(resolved_executable_path),
+        executable_stat.st_size,
+        executable_stat.st_mtime_ns,
+    )
+
+    with _resolved_executables_lock:
+        _executable_identities[executable_path] = executable_identity
+
+    return executable_identity
+
+
+def _get_probe_cache_key(arguments: "Sequence[str]") -> str | None:
+    """Identify the probe by the identity of its executable & the arguments given to it."""
+    executable_identity: tuple[str, int, int] | None = _get_executable_identity(arguments[0])
+    if executable_identity is None:
+        return None
+
+    return hashlib.sha256(
+        json.dumps(
+            (*executable_identity, tuple(arguments[1:])), separators=(",", ":")
+        ).encode()
+    ).hexdigest()
+
+
+def _run_probe(
+    arguments: "Sequence[str]",
+    probe_cache: "caching.DiskConversionCache | None",
+    probe_cache_key: str | None,
+) -> str:
+    """Run the given probe, reusing its output persisted by any previous process, if any."""
+    if probe_cache is not None and probe_cache_key is not None:
+        cached_probe_output: str | None = None
+        with contextlib.suppress(OSError):
+            cached_probe_output = probe_cache.get(probe_cache_key)
+        if cached_probe_output is not None:
+            return cached_probe_output
+
+    probe_output: str = subprocess.run(
+        arguments, check=True, text=True, capture_output=True, stdin=subprocess.DEVNULL
+    ).stdout.strip()
+
+    if probe_cache is not None and probe_cache_key is not None:
+        with contextlib.suppress(OSError):
+            probe_cache.set(probe_cache_key, probe_output)
+
+    return probe_output
+
+
+def _probe_executables(*probes: "Sequence[str]") -> list[str]:
+    """
+    Run each of the given argument sequences, returning the stripped output of each.
+
+    Each probe (E.g. `("pandoc", "--version")`) is only run once per process
+    for each version of its executable, identified by the resolved path, size
+    & modification time of the executable.
+    The executable is only inspected again once the resolved executable paths are invalidated
+    (E.g. because the `PATH` changed), so repeated probes do not access the filesystem.
+    Whilst a disk cache is enabled, outputs are also persisted within its `probes` directory,
+    so that each probe only runs once per machine until its executable is replaced.
+    Probes that have not run before are run concurrently.
+
+    Raises:
+        subprocess.CalledProcessError: If any probe exited with a non-zero exit code.
+    """
+    probe_keys: list[tuple[str, ...]] = [tuple(probe) for probe in probes]
+    probe_cache_keys: dict[tuple[str, ...], str | None] = {
+        probe_key: _get_probe_cache_key(probe_key) for probe_key in dict.fromkeys(probe_keys)
+    }
+
+    # NOTE: Probes of executables that cannot be inspected are keyed by their arguments alone, so they are still only run once per process
+    memo_keys: dict[tuple[str, ...], tuple[str, ...]] = {
+        probe_key: (probe_cache_key,) if probe_cache_key is not None else probe_key
+        for probe_key, probe_cache_key in probe_cache_keys.items()
+    }
+
+    with _probe_outputs_lock:
+        probe_outputs: dict[tuple[str, ...], str] = {
+            probe_key: _probe_outputs[memo_key]
+            for probe_key, memo_key in memo_keys.items()
+            if memo_key in _probe_outputs
+        }
+
+    unprobed_keys: list[tuple[str, ...]] = [
+        probe_key for probe_key in memo_keys if probe_key not in probe_outputs
+    ]
+    if not unprobed_keys:
+        return [probe_outputs[probe_key] for probe_key in probe_keys]
+
+    disk_cache: caching.DiskConversionCache | None = caching._get_caches()[1]  # noqa: SLF001
+    probe_cache: caching.DiskConversionCache | None = (
+        caching.DiskConversionCache(
+            disk_cache.directory / "probes", maximum_size=_PROBE_CACHE_MAXIMUM_SIZE
+        )
+        if disk_cache is not None
+        else None
+    )
+
+    if len(unprobed_keys) == 1:
+        probe_outputs[unprobed_keys[0]] = _run_probe(
+            unprobed_keys[0], probe_cache, probe_cache_keys[unprobed_keys[0]]
+        )
+
+    else:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(unprobed_keys), thread_name_prefix="pydowndoc"
+        ) as executor:
+            probe_outputs.update(
+                zip(
+                    unprobed_keys,
+                    executor.map(
+                        _run_probe,
+                        unprobed_keys,
+                        itertools.repeat(probe_cache),
+                        (probe_cache_keys[probe_key] for probe_key in unprobed_keys),
+                    ),
+                    strict=True,
+                )
+            )
+
+    with _probe_outputs_lock:
+        _probe_outputs.update(
+            (memo_keys[probe_key], probe_outputs[probe_key]) for probe_key in unprobed_keys
+        )
+
+    return [probe_outputs[probe_key] for probe_key in probe_keys]
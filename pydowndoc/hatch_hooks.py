@@ -5,8 +5,11 @@ Convert your AsciiDoc README to the Markdown format, supported by PyPA's README
 https://packaging.python.org/en/latest/specifications/pyproject-toml/#readme
 """
 
-import inspect
+import contextvars
+import hashlib
+import json
 import sys
+import threading
 import warnings
 from collections.abc import Collection, Iterable
 from pathlib import Path
@@ -22,6 +25,7 @@ from hatchling.plugin import hookimpl
 from typed_classproperties import classproperty
 
 import pydowndoc
+from pydowndoc import caching
 from pydowndoc.conversion_backends import (
     DowndocMarkdownConversionBackend,
     PandocMarkdownConversionBackend,
@@ -33,6 +37,7 @@ from pydowndoc.conversion_backends import (
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
+    from os import stat_result
     from typing import Final
 
     if sys.version_info >= (3, 11):
@@ -45,6 +50,16 @@ if TYPE_CHECKING:
 __all__: "Sequence[str]" = ("DowndocReadmeMetadataHook", "hatch_register_metadata_hook")
 
 
+# NOTE: Increment whenever the post-processing of converted README files changes its output
+_POST_PROCESSING_REVISION: "Final[int]" = 1
+
+_is_updating: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "pydowndoc_is_updating_readme_metadata", default=False
+)
+_converted_readmes: dict[tuple[str, int, int, str], str] = {}
+_converted_readmes_lock: threading.Lock = threading.Lock()
+
+
 class DowndocReadmeMetadataHook(MetadataHookInterface):
     """Hatchling metadata hook for converting AsciiDoc README files to Markdown format."""
 
@@ -123,6 +138,25 @@ class DowndocReadmeMetadataHook(MetadataHookInterface):
             )
             raise ValueError(INVALID_CONVERSION_BACKEND_MESSAGE) from e
 
+    @classmethod
+    def _is_cache_enabled(cls, config: "Mapping[str, object]") -> bool:
+        raw_is_cache_enabled: object | bool = config.get("cache", True)
+
+        if not isinstance(raw_is_cache_enabled, bool):
+            INVALID_CACHE_TYPE_MESSAGE: Final[str] = (
+                f"{cls.PLUGIN_NAME}.cache must be a boolean."
+            )
+            raise TypeError(INVALID_CACHE_TYPE_MESSAGE)
+
+        return raw_is_cache_enabled
+
+    @classmethod
+    def _is_readme_from_source_distribution(
+        cls, metadata: "Mapping[str, object]", root: Path
+    ) -> bool:
+        # NOTE: When building from an unpacked source distribution, Hatchling populates every dynamic field from its PKG-INFO file, so the README was already converted when the source distribution was built
+        return "readme" in metadata and (root / "PKG-INFO").is_file()
+
     @classmethod
     def _is_project_misconfigured(cls, metadata: "Mapping[str, object]") -> bool:
         if "readme" in metadata:
@@ -146,12 +180,140 @@ class DowndocReadmeMetadataHook(MetadataHookInterface):
 
         return converted_readme
 
+    @classmethod
+    def _convert_readme(
+        cls, readme_path: Path, *, conversion_backend: "type[BaseConversionBackend] | None"
+    ) -> str:
+        return cls._post_process(
+            (
+                pydowndoc.convert_file(
+                    readme_path,
+                    output_location=pydowndoc.OUTPUT_CONVERSION_TO_STRING,
+                    backend=conversion_backend,
+                )
+                if conversion_backend is not None
+                else pydowndoc.convert_file(
+                    readme_path, output_location=pydowndoc.OUTPUT_CONVERSION_TO_STRING
+                )
+            ),
+            conversion_backend=conversion_backend,
+        )
+
+    @classmethod
+    def _get_readme_fingerprint(
+        cls,
+        readme_path: Path,
+        *,
+        conversion_backend: "type[BaseConversionBackend] | None",
+        config: "Mapping[str, object]",
+        disk_cache: caching.DiskConversionCache,
+    ) -> str:
+        # NOTE: The conversion backend's version is probed within a converter owning the README cache, so that the probe's output is persisted within that cache instead of the probe running again for every build
+        with (
+            pydowndoc.Converter(
+                conversion_backend or DowndocMarkdownConversionBackend, disk_cache=disk_cache
+            ) as converter,
+            converter._activate(),  # noqa: SLF001
+        ):
+            conversion_cache_key: str = caching.get_conversion_cache_key(
+                converter.backend,
+                readme_path.read_text(),
+                attributes=None,
+                file_path=readme_path,
+            )
+
+        return hashlib.sha256(
+            json.dumps(
+                (
+                    cls.PLUGIN_NAME,
+                    _POST_PROCESSING_REVISION,
+                    conversion_cache_key,
+                    sorted((str(key), repr(value)) for key, value in config.items()),
+                ),
+                separators=(",", ":"),
+            ).encode()
+        ).hexdigest()
+
+    @classmethod
+    def _load_converted_readme(
+        cls,
+        readme_path: Path,
+        *,
+        conversion_backend: "type[BaseConversionBackend] | None",
+        config: "Mapping[str, object]",
+    ) -> str:
+        if not cls._is_cache_enabled(config):
+            return cls._convert_readme(readme_path, conversion_backend=conversion_backend)
+
+        disk_cache: caching.DiskConversionCache = caching.DiskConversionCache()
+        fingerprint: str = cls._get_readme_fingerprint(
+            readme_path,
+            conversion_backend=conversion_backend,
+            config=config,
+            disk_cache=disk_cache,
+        )
+
+        cached_readme: str | None = disk_cache.get(fingerprint)
+        if cached_readme is not None:
+            return cached_readme
+
+        converted_readme: str = cls._convert_readme(
+            readme_path, conversion_backend=conversion_backend
+        )
+
+        try:
+            disk_cache.set(fingerprint, converted_readme)
+        except OSError as e:
+            warnings.warn(
+                f"Failed to store the converted README within the cache: {e}", stacklevel=1
+            )
+
+        return converted_readme
+
+    @classmethod
+    def _get_converted_readme(
+        cls,
+        readme_path: Path,
+        *,
+        conversion_backend: "type[BaseConversionBackend] | None",
+        config: "Mapping[str, object]",
+    ) -> str:
+        # NOTE: Hatchling requests the metadata of a project many times within a single build process, so each conversion is memoised for as long as the README file remains unmodified
+        readme_stat: stat_result = readme_path.stat()
+        memo_key: tuple[str, int, int, str] = (
+            str(readme_path.resolve()),
+            readme_stat.st_mtime_ns,
+            readme_stat.st_size,
+            repr(sorted(config.items())),
+        )
+
+        with _converted_readmes_lock:
+            converted_readme: str | None = _converted_readmes.get(memo_key)
+
+        if converted_readme is None:
+            converted_readme = cls._load_converted_readme(
+                readme_path, conversion_backend=conversion_backend, config=config
+            )
+
+            with _converted_readmes_lock:
+                _converted_readmes[memo_key] = converted_readme
+
+        return converted_readme
+
     @override
     def update(self, metadata: dict[str, object]) -> None:
-        if (
-            ("update", __file__)
-            in ((frame.function, frame.filename) for frame in inspect.stack()[1:])
-        ):  # SOURCE: https://github.com/flying-sheep/hatch-docstring-description/blob/2dfbfba2c48e112825fdd0cb7c37035d5598224c/src/hatch_docstring_description/read_description.py#L21
+        # NOTE: Converting the README can re-enter this hook (E.g. by requesting this project's own metadata), so nested calls within the same context are ignored
+        if _is_updating.get():
+            return
+
+        context_token: contextvars.Token[bool] = _is_updating.set(True)
+        try:
+            self._update(metadata)
+        finally:
+            _is_updating.reset(context_token)
+
+    def _update(self, metadata: dict[str, object]) -> None:
+        if self._is_readme_from_source_distribution(metadata, Path(self.root)):
             return
 
         if self._is_project_misconfigured(metadata):
@@ -165,26 +327,12 @@ class DowndocReadmeMetadataHook(MetadataHookInterface):
         if not readme_path.is_file():
             raise FileNotFoundError(str(readme_path))
 
-        conversion_backend: "type[BaseConversionBackend] | None" = (
-            self._get_conversion_backend(self.config)
-        )
-
         metadata["readme"] = {
             "content-type": "text/markdown",
-            "text": self._post_process(
-                (
-                    pydowndoc.convert_file(
-                        readme_path,
-                        output_location=pydowndoc.OUTPUT_CONVERSION_TO_STRING,
-                        backend=conversion_backend,
-                    )
-                    if conversion_backend is not None
-                    else pydowndoc.convert_file(
-                        readme_path,
-                        output_location=pydowndoc.OUTPUT_CONVERSION_TO_STRING,
-                    )
-                ),
-                conversion_backend=conversion_backend,
+            "text": self._get_converted_readme(
+                readme_path,
+                conversion_backend=self._get_conversion_backend(self.config),
+                config=self.config,
             ),
         }
 
@@ -0,0 +1,169 @@
+"""Incremental reconversion of successive versions of the same document."""
+
+import concurrent.futures
+import contextvars
+import hashlib
+import os
+import secrets
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+if sys.version_info >= (3, 12):
+    from typing import override
+else:
+    from typing_extensions import override
+
+from . import sections
+from .conversion_backends import DowndocMarkdownConversionBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from typing import Final
+
+__all__: "Sequence[str]" = ("IncrementalConverter",)
+
+
+class IncrementalConverter:
+    """
+    Convert successive versions of the same document, reconverting only the changed sections.
+
+    Each version is split at every top-level section,
+    with the header attributes that each section depends upon carried into it.
+    The converted output of every section is remembered by the hash of its source,
+    so a section is only reconverted when its own source
+    (or any attribute that it depends upon) has changed since the previous version.
+    Documents that cannot be split into sections are converted whole.
+    Only the `downdoc-md` conversion backend is supported.
+    """
+
+    @override
+    def __init__(
+        self, *, attributes: "Mapping[str, str] | None" = None, max_workers: int | None = None
+    ) -> None:
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        if max_workers < 1:
+            INVALID_MAX_WORKERS_MESSAGE: Final[str] = "'max_workers' must be at least 1."
+            raise ValueError(INVALID_MAX_WORKERS_MESSAGE)
+
+        self.attributes: Mapping[str, str] | None = attributes
+        self.max_workers: int = max_workers
+        self._converted_sections: dict[str, str] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _convert_section_group(
+        self, section_group: "Sequence[str]", arguments: "Sequence[str]"
+    ) -> list[str]:
+        """
+        Convert many sections within a single subprocess, returning each section's output.
+
+        Sections are separated by uniquely titled section headings,
+        at which the converted output is split.
+        If the output cannot be split, each section is converted separately instead.
+        """
+        if len(section_group) == 1:
+            return DowndocMarkdownConversionBackend._convert_chunks(section_group, arguments)  # noqa: SLF001
+
+        boundary_title: str = f"PydowndocSectionBoundary{secrets.token_hex(16)}"
+
+        converted_section_group: list[str] = DowndocMarkdownConversionBackend._convert_chunks(  # noqa: SLF001
+            (
+                f"\n== {boundary_title}\n\n".join(
+                    section if section.endswith("\n") else f"{section}\n"
+                    for section in section_group
+                ),
+            ),
+            arguments,
+        )[0].split(f"\n## {boundary_title}\n\n")
+
+        if len(converted_section_group) != len(section_group):
+            return DowndocMarkdownConversionBackend._convert_chunks(section_group, arguments)  # noqa: SLF001
+
+        return converted_section_group
+
+    def _convert_sections(self, changed_sections: "Sequence[str]") -> list[str]:
+        arguments: tuple[str, ...] = (
+            DowndocMarkdownConversionBackend._get_conversion_arguments(self.attributes)  # noqa: SLF001
+        )
+        group_count: int = min(self.max_workers, len(changed_sections))
+        section_groups: list[Sequence[str]] = [
+            changed_sections[
+                (group_index * len(changed_sections)) // group_count : (
+                    ((group_index + 1) * len(changed_sections)) // group_count
+                )
+            ]
+            for group_index in range(group_count)
+        ]
+
+        if group_count == 1:
+            return self._convert_section_group(section_groups[0], arguments)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=group_count, thread_name_prefix="pydowndoc"
+        ) as executor:
+            pending_conversions: list[concurrent.futures.Future[list[str]]] = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._convert_section_group,
+                    section_group,
+                    arguments,
+                )
+                for section_group in section_groups
+            ]
+
+        return [
+            converted_section
+            for pending_conversion in pending_conversions
+            for converted_section in pending_conversion.result()
+        ]
+
+    def convert(self, asciidoc_content: str) -> str:
+        """Convert the next version of the document, reusing every unchanged section."""
+        if not asciidoc_content.strip():
+            INVALID_ASCIIDOC_CONTENT_MESSAGE: Final[str] = (
+                "Cannot convert empty string content."
+            )
+            raise ValueError(INVALID_ASCIIDOC_CONTENT_MESSAGE)
+
+        document_sections: Sequence[str] = sections.split_document(
+            asciidoc_content, maximum_chunks=None
+        ) or (asciidoc_content,)
+        section_keys: list[str] = [
+            hashlib.sha256(section.encode()).hexdigest() for section in document_sections
+        ]
+
+        with self._lock:
+            changed_sections: dict[str, str] = {
+                section_key: section
+                for section_key, section in zip(section_keys, document_sections, strict=True)
+                if section_key not in self._converted_sections
+            }
+
+            if changed_sections:
+                # NOTE: Only the final section of a document can lack a trailing newline, in which case the trailing newline of its converted output is also removed, matching `convert_string()`
+                self._converted_sections.update(
+                    (
+                        section_key,
+                        DowndocMarkdownConversionBackend._post_process(  # noqa: SLF001
+                            converted_section
+                            if section.endswith("\n")
+                            else converted_section.removesuffix("\n")
+                        ),
+                    )
+                    for (section_key, section), converted_section in zip(
+                        changed_sections.items(),
+                        self._convert_sections(tuple(changed_sections.values())),
+                        strict=True,
+                    )
+                )
+
+            self._converted_sections = {
+                section_key: self._converted_sections[section_key]
+                for section_key in section_keys
+            }
+
+            return "\n".join(
+                self._converted_sections[section_key] for section_key in section_keys
+            )
@@ -0,0 +1,258 @@
+"""Opt-in splitting of large AsciiDoc documents into sections, converted concurrently."""
+
+import os
+import re
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: "Sequence[str]" = (
+    "disable_section_splitting",
+    "enable_section_splitting",
+    "split_document",
+)
+
+
+# NOTE: Any of these features makes the output of a section depend upon the content of other sections (E.g. cross-references resolve the titles of sections & footnotes are numbered throughout the document), so documents that use them are never split
+CROSS_SECTION_FEATURES: "Final[Sequence[str]]" = (
+    "<<",
+    "xref:",
+    "footnote",
+    "include::",
+    "counter:",
+    "counter2:",
+)
+
+# NOTE: Only delimiters, conditional directives, attribute entries & section headings affect where a document can be split, so all other lines are skipped by a single scan
+_STRUCTURAL_LINE_PATTERN: "Final[re.Pattern[str]]" = re.compile(
+    r"^(?:"
+    r"(?P<delimiter>(?:-{4,}|={4,}|\*{4,}|_{4,}|\+{4,}|\.{4,}|/{4,}|--|[|!,:]={3,})(?=[ \t]*$)"
+    r"|`{3,}.*)"
+    r"|(?P<conditional_opening>if(?:n?def|eval)::[^\[\n]*\[\][ \t]*$)"
+    r"|(?P<conditional_closing>endif::[^\[\n]*\[\][ \t]*$)"
+    r"|(?P<attribute_entry>:!?\w[\w-]*!?:(?:[ \t].*)?$)"
+    r"|(?P<heading>== )"
+    r")",
+    re.MULTILINE,
+)
+_BLANK_LINE_PATTERN: "Final[re.Pattern[str]]" = re.compile(r"^[ \t]*$", re.MULTILINE)
+_BLOCK_METADATA_PATTERN: "Final[re.Pattern[str]]" = re.compile(r"\[.*\]|\.[^\s.].*")
+_DISCRETE_HEADING_PATTERN: "Final[re.Pattern[str]]" = re.compile(r"\[(?:discrete|float)[\],]")
+
+
+def _get_header_end(asciidoc_content: str) -> int:
+    """Return the position of the end of the document header, or zero if there is none."""
+    if not asciidoc_content.startswith(("= ", ":")):
+        return 0
+
+    blank_line: re.Match[str] | None = _BLANK_LINE_PATTERN.search(asciidoc_content)
+    return blank_line.start() if blank_line is not None else len(asciidoc_content)
+
+
+def _get_carried_header(header: str) -> list[str]:
+    """Return the header lines that set up every section, without the document title."""
+    header_lines: list[str] = header.splitlines(keepends=True)
+    if header_lines and not header_lines[-1].endswith("\n"):
+        header_lines[-1] += "\n"
+
+    if not header_lines or not header_lines[0].startswith("= "):
+        return header_lines
+
+    carried_header: list[str] = [f":doctitle: {header_lines[0][2:].strip()}\n"]
+    remaining_header_lines: Sequence[str] = header_lines[1:]
+
+    # NOTE: The author & revision lines are the only lines directly after the document title that are not attribute entries, comments or conditional directives
+    for _ in range(2):
+        if remaining_header_lines and not remaining_header_lines[0].startswith(
+            (":", "//", "ifdef::", "ifndef::", "ifeval::", "endif::")
+        ):
+            remaining_header_lines = remaining_header_lines[1:]
+
+    carried_header.extend(remaining_header_lines)
+    return carried_header
+
+
+def _has_content(asciidoc_content: str) -> bool:
+    """Return whether the given AsciiDoc content contains any lines that are not comments."""
+    return any(
+        line.strip() and not line.startswith("//") for line in asciidoc_content.splitlines()
+    )
+
+
+def _get_section_start(asciidoc_content: str, heading_start: int) -> int | None:
+    """
+    Return the position of the start of the section with the given heading.
+
+    Any block metadata lines (E.g. anchors, roles & block titles) directly above the heading
+    belong to its section. `None` is returned when the heading is discrete.
+    """
+    section_start: int = heading_start
+
+    while section_start > 0:
+        previous_line_start: int = asciidoc_content.rfind("\n", 0, section_start - 1) + 1
+        previous_line: str = asciidoc_content[previous_line_start : section_start - 1]
+
+        if not _BLOCK_METADATA_PATTERN.fullmatch(previous_line.rstrip()):
+            break
+
+        if _DISCRETE_HEADING_PATTERN.match(previous_line):
+            return None
+
+        section_start = previous_line_start
+
+    return section_start
+
+
+def _find_sections(
+    asciidoc_content: str, body_start: int
+) -> list[tuple[int, tuple[str, ...]]] | None:
+    """
+    Find the start of every top-level section within the body of the document.
+
+    Each section start is paired with every attribute entry defined within the body before it.
+    `None` is returned when the document cannot be safely split.
+    """
+    sections: list[tuple[int, tuple[str, ...]]] = []
+    body_attribute_entries: list[str] = []
+    open_delimiter: str | None = None
+    conditional_depth: int = 0
+
+    for structural_line in _STRUCTURAL_LINE_PATTERN.finditer(asciidoc_content, body_start):
+        if open_delimiter is not None:
+            if structural_line.lastgroup == "delimiter" and (
+                structural_line.group().rstrip() == open_delimiter
+                or (
+                    open_delimiter.startswith("```")
+                    and structural_line.group().rstrip() == "```"
+                )
+            ):
+                open_delimiter = None
+        elif structural_line.lastgroup == "delimiter":
+            open_delimiter = structural_line.group().rstrip()
+        elif structural_line.lastgroup == "conditional_opening":
+            conditional_depth += 1
+        elif structural_line.lastgroup == "conditional_closing":
+            conditional_depth = max(conditional_depth - 1, 0)
+        elif structural_line.lastgroup == "attribute_entry":
+            attribute_entry: str = structural_line.group().rstrip()
+            if conditional_depth or attribute_entry.endswith(("\\", "+")):
+                return None
+
+            body_attribute_entries.append(f"{attribute_entry}\n")
+        elif not conditional_depth:
+            section_start: int | None = _get_section_start(
+                asciidoc_content, structural_line.start()
+            )
+
+            if section_start is not None and section_start > body_start:
+                sections.append((section_start, tuple(body_attribute_entries)))
+
+    if open_delimiter is not None or conditional_depth:
+        return None
+
+    return sections
+
+
+def split_document(asciidoc_content: str, *, maximum_chunks: int | None) -> list[str] | None:
+    """
+    Split an AsciiDoc document into chunks of whole top-level sections, of similar sizes.
+
+    When `maximum_chunks` is `None`, every top-level section becomes its own chunk.
+
+    Every chunk after the first begins with the document header's attribute entries
+    (& any attribute entries defined earlier within the document body),
+    so that each chunk can be converted independently.
+    Sections are never split within delimited blocks or conditional directives.
+    `None` is returned when the document cannot be split into many chunks,
+    or when it uses features whose output depends upon other sections.
+    """
+    if (maximum_chunks is not None and maximum_chunks < 2) or any(
+        feature in asciidoc_content for feature in CROSS_SECTION_FEATURES
+    ):
+        return None
+
+    header_end: int = _get_header_end(asciidoc_content)
+
+    sections: list[tuple[int, tuple[str, ...]]] | None = _find_sections(
+        asciidoc_content, header_end
+    )
+    if not sections:
+        return None
+
+    carried_header: list[str] = _get_carried_header(asciidoc_content[:header_end])
+    target_chunk_size: float = (
+        len(asciidoc_content) / maximum_chunks if maximum_chunks is not None else 0
+    )
+
+    chunks: list[str] = []
+    chunk_start: int = 0
+    chunk_prefix: str = ""
+
+    for section_start, body_attribute_entries in sections:
+        if maximum_chunks is not None and len(chunks) >= maximum_chunks - 1:
+            break
+
+        if section_start - chunk_start >= target_chunk_size and (
+            chunks or _has_content(asciidoc_content[header_end:section_start])
+        ):
+            chunks.append(chunk_prefix + asciidoc_content[chunk_start:section_start])
+            chunk_start = section_start
+            chunk_prefix = "".join((*carried_header, *body_attribute_entries, "\n"))
+
+    chunks.append(chunk_prefix + asciidoc_content[chunk_start:])
+
+    return chunks if len(chunks) >= 2 else None
+
+
+class _SectionSplitting(NamedTuple):
+    maximum_chunks: int
+    minimum_size: int
+
+
+_section_splitting: _SectionSplitting | None = None
+
+
+def enable_section_splitting(
+    max_workers: int | None = None, *, minimum_size: int = 1024 * 1024
+) -> None:
+    """
+    Convert large documents as chunks of top-level sections, within concurrent subprocesses.
+
+    Only the `downdoc-md` conversion backend splits documents.
+    The converted chunks are joined, giving the same output as converting the whole document.
+    Documents that cannot be safely split are converted whole.
+
+    Arguments:
+        max_workers: The maximum number of chunks to split each document into,
+            defaults to the number of CPUs available.
+        minimum_size: The size (in characters) below which documents are converted whole.
+    """
+    global _section_splitting  # noqa: PLW0603
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers < 1:
+        INVALID_MAX_WORKERS_MESSAGE: Final[str] = "'max_workers' must be at least 1."
+        raise ValueError(INVALID_MAX_WORKERS_MESSAGE)
+
+    _section_splitting = _SectionSplitting(
+        maximum_chunks=max_workers, minimum_size=minimum_size
+    )
+
+
+def disable_section_splitting() -> None:
+    """Revert to converting every document whole, within a single subprocess."""
+    global _section_splitting  # noqa: PLW0603
+    _section_splitting = None
+
+
+def _split_large_document(asciidoc_content: str) -> list[str] | None:
+    section_splitting: _SectionSplitting | None = _section_splitting
+
+    if section_splitting is None or len(asciidoc_content) < section_splitting.minimum_size:
+        return None
+
+    return split_document(asciidoc_content, maximum_chunks=section_splitting.maximum_chunks)
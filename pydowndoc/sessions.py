@@ -0,0 +1,318 @@
+"""Reusable conversion sessions, binding a backend to resources resolved ahead of time."""
+
+import contextlib
+import sys
+import threading
+from types import MappingProxyType
+from typing import TYPE_CHECKING, overload
+
+if sys.version_info >= (3, 12):
+    from typing import override
+else:
+    from typing_extensions import override
+
+from . import _session_state, workers
+from .conversion_backends import DowndocMarkdownConversionBackend
+
+if TYPE_CHECKING:
+    import contextvars
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+    from pathlib import Path
+    from typing import Final
+
+    from ._utils import ConversionOutputDestinationFlag, FileConversionResult
+    from .caching import DiskConversionCache, MemoryConversionCache
+    from .conversion_backends import BaseConversionBackend
+    from .tracing import TraceSpan
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+__all__: "Sequence[str]" = ("Converter",)
+
+
+class Converter:
+    """
+    Reusable conversion session, binding a conversion backend to a fixed set of attributes.
+
+    The backend's executables are resolved once, when the converter is created,
+    & the arguments expanded from its attributes are computed once,
+    so repeated conversions only pay for the conversion subprocesses themselves.
+    The caches, worker pools & tracers given to a converter are only used by its own
+    conversions (taking precedence over any enabled for the whole process),
+    & its pools are shut down once it is closed (E.g. upon leaving its `with` block).
+
+    A converter is never modified after it is created,
+    so it can be shared between many threads.
+    """
+
+    @override
+    def __init__(
+        self,
+        backend: "type[BaseConversionBackend]" = DowndocMarkdownConversionBackend,
+        *,
+        attributes: "Mapping[str, str] | None" = None,
+        memory_cache: "MemoryConversionCache | None" = None,
+        disk_cache: "DiskConversionCache | None" = None,
+        tracers: "Iterable[Callable[[TraceSpan], object]]" = (),
+        downdoc_process_pool_size: int | None = None,
+        asciidoctor_workers: int | None = None,
+        idle_timeout: float = 30.0,
+    ) -> None:
+        """
+        Resolve the backend's executables & start any requested worker pools.
+
+        Arguments:
+            backend: The conversion backend to use, defaults to `downdoc-md`.
+            attributes: AsciiDoc attributes to be set while rendering every conversion.
+                They are copied, so later changes to the given mapping are ignored.
+            memory_cache: An in-process cache of converted outputs, owned by this converter.
+            disk_cache: A persistent cache of converted outputs, owned by this converter.
+            tracers: Callables that receive the span of each stage of this converter's
+                conversions.
+            downdoc_process_pool_size: The number of downdoc processes to spawn ahead of time,
+                or `None` to use the process pool enabled for the whole process, if any.
+            asciidoctor_workers: The maximum number of long-lived Asciidoctor workers to run,
+                or `None` to use the workers enabled for the whole process, if any.
+            idle_timeout: The number of seconds after which unused downdoc processes
+                are killed.
+
+        Raises:
+            OSError: If any executable used by the conversion backend cannot be found.
+        """
+        self.backend: type[BaseConversionBackend] = backend
+        self.attributes: Mapping[str, str] | None = (
+            MappingProxyType(dict(attributes)) if attributes is not None else None
+        )
+
+        executable_paths: Mapping[str, str] = MappingProxyType(
+            dict(
+                zip(
+                    backend._get_executable_names(),  # noqa: SLF001
+                    backend._get_executable_paths(),  # noqa: SLF001
+                    strict=True,
+                )
+            )
+        )
+        attribute_arguments: tuple[str, ...] = tuple(
+            backend._attributes_to_arguments(self.attributes)  # noqa: SLF001
+        )
+
+        downdoc_process_pool: workers._PrespawnedProcessPool | None = (
+            workers._PrespawnedProcessPool(  # noqa: SLF001
+                downdoc_process_pool_size, idle_timeout=idle_timeout
+            )
+            if downdoc_process_pool_size is not None
+            else None
+        )
+        try:
+            asciidoctor_worker_pool: workers._AsciidoctorWorkerPool | None = (
+                workers._AsciidoctorWorkerPool(asciidoctor_workers)  # noqa: SLF001
+                if asciidoctor_workers is not None
+                else None
+            )
+        except ValueError:
+            if downdoc_process_pool is not None:
+                downdoc_process_pool.close()
+            raise
+
+        self._session: _session_state._SessionState = _session_state._SessionState(  # noqa: SLF001
+            attributes=self.attributes,
+            attribute_arguments=attribute_arguments,
+            executable_paths=executable_paths,
+            memory_cache=memory_cache,
+            disk_cache=disk_cache,
+            tracers=tuple(tracers),
+            downdoc_process_pool=downdoc_process_pool,
+            asciidoctor_worker_pool=asciidoctor_worker_pool,
+        )
+        self._is_closed: bool = False
+        self._close_lock: threading.Lock = threading.Lock()
+
+    @property
+    def executable_paths(self) -> "Mapping[str, str]":
+        """The path of each executable used by this converter, keyed by its name."""
+        return self._session.executable_paths
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether this converter has been closed, so can no longer convert."""
+        return self._is_closed
+
+    @contextlib.contextmanager
+    def _activate(self) -> "Iterator[None]":
+        """Make this converter's session current, for the conversions within the context."""
+        if self._is_closed:
+            CONVERTER_CLOSED_MESSAGE: Final[str] = "Cannot convert using a closed converter."
+            raise RuntimeError(CONVERTER_CLOSED_MESSAGE)
+
+        token: contextvars.Token[_session_state._SessionState | None] = (
+            _session_state._current_session.set(self._session)  # noqa: SLF001
+        )
+        try:
+            yield
+        finally:
+            _session_state._current_session.reset(token)  # noqa: SLF001
+
+    def get_version(self) -> str:
+        """Retrieve the version of the executables used by this converter."""
+        with self._activate():
+            return self.backend.get_version()
+
+    def convert_string(self, asciidoc_content: str) -> str:
+        """Convert AsciiDoc string content, using this converter's attributes."""
+        with self._activate():
+            return self.backend.convert_string(asciidoc_content, attributes=self.attributes)
+
+    def convert_strings(
+        self, asciidoc_contents: "Iterable[str]", *, max_workers: int | None = None
+    ) -> list[str]:
+        """Convert many AsciiDoc strings, within as few subprocesses as possible."""
+        with self._activate():
+            return self.backend.convert_strings(
+                asciidoc_contents, attributes=self.attributes, max_workers=max_workers
+            )
+
+    async def aconvert_string(self, asciidoc_content: str) -> str:
+        """Asynchronously convert AsciiDoc string content, using this converter's settings."""
+        with self._activate():
+            return await self.backend.aconvert_string(
+                asciidoc_content, attributes=self.attributes
+            )
+
+    @overload
+    def convert_file(
+        self,
+        file_path: "Path",
+        *,
+        output_location: "ConversionOutputDestinationFlag",
+        postpublish: bool = ...,
+        prepublish: bool = ...,
+    ) -> str: ...
+
+    @overload
+    def convert_file(
+        self,
+        file_path: "Path",
+        *,
+        output_location: "Path | None" = ...,
+        postpublish: bool = ...,
+        prepublish: bool = ...,
+    ) -> None: ...
+
+    def convert_file(
+        self,
+        file_path: "Path",
+        *,
+        output_location: "Path | ConversionOutputDestinationFlag | None" = None,
+        postpublish: bool = False,
+        prepublish: bool = False,
+    ) -> str | None:
+        """Convert an AsciiDoc file, using this converter's attributes."""
+        with self._activate():
+            return self.backend.convert_file(
+                file_path,
+                attributes=self.attributes,
+                output_location=output_location,
+                postpublish=postpublish,
+                prepublish=prepublish,
+            )
+
+    @overload
+    async def aconvert_file(
+        self,
+        file_path: "Path",
+        *,
+        output_location: "ConversionOutputDestinationFlag",
+        postpublish: bool = ...,
+        prepublish: bool = ...,
+    ) -> str: ...
+
+    @overload
+    async def aconvert_file(
+        self,
+        file_path: "Path",
+        *,
+        output_location: "Path | None" = ...,
+        postpublish: bool = ...,
+        prepublish: bool = ...,
+    ) -> None: ...
+
+    async def aconvert_file(
+        self,
+        file_path: "Path",
+        *,
+        output_location: "Path | ConversionOutputDestinationFlag | None" = None,
+        postpublish: bool = False,
+        prepublish: bool = False,
+    ) -> str | None:
+        """Asynchronously convert an AsciiDoc file, using this converter's attributes."""
+        with self._activate():
+            return await self.backend.aconvert_file(
+                file_path,
+                attributes=self.attributes,
+                output_location=output_location,
+                postpublish=postpublish,
+                prepublish=prepublish,
+            )
+
+    def convert_files(
+        self,
+        file_paths: "Iterable[Path]",
+        *,
+        output_locations: (
+            "Mapping[Path, Path | ConversionOutputDestinationFlag] | None"
+        ) = None,
+        max_workers: int | None = None,
+    ) -> "Iterator[FileConversionResult]":
+        """
+        Convert many AsciiDoc files concurrently, yielding results in completion order.
+
+        A failure to convert any single file is reported within its yielded result,
+        rather than aborting the conversion of the remaining files.
+        """
+        file_conversion_results: Iterator[FileConversionResult] = self.backend.convert_files(
+            file_paths,
+            attributes=self.attributes,
+            output_locations=output_locations,
+            max_workers=max_workers,
+        )
+
+        # NOTE: The session is only made current while the batch is advanced, because a generator must not leave its context changed between each yield
+        while True:
+            with self._activate():
+                file_conversion_result: FileConversionResult | None = next(
+                    file_conversion_results, None
+                )
+
+            if file_conversion_result is None:
+                return
+
+            yield file_conversion_result
+
+    def close(self) -> None:
+        """Shut down the worker pools owned by this converter, so it can no longer convert."""
+        with self._close_lock:
+            if self._is_closed:
+                return
+            self._is_closed = True
+
+        if self._session.downdoc_process_pool is not None:
+            self._session.downdoc_process_pool.close()
+        if self._session.asciidoctor_worker_pool is not None:
+            self._session.asciidoctor_worker_pool.close()
+
+    def __enter__(self) -> "Self":
+        """Use this converter within the context, closing it upon exit."""
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: object,
+    ) -> None:
+        """Close this converter, shutting down the worker pools it owns."""
+        self.close()
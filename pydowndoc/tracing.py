@@ -0,0 +1,367 @@
+"""Opt-in instrumentation of the timing of each stage of every conversion."""
+
+import contextvars
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if sys.version_info >= (3, 12):
+    from typing import override
+else:
+    from typing_extensions import override
+
+from . import _session_state
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from typing import Final
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+__all__: "Sequence[str]" = (
+    "ChildResourceUsage",
+    "ChromeTraceWriter",
+    "TraceSpan",
+    "register_tracer",
+    "unregister_tracer",
+)
+
+
+class ChildResourceUsage(NamedTuple):
+    """The resources consumed by a single conversion subprocess, measured once it exited."""
+
+    executable: str
+    user_time: float
+    system_time: float
+    maximum_resident_set_size: int
+
+
+class TraceSpan(NamedTuple):
+    """
+    The timing of a single stage of a conversion.
+
+    Stages are named: "convert_string", "convert_file" (including their async variants),
+    "convert_formats", "resolve_executable", "read", "pre_process", "spawn",
+    "subprocess_wait", "asciidoctor_worker", "post_process" & "write".
+    Start times are measured by `time.perf_counter()`, & all times are in seconds.
+    The "subprocess_wait" stage includes the resource usage of each subprocess it waited for,
+    on platforms that support `os.wait4()` (asynchronous conversions do not include any).
+    """
+
+    name: str
+    backend_id: str | None
+    attributes: "Mapping[str, str] | None"
+    start_time: float
+    duration: float
+    thread_id: int
+    input_size: int | None = None
+    output_size: int | None = None
+    error: BaseException | None = None
+    child_resource_usages: tuple[ChildResourceUsage, ...] = ()
+
+
+class _ResourceAccountedPopen(subprocess.Popen[str]):
+    """Subprocess that records its own resource usage, when it is waited for."""
+
+    resource_usage: ChildResourceUsage | None = None
+
+    @override
+    def wait(self, timeout: float | None = None) -> int:
+        # NOTE: Only untimed waits reap the child process with `os.wait4()` (which `communicate()` without a timeout also uses), so any other wait is left to `Popen` & simply records no resource usage
+        if self.returncode is not None or timeout is not None or not hasattr(os, "wait4"):
+            return super().wait(timeout)
+
+        try:
+            process_id, status, resource_usage = os.wait4(self.pid, 0)
+        except ChildProcessError:
+            # NOTE: The child process was already reaped by a concurrent `poll()` (E.g. from `kill()`), which recorded its return code
+            return super().wait()
+
+        if process_id != self.pid:
+            return super().wait()
+
+        self.resource_usage = ChildResourceUsage(
+            executable=Path(
+                os.fsdecode(
+                    self.args
+                    if isinstance(self.args, (str, bytes, os.PathLike))
+                    else next(iter(self.args))
+                )
+            ).name,
+            user_time=resource_usage.ru_utime,
+            system_time=resource_usage.ru_stime,
+            maximum_resident_set_size=(
+                resource_usage.ru_maxrss
+                if sys.platform == "darwin"
+                else resource_usage.ru_maxrss * 1024
+            ),
+        )
+        self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+
+_tracers: "tuple[Callable[[TraceSpan], object], ...]" = ()
+_tracers_lock: threading.Lock = threading.Lock()
+_current_conversion: "contextvars.ContextVar[tuple[str, Mapping[str, str] | None] | None]" = (
+    contextvars.ContextVar("pydowndoc_current_conversion", default=None)
+)
+
+
+def register_tracer(tracer: "Callable[[TraceSpan], object]") -> None:
+    """
+    Call the given tracer with every span completed by any conversion.
+
+    Tracers are called synchronously, from the thread that completed the span.
+    When no tracers are registered, conversions are not instrumented at all.
+    """
+    global _tracers  # noqa: PLW0603
+
+    with _tracers_lock:
+        _tracers = (*_tracers, tracer)
+
+
+def unregister_tracer(tracer: "Callable[[TraceSpan], object]") -> None:
+    """Stop calling the given tracer with completed spans."""
+    global _tracers  # noqa: PLW0603
+
+    with _tracers_lock:
+        _tracers = tuple(
+            registered_tracer for registered_tracer in _tracers if registered_tracer != tracer
+        )
+
+
+def _get_size(content: str | bytes | None) -> int | None:
+    if content is None:
+        return None
+
+    if isinstance(content, str):
+        return len(content.encode())
+
+    return len(content)
+
+
+class _DisabledSpan:
+    """Span that records nothing, used when no tracers are registered."""
+
+    __slots__ = ()
+
+    def record_output(self, output: str | bytes | None) -> None:
+        pass
+
+    def record_child_resource_usage(self, *processes: "subprocess.Popen[str]") -> None:
+        pass
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: object,
+    ) -> None:
+        pass
+
+
+class _Span(_DisabledSpan):
+    __slots__ = (
+        "_attributes",
+        "_backend_id",
+        "_child_resource_usages",
+        "_context_token",
+        "_input_size",
+        "_name",
+        "_output_size",
+        "_start_time",
+        "_tracers",
+    )
+
+    @override
+    def __init__(
+        self,
+        name: str,
+        tracers: "tuple[Callable[[TraceSpan], object], ...]",
+        *,
+        backend_id: str | None,
+        attributes: "Mapping[str, str] | None",
+        input_size: int | None,
+    ) -> None:
+        self._name: str = name
+        self._tracers: tuple[Callable[[TraceSpan], object], ...] = tracers
+        self._backend_id: str | None = backend_id
+        self._attributes: Mapping[str, str] | None = attributes
+        self._input_size: int | None = input_size
+        self._output_size: int | None = None
+        self._child_resource_usages: tuple[ChildResourceUsage, ...] = ()
+        self._start_time: float = 0.0
+        self._context_token: (
+            contextvars.Token[tuple[str, Mapping[str, str] | None] | None] | None
+        ) = None
+
+    @override
+    def record_output(self, output: str | bytes | None) -> None:
+        self._output_size = _get_size(output)
+
+    @override
+    def record_child_resource_usage(self, *processes: "subprocess.Popen[str]") -> None:
+        self._child_resource_usages += tuple(
+            process.resource_usage
+            for process in processes
+            if isinstance(process, _ResourceAccountedPopen)
+            and process.resource_usage is not None
+        )
+
+    @override
+    def __enter__(self) -> "Self":
+        if self._backend_id is not None:
+            self._context_token = _current_conversion.set((self._backend_id, self._attributes))
+
+        self._start_time = time.perf_counter()
+        return self
+
+    @override
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: object,
+    ) -> None:
+        duration: float = time.perf_counter() - self._start_time
+
+        if self._context_token is not None:
+            _current_conversion.reset(self._context_token)
+
+        span: TraceSpan = TraceSpan(
+            name=self._name,
+            backend_id=self._backend_id,
+            attributes=self._attributes,
+            start_time=self._start_time,
+            duration=duration,
+            thread_id=threading.get_ident(),
+            input_size=self._input_size,
+            output_size=self._output_size,
+            error=exception,
+            child_resource_usages=self._child_resource_usages,
+        )
+
+        for tracer in self._tracers:
+            tracer(span)
+
+
+_DISABLED_SPAN: "Final[_DisabledSpan]" = _DisabledSpan()
+
+
+def _trace(
+    name: str,
+    *,
+    input_content: str | bytes | None = None,
+    backend_id: str | None = None,
+    attributes: "Mapping[str, str] | None" = None,
+) -> _DisabledSpan:
+    """
+    Time the stage of a conversion executed within the returned context manager.
+
+    The backend ID & attributes are inherited from the enclosing span, unless given.
+    Tracers owned by the current `Converter` receive its spans, alongside registered tracers.
+    """
+    tracers: tuple[Callable[[TraceSpan], object], ...] = _tracers
+
+    session: _session_state._SessionState | None = _session_state._current_session.get()  # noqa: SLF001
+    if session is not None and session.tracers:
+        tracers = (*tracers, *session.tracers)
+
+    if not tracers:
+        return _DISABLED_SPAN
+
+    if backend_id is None:
+        current_conversion: tuple[str, Mapping[str, str] | None] | None = (
+            _current_conversion.get()
+        )
+        if current_conversion is not None:
+            backend_id, attributes = current_conversion
+
+    return _Span(
+        name,
+        tracers,
+        backend_id=backend_id,
+        attributes=attributes,
+        input_size=_get_size(input_content),
+    )
+
+
+class ChromeTraceWriter:
+    """
+    Tracer that collects spans & writes them as a Chrome trace-event JSON file.
+
+    The written file can be opened with `chrome://tracing` or https://ui.perfetto.dev.
+    When used as a context manager,
+    the writer is registered upon entry, then unregistered & written upon exit.
+    """
+
+    @override
+    def __init__(self, output_path: "Path") -> None:
+        self.output_path: Path = output_path
+        self._events: list[dict[str, object]] = []
+        self._events_lock: threading.Lock = threading.Lock()
+
+    def __call__(self, span: TraceSpan) -> None:
+        """Record the given span as a complete trace event."""
+        arguments: dict[str, object] = {
+            "backend": span.backend_id,
+            "input_bytes": span.input_size,
+            "output_bytes": span.output_size,
+            "attributes": dict(span.attributes) if span.attributes is not None else None,
+        }
+        if span.error is not None:
+            arguments["error"] = repr(span.error)
+        if span.child_resource_usages:
+            arguments["child_resource_usages"] = [
+                child_resource_usage._asdict()
+                for child_resource_usage in span.child_resource_usages
+            ]
+
+        event: dict[str, object] = {
+            "name": span.name,
+            "cat": span.backend_id or "pydowndoc",
+            "ph": "X",
+            "ts": span.start_time * 1_000_000,
+            "dur": span.duration * 1_000_000,
+            "pid": os.getpid(),
+            "tid": span.thread_id,
+            "args": arguments,
+        }
+
+        with self._events_lock:
+            self._events.append(event)
+
+    def write(self) -> None:
+        """Write every span recorded so far to the output file."""
+        with self._events_lock:
+            events: list[dict[str, object]] = list(self._events)
+
+        self.output_path.write_text(
+            json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+        )
+
+    def __enter__(self) -> "Self":
+        """Register this writer as a tracer."""
+        register_tracer(self)
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: object,
+    ) -> None:
+        """Unregister this writer as a tracer, then write every recorded span."""
+        unregister_tracer(self)
+        self.write()
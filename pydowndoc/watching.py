@@ -0,0 +1,620 @@
+"""Watching of directory trees, reconverting each AsciiDoc file as soon as it changes."""
+
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if sys.version_info >= (3, 12):
+    from typing import override
+else:
+    from typing_extensions import override
+
+from . import dependencies
+from .conversion_backends import DowndocMarkdownConversionBackend
+
+if TYPE_CHECKING:
+    import threading
+    from collections.abc import Collection, Iterable, Iterator, Mapping, Sequence
+    from typing import Final
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+    from ._utils import FileConversionResult
+    from .conversion_backends import BaseConversionBackend
+
+__all__: "Sequence[str]" = ("watch",)
+
+
+_IN_CLOSE_WRITE: "Final[int]" = 0x00000008
+_IN_MOVED_FROM: "Final[int]" = 0x00000040
+_IN_MOVED_TO: "Final[int]" = 0x00000080
+_IN_CREATE: "Final[int]" = 0x00000100
+_IN_DELETE: "Final[int]" = 0x00000200
+_IN_Q_OVERFLOW: "Final[int]" = 0x00004000
+_IN_IGNORED: "Final[int]" = 0x00008000
+_IN_ONLYDIR: "Final[int]" = 0x01000000
+_IN_ISDIR: "Final[int]" = 0x40000000
+_INOTIFY_EVENT_HEADER: "Final[struct.Struct]" = struct.Struct("iIII")
+
+# NOTE: Waiting for a stop event requires periodically waking up, whereas waiting without one blocks until the next filesystem change
+_STOP_EVENT_CHECK_INTERVAL: "Final[float]" = 0.5
+
+
+def _is_watched_directory(directory: Path) -> bool:
+    return not directory.name.startswith(".")
+
+
+def _iter_directory_tree(directory: Path) -> "Iterator[Path]":
+    """Yield the given directory & every non-hidden directory beneath it."""
+    yield directory
+
+    try:
+        directory_entries: list[os.DirEntry[str]] = list(os.scandir(directory))
+    except OSError:
+        return
+
+    for directory_entry in directory_entries:
+        if directory_entry.is_dir(follow_symlinks=False) and _is_watched_directory(
+            Path(directory_entry.path)
+        ):
+            yield from _iter_directory_tree(Path(directory_entry.path))
+
+
+def _scan_files(
+    directory: Path, *, suffixes: "Collection[str] | None"
+) -> dict[Path, tuple[int, int]]:
+    """
+    Retrieve the modification time & size of every file within the tree.
+
+    Only files with one of the given suffixes are included, unless no suffixes are given.
+    """
+    file_stats: dict[Path, tuple[int, int]] = {}
+    suffixes_tuple: tuple[str, ...] | None = tuple(suffixes) if suffixes is not None else None
+
+    for tree_directory in _iter_directory_tree(directory):
+        try:
+            directory_entries: list[os.DirEntry[str]] = list(os.scandir(tree_directory))
+        except OSError:
+            continue
+
+        for directory_entry in directory_entries:
+            if suffixes_tuple is not None and not directory_entry.name.endswith(
+                suffixes_tuple
+            ):
+                continue
+
+            try:
+                if not directory_entry.is_file():
+                    continue
+
+                file_stat: os.stat_result = directory_entry.stat()
+            except OSError:
+                continue
+
+            file_stats[Path(directory_entry.path)] = (file_stat.st_mtime_ns, file_stat.st_size)
+
+    return file_stats
+
+
+class _Inotify:
+    """Linux inotify instance, watching directory trees & the directories of dependencies."""
+
+    @override
+    def __init__(self) -> None:
+        libc_path: str | None = ctypes.util.find_library("c")
+        self._libc: ctypes.CDLL = ctypes.CDLL(libc_path, use_errno=True)
+        self._libc.inotify_init1.argtypes = (ctypes.c_int,)
+        self._libc.inotify_init1.restype = ctypes.c_int
+        self._libc.inotify_add_watch.argtypes = (
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        )
+        self._libc.inotify_add_watch.restype = ctypes.c_int
+
+        file_descriptor: int = self._libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if file_descriptor < 0:
+            error_number: int = ctypes.get_errno()
+            raise OSError(error_number, os.strerror(error_number))
+
+        self._file_descriptor: int = file_descriptor
+        self._watched_directories: dict[int, Path] = {}
+        self._dependency_directories: dict[int, Path] = {}
+        self._dependency_paths: frozenset[Path] = frozenset()
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Return whether inotify is supported by the current platform."""
+        if not sys.platform.startswith("linux"):
+            return False
+
+        libc_path: str | None = ctypes.util.find_library("c")
+        try:
+            return hasattr(ctypes.CDLL(libc_path), "inotify_init1")
+        except OSError:
+            return False
+
+    def fileno(self) -> int:
+        """Return the file descriptor that becomes readable when events are available."""
+        return self._file_descriptor
+
+    def _add_watch(self, directory: Path) -> int:
+        watch_descriptor: int = self._libc.inotify_add_watch(
+            self._file_descriptor,
+            os.fsencode(directory),
+            (
+                _IN_CLOSE_WRITE
+                | _IN_MOVED_FROM
+                | _IN_MOVED_TO
+                | _IN_CREATE
+                | _IN_DELETE
+                | _IN_ONLYDIR
+            ),
+        )
+        return watch_descriptor
+
+    def add_directory_tree(self, directory: Path) -> None:
+        """Watch the given directory, & every non-hidden directory beneath it."""
+        for tree_directory in _iter_directory_tree(directory):
+            watch_descriptor: int = self._add_watch(tree_directory)
+            if watch_descriptor >= 0:
+                self._watched_directories[watch_descriptor] = tree_directory
+
+    def watch_dependencies(self, dependency_paths: "Collection[Path]") -> None:
+        """
+        Watch the directory containing each of the given files, reporting only those files.
+
+        This notices changes to dependencies outside of the watched directory trees.
+        Directories that do not exist yet are watched by a later call, once they are created.
+        """
+        self._dependency_paths = frozenset(dependency_paths)
+        watched_dependency_directories: set[Path] = set(self._dependency_directories.values())
+
+        for dependency_directory in {
+            dependency_path.parent for dependency_path in self._dependency_paths
+        }:
+            if dependency_directory in watched_dependency_directories:
+                continue
+
+            watch_descriptor: int = self._add_watch(dependency_directory)
+            if watch_descriptor >= 0:
+                self._dependency_directories[watch_descriptor] = dependency_directory
+
+    def read_changed_paths(self) -> set[Path] | None:
+        """
+        Read every pending event, returning the paths that were written, created or removed.
+
+        Any newly created directories are watched,
+        and the files already within them are included within the returned paths.
+        Within the directories of dependencies, only changes to the dependencies are returned.
+        `None` is returned when the kernel's event queue overflowed,
+        meaning that changes may have been missed.
+        """
+        changed_paths: set[Path] = set()
+
+        while True:
+            try:
+                events: bytes = os.read(self._file_descriptor, 64 * 1024)
+            except BlockingIOError:
+                return changed_paths
+
+            offset: int = 0
+            while offset < len(events):
+                watch_descriptor, mask, _, name_length = _INOTIFY_EVENT_HEADER.unpack_from(
+                    events, offset
+                )
+                offset += _INOTIFY_EVENT_HEADER.size
+                name: bytes = events[offset : offset + name_length].rstrip(b"\0")
+                offset += name_length
+
+                if mask & _IN_Q_OVERFLOW:
+                    return None
+
+                if mask & _IN_IGNORED:
+                    self._watched_directories.pop(watch_descriptor, None)
+                    self._dependency_directories.pop(watch_descriptor, None)
+                    continue
+
+                if not name:
+                    continue
+
+                directory: Path | None = self._watched_directories.get(watch_descriptor)
+                if directory is None:
+                    dependency_directory: Path | None = self._dependency_directories.get(
+                        watch_descriptor
+                    )
+                    if dependency_directory is not None:
+                        dependency_path: Path = dependency_directory / os.fsdecode(name)
+                        if dependency_path in self._dependency_paths:
+                            changed_paths.add(dependency_path)
+
+                    continue
+
+                changed_path: Path = directory / os.fsdecode(name)
+
+                if not mask & _IN_ISDIR:
+                    changed_paths.add(changed_path)
+                elif mask & (_IN_CREATE | _IN_MOVED_TO) and _is_watched_directory(
+                    changed_path
+                ):
+                    self.add_directory_tree(changed_path)
+                    changed_paths.update(_scan_files(changed_path, suffixes=None))
+
+    def close(self) -> None:
+        """Stop watching every directory."""
+        os.close(self._file_descriptor)
+
+    def __enter__(self) -> "Self":
+        """Return this inotify instance."""
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: object,
+    ) -> None:
+        """Stop watching every directory."""
+        self.close()
+
+
+def _get_content_hash(file_path: Path) -> str | None:
+    try:
+        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _wait_for_inotify_changes(
+    inotify: _Inotify,
+    *,
+    debounce_delay: float,
+    stop_event: "threading.Event | None",
+) -> set[Path] | None:
+    """
+    Wait until a burst of filesystem changes has finished, returning every changed path.
+
+    `None` is returned when changes may have been missed,
+    so the whole directory tree must be rescanned.
+    """
+    while True:
+        if stop_event is not None and stop_event.is_set():
+            return set()
+
+        readable_file_descriptors: list[_Inotify]
+        readable_file_descriptors, _, _ = select.select(
+            (inotify,), (), (), None if stop_event is None else _STOP_EVENT_CHECK_INTERVAL
+        )
+        if readable_file_descriptors:
+            break
+
+    changed_paths: set[Path] | None = inotify.read_changed_paths()
+
+    # NOTE: Editors often save a file as a burst of several writes & renames, so the changes are only reported once no further events have arrived within the debounce delay
+    while select.select((inotify,), (), (), debounce_delay)[0]:
+        further_changed_paths: set[Path] | None = inotify.read_changed_paths()
+        if changed_paths is None or further_changed_paths is None:
+            changed_paths = None
+        else:
+            changed_paths |= further_changed_paths
+
+    return changed_paths
+
+
+def _poll_files(
+    directory: Path, *, suffixes: "Collection[str]", dependency_paths: "Iterable[Path]"
+) -> dict[Path, tuple[int, int]]:
+    """Retrieve the modification time & size of every watched file & every dependency."""
+    file_stats: dict[Path, tuple[int, int]] = _scan_files(directory, suffixes=suffixes)
+
+    for dependency_path in dependency_paths:
+        try:
+            dependency_stat: os.stat_result = dependency_path.stat()
+        except OSError:
+            continue
+
+        file_stats[dependency_path] = (dependency_stat.st_mtime_ns, dependency_stat.st_size)
+
+    return file_stats
+
+
+def _get_changed_paths(
+    previous_file_stats: "Mapping[Path, tuple[int, int]]",
+    current_file_stats: "Mapping[Path, tuple[int, int]]",
+) -> set[Path]:
+    return {
+        file_path
+        for file_path in previous_file_stats.keys() | current_file_stats.keys()
+        if previous_file_stats.get(file_path) != current_file_stats.get(file_path)
+    }
+
+
+def _wait_for_polled_changes(
+    directory: Path,
+    file_stats: dict[Path, tuple[int, int]],
+    *,
+    suffixes: "Collection[str]",
+    dependency_paths: "Collection[Path]",
+    poll_interval: float,
+    debounce_delay: float,
+    stop_event: "threading.Event | None",
+) -> set[Path]:
+    """
+    Poll the modification time & size of every file until any have changed.
+
+    The given file stats are updated in place,
+    & every changed (or removed) path is returned.
+    """
+    changed_paths: set[Path] = set()
+
+    while not changed_paths:
+        if stop_event is None:
+            time.sleep(poll_interval)
+        elif stop_event.wait(poll_interval):
+            return set()
+
+        current_file_stats: dict[Path, tuple[int, int]] = _poll_files(
+            directory, suffixes=suffixes, dependency_paths=dependency_paths
+        )
+        changed_paths = _get_changed_paths(file_stats, current_file_stats)
+        file_stats.clear()
+        file_stats.update(current_file_stats)
+
+    # NOTE: A file that is still being written would otherwise be converted while incomplete
+    while True:
+        if stop_event is None:
+            time.sleep(debounce_delay)
+        elif stop_event.wait(debounce_delay):
+            return set()
+
+        current_file_stats = _poll_files(
+            directory, suffixes=suffixes, dependency_paths=dependency_paths
+        )
+        if current_file_stats == file_stats:
+            return changed_paths
+
+        changed_paths |= _get_changed_paths(file_stats, current_file_stats)
+        file_stats.clear()
+        file_stats.update(current_file_stats)
+
+
+class _WatchedDocuments:
+    """The content hash & dependencies of every watched document, to identify real changes."""
+
+    @override
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        suffixes: tuple[str, ...],
+        attributes: "Mapping[str, str] | None",
+    ) -> None:
+        self.directory: Path = directory
+        self.suffixes: tuple[str, ...] = suffixes
+        self._content_hashes: dict[Path, str] = {}
+        self._dependency_graph: dependencies.DependencyGraph = dependencies.DependencyGraph(
+            attributes=attributes
+        )
+
+    def _is_document(self, file_path: Path) -> bool:
+        """Return whether the file is converted itself, rather than only being a dependency."""
+        if not file_path.name.endswith(self.suffixes):
+            return False
+
+        try:
+            relative_directory: Path = file_path.parent.relative_to(self.directory)
+        except ValueError:
+            return False
+
+        return all(
+            _is_watched_directory(Path(directory_name))
+            for directory_name in relative_directory.parts
+        )
+
+    @classmethod
+    def _is_dependency(cls, file_path: Path, dependency_paths: "Collection[Path]") -> bool:
+        return file_path in dependency_paths or file_path.resolve() in dependency_paths
+
+    def _forget_unused_content_hashes(self) -> None:
+        """Forget the content of every file that is neither a document nor a dependency."""
+        dependency_paths: frozenset[Path] = self._dependency_graph.get_dependencies()
+
+        self._content_hashes = {
+            file_path: content_hash
+            for file_path, content_hash in self._content_hashes.items()
+            if self._is_document(file_path) or self._is_dependency(file_path, dependency_paths)
+        }
+
+    def record(self, file_paths: "Iterable[Path]") -> None:
+        """Record the current content of the given documents, without reporting any changes."""
+        file_paths = tuple(file_paths)
+
+        for file_path in file_paths:
+            content_hash: str | None = _get_content_hash(file_path)
+            if content_hash is not None:
+                self._content_hashes[file_path] = content_hash
+
+        self._dependency_graph.add(file_paths)
+
+    def forget(self, file_path: Path) -> None:
+        """Forget the content of the given file, so that its next change is always reported."""
+        self._content_hashes.pop(file_path, None)
+
+    def get_dependencies(self) -> "frozenset[Path]":
+        """Retrieve every file that any watched document depends upon."""
+        return self._dependency_graph.get_dependencies()
+
+    def get_affected_documents(self, changed_paths: "Iterable[Path]") -> list[Path]:
+        """
+        Retrieve every document affected by the given changed files.
+
+        Files whose content is identical to when it was last recorded are ignored,
+        as are files that are neither documents nor dependencies (E.g. converted outputs),
+        which are never read.
+        """
+        modified_paths: set[Path] = set()
+        modified_documents: set[Path] = set()
+        removed_documents: set[Path] = set()
+        dependency_paths: frozenset[Path] = self._dependency_graph.get_dependencies()
+
+        for changed_path in changed_paths:
+            if not self._is_document(changed_path) and not self._is_dependency(
+                changed_path, dependency_paths
+            ):
+                continue
+
+            content_hash: str | None = _get_content_hash(changed_path)
+            if (
+                content_hash is not None
+                and self._content_hashes.get(changed_path) == content_hash
+            ):
+                continue
+
+            if content_hash is None:
+                self._content_hashes.pop(changed_path, None)
+            else:
+                self._content_hashes[changed_path] = content_hash
+
+            modified_paths.add(changed_path)
+
+            if self._is_document(changed_path):
+                if content_hash is None:
+                    removed_documents.add(changed_path)
+                else:
+                    modified_documents.add(changed_path)
+
+        if not modified_paths:
+            return []
+
+        self._dependency_graph.remove(removed_documents)
+        self._dependency_graph.add(modified_documents)
+
+        affected_documents: set[Path] = self._dependency_graph.get_affected_documents(
+            modified_paths
+        )
+        self._forget_unused_content_hashes()
+
+        return sorted(affected_documents)
+
+
+def watch(  # noqa: PLR0913
+    directory: Path,
+    *,
+    backend: "type[BaseConversionBackend]" = DowndocMarkdownConversionBackend,
+    attributes: "Mapping[str, str] | None" = None,
+    suffixes: "Iterable[str]" = (".adoc",),
+    max_workers: int | None = None,
+    debounce_delay: float = 0.05,
+    poll_interval: float = 1.0,
+    convert_existing: bool = True,
+    force_polling: bool = False,
+    stop_event: "threading.Event | None" = None,
+) -> "Iterator[FileConversionResult]":
+    """
+    Watch a directory tree, reconverting every AsciiDoc file each time its content changes.
+
+    Each converted file is written to its default output location
+    (next to the source file, with the backend's file suffix),
+    & the result of every conversion is yielded as soon as it completes.
+    Files within hidden directories are ignored.
+    Files outside of the directory tree are never converted themselves,
+    but changes to them still reconvert the files that include or embed them.
+    Changes are detected by inotify on Linux, & by polling every `poll_interval` seconds
+    on every other platform (or when `force_polling` is set).
+    Bursts of changes are grouped together until none have occurred for `debounce_delay`
+    seconds, then only the files whose content has actually changed are reconverted
+    (along with every file that includes or embeds any changed file),
+    using at most `max_workers` concurrent conversions.
+    Watching continues until the given stop event is set,
+    or the returned generator is closed.
+    """
+    if not directory.is_dir():
+        INVALID_DIRECTORY_MESSAGE: Final[str] = f"Cannot watch non-directory: {directory}."
+        raise ValueError(INVALID_DIRECTORY_MESSAGE)
+
+    if debounce_delay < 0 or poll_interval <= 0:
+        INVALID_INTERVAL_MESSAGE: Final[str] = (
+            "'debounce_delay' cannot be negative & 'poll_interval' must be positive."
+        )
+        raise ValueError(INVALID_INTERVAL_MESSAGE)
+
+    suffixes = tuple(suffixes)
+    if backend.FILE_SUFFIX in suffixes:
+        INVALID_SUFFIXES_MESSAGE: Final[str] = (
+            f"Cannot watch files with the output file suffix: {backend.FILE_SUFFIX}."
+        )
+        raise ValueError(INVALID_SUFFIXES_MESSAGE)
+
+    watched_documents: _WatchedDocuments = _WatchedDocuments(
+        directory, suffixes=suffixes, attributes=attributes
+    )
+
+    def reconvert(changed_paths: "Iterable[Path]") -> "Iterator[FileConversionResult]":
+        file_paths: list[Path] = watched_documents.get_affected_documents(changed_paths)
+        if not file_paths:
+            return
+
+        for result in backend.convert_files(
+            file_paths, attributes=attributes, max_workers=max_workers
+        ):
+            if result.error is not None:
+                watched_documents.forget(result.file_path)
+
+            yield result
+
+    def record_existing(file_paths: "Iterable[Path]") -> "Iterator[FileConversionResult]":
+        if convert_existing:
+            return reconvert(file_paths)
+
+        watched_documents.record(file_paths)
+        return iter(())
+
+    if force_polling or not _Inotify.is_available():
+        file_stats: dict[Path, tuple[int, int]] = _scan_files(directory, suffixes=suffixes)
+        yield from record_existing(tuple(file_stats))
+        file_stats = _poll_files(
+            directory,
+            suffixes=suffixes,
+            dependency_paths=watched_documents.get_dependencies(),
+        )
+
+        while stop_event is None or not stop_event.is_set():
+            yield from reconvert(
+                _wait_for_polled_changes(
+                    directory,
+                    file_stats,
+                    suffixes=suffixes,
+                    dependency_paths=watched_documents.get_dependencies(),
+                    poll_interval=poll_interval,
+                    debounce_delay=debounce_delay,
+                    stop_event=stop_event,
+                )
+            )
+
+        return
+
+    with _Inotify() as inotify:
+        # NOTE: The directories are watched before the existing files are scanned, so that no change made in between can be missed
+        inotify.add_directory_tree(directory)
+        yield from record_existing(_scan_files(directory, suffixes=suffixes))
+
+        while stop_event is None or not stop_event.is_set():
+            inotify.watch_dependencies(watched_documents.get_dependencies())
+            changed_paths: set[Path] | None = _wait_for_inotify_changes(
+                inotify, debounce_delay=debounce_delay, stop_event=stop_event
+            )
+            yield from reconvert(
+                changed_paths
+                if changed_paths is not None
+                else _scan_files(directory, suffixes=suffixes)
+            )
@@ -0,0 +1,535 @@
+"""Opt-in long-lived worker processes, to remove process startup from each conversion."""
+
+import atexit
+import collections
+import contextlib
+import json
+import os
+import queue
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if sys.version_info >= (3, 12):
+    from typing import override
+else:
+    from typing_extensions import override
+
+from . import _session_state, executables, tracing
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from typing import IO, Final
+
+__all__: "Sequence[str]" = (
+    "disable_asciidoctor_workers",
+    "disable_downdoc_process_pool",
+    "enable_asciidoctor_workers",
+    "enable_downdoc_process_pool",
+)
+
+
+ASCIIDOCTOR_WORKER_SCRIPT_PATH: "Final[Path]" = Path(__file__).parent / "asciidoctor_worker.rb"
+
+
+_ASCIIDOCTOR_VERSION_PATTERN: "Final[re.Pattern[str]]" = re.compile(r"\AAsciidoctor (\S+)")
+
+
+class _WorkerExitedError(Exception):
+    pass
+
+
+def _get_ruby_executable_path() -> str | None:
+    """
+    Find the Ruby interpreter that runs the `asciidoctor` executable, from its shebang.
+
+    Executables without a Ruby shebang (E.g. the shims of rbenv, which select the same Ruby
+    as the `ruby` shim beside them) fall back to the `ruby` executable.
+    """
+    asciidoctor_executable: str | None = executables.get_executable_path("asciidoctor")
+    first_line: bytes = b""
+
+    if asciidoctor_executable is not None:
+        with (
+            contextlib.suppress(OSError),
+            Path(asciidoctor_executable).open("rb") as asciidoctor_file,
+        ):
+            first_line = asciidoctor_file.readline(1024)
+
+    interpreter_arguments: list[str] = (
+        os.fsdecode(first_line[2:]).split() if first_line.startswith(b"#!") else []
+    )
+
+    if interpreter_arguments and Path(interpreter_arguments[0]).name == "env":
+        interpreter_arguments = [
+            interpreter_argument
+            for interpreter_argument in interpreter_arguments[1:]
+            if not interpreter_argument.startswith("-") and "=" not in interpreter_argument
+        ]
+        if interpreter_arguments and "ruby" in interpreter_arguments[0]:
+            return shutil.which(interpreter_arguments[0])
+
+    elif interpreter_arguments and "ruby" in Path(interpreter_arguments[0]).name:
+        return interpreter_arguments[0]
+
+    return executables.get_executable_path("ruby")
+
+
+def _get_asciidoctor_executable_version() -> str | None:
+    """Retrieve the version of the `asciidoctor` executable, if it can be found."""
+    asciidoctor_executable: str | None = executables.get_executable_path("asciidoctor")
+    if asciidoctor_executable is None:
+        return None
+
+    try:
+        raw_version: str
+        (raw_version,) = executables._probe_executables(  # noqa: SLF001
+            (asciidoctor_executable, "--version")
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    version_match: re.Match[str] | None = _ASCIIDOCTOR_VERSION_PATTERN.match(raw_version)
+    return version_match.group(1) if version_match is not None else None
+
+
+class _AsciidoctorWorker:
+    """A single Ruby process converting AsciiDoc to DocBook, one framed request at a time."""
+
+    @override
+    def __init__(self) -> None:
+        """
+        Start the worker, waiting for it to report that Asciidoctor has loaded.
+
+        Raises:
+            OSError: If the ruby executable could not be found.
+            _WorkerExitedError: If the worker exited before loading Asciidoctor,
+                or loaded a different version of Asciidoctor
+                than the `asciidoctor` executable.
+        """
+        ruby_executable: str | None = _get_ruby_executable_path()
+
+        if ruby_executable is None:
+            RUBY_NOT_INSTALLED_MESSAGE: Final[str] = (
+                "The ruby executable could not be found. "
+                "Ensure Asciidoctor is installed "
+                "(https://docs.asciidoctor.org/asciidoctor/latest/install)."
+            )
+            raise OSError(RUBY_NOT_INSTALLED_MESSAGE)
+
+        self.arguments: tuple[str, ...] = (
+            ruby_executable,
+            str(ASCIIDOCTOR_WORKER_SCRIPT_PATH),
+        )
+        self._process: subprocess.Popen[bytes] = subprocess.Popen(
+            self.arguments,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+        try:
+            handshake: dict[str, object] = self._read_response()
+        except _WorkerExitedError:
+            self.close()
+            raise
+
+        expected_version: str | None = _get_asciidoctor_executable_version()
+        if handshake.get("status") != "ready" or (
+            expected_version is not None and handshake.get("version") != expected_version
+        ):
+            self.close()
+            raise _WorkerExitedError
+
+    @classmethod
+    def _read_exactly(cls, stream: "IO[bytes]", size: int) -> bytes:
+        data: bytes = stream.read(size)
+
+        if len(data) < size:
+            raise _WorkerExitedError
+
+        return data
+
+    def request(self, request: "Mapping[str, object]") -> dict[str, object]:
+        """Send a single conversion request to the worker & wait for its response."""
+        if self._process.stdin is None or self._process.stdout is None:
+            raise _WorkerExitedError
+
+        request_body: bytes = json.dumps(request).encode()
+
+        try:
+            self._process.stdin.write(len(request_body).to_bytes(4, "big") + request_body)
+            self._process.stdin.flush()
+        except BrokenPipeError as e:
+            raise _WorkerExitedError from e
+
+        return self._read_response()
+
+    def _read_response(self) -> dict[str, object]:
+        if self._process.stdout is None:
+            raise _WorkerExitedError
+
+        try:
+            response: object = json.loads(
+                self._read_exactly(
+                    self._process.stdout,
+                    int.from_bytes(self._read_exactly(self._process.stdout, 4), "big"),
+                )
+            )
+        except ValueError as e:
+            raise _WorkerExitedError from e
+
+        if not isinstance(response, dict):
+            raise _WorkerExitedError
+
+        return response
+
+    def close(self) -> None:
+        """Shut down the worker, killing it if it does not exit promptly."""
+        if self._process.stdin is not None:
+            self._process.stdin.close()
+
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+
+        if self._process.stdout is not None:
+            self._process.stdout.close()
+
+
+class _AsciidoctorWorkerPool:
+    """Bounded pool of lazily started Asciidoctor workers, restarting any that crash."""
+
+    @override
+    def __init__(self, max_workers: int) -> None:
+        if max_workers < 1:
+            INVALID_MAX_WORKERS_MESSAGE: Final[str] = "'max_workers' must be at least 1."
+            raise ValueError(INVALID_MAX_WORKERS_MESSAGE)
+
+        self._available_workers_semaphore: threading.BoundedSemaphore = (
+            threading.BoundedSemaphore(max_workers)
+        )
+        self._idle_workers: list[_AsciidoctorWorker] = []
+        self._idle_workers_lock: threading.Lock = threading.Lock()
+        self._is_available: bool | None = None
+        self._availability_lock: threading.Lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        """
+        Return whether workers can be started, starting the first worker if none has been.
+
+        Workers are unavailable when the first cannot start or fails its handshake
+        (E.g. because its Ruby cannot load the same version of Asciidoctor
+        as the `asciidoctor` executable), so conversions use one-shot processes instead.
+        """
+        if self._is_available is not None:
+            return self._is_available
+
+        with self._availability_lock:
+            if self._is_available is None:
+                try:
+                    worker: _AsciidoctorWorker = _AsciidoctorWorker()
+                except (OSError, _WorkerExitedError):
+                    self._is_available = False
+                else:
+                    with self._idle_workers_lock:
+                        self._idle_workers.append(worker)
+                    self._is_available = True
+
+        return self._is_available
+
+    def _acquire_worker(self) -> _AsciidoctorWorker:
+        with self._idle_workers_lock:
+            if self._idle_workers:
+                return self._idle_workers.pop()
+
+        return _AsciidoctorWorker()
+
+    def convert(
+        self, *, attributes: "Sequence[str]", input_path: str | None, content: str | None
+    ) -> str:
+        """Convert the given AsciiDoc content or file to DocBook, using an idle worker."""
+        request: Mapping[str, object] = {
+            "attributes": list(attributes),
+            "input_path": input_path,
+            "content": content,
+        }
+
+        with self._available_workers_semaphore:
+            try:
+                worker: _AsciidoctorWorker = self._acquire_worker()
+
+                try:
+                    response: dict[str, object] = worker.request(request)
+                except _WorkerExitedError:
+                    worker.close()
+                    worker = _AsciidoctorWorker()
+
+                    try:
+                        response = worker.request(request)
+                    except _WorkerExitedError:
+                        worker.close()
+                        raise
+            except _WorkerExitedError as e:
+                WORKER_EXITED_MESSAGE: Final[str] = (
+                    "The asciidoctor worker exited unexpectedly. "
+                    "Ensure the asciidoctor Ruby gem is installed "
+                    "(https://docs.asciidoctor.org/asciidoctor/latest/install)."
+                )
+                raise OSError(WORKER_EXITED_MESSAGE) from e
+
+            with self._idle_workers_lock:
+                self._idle_workers.append(worker)
+
+        output: object = response.get("output", "")
+        messages: object = response.get("messages", "")
+
+        if response.get("status") != "ok":
+            raise subprocess.CalledProcessError(
+                1,
+                worker.arguments,
+                output=str(output),
+                stderr=str(messages),
+            )
+
+        return str(output)
+
+    def close(self) -> None:
+        """Shut down every idle worker."""
+        with self._idle_workers_lock:
+            idle_workers: list[_AsciidoctorWorker] = self._idle_workers
+            self._idle_workers = []
+
+        for worker in idle_workers:
+            worker.close()
+
+
+class _PrespawnedProcessPool:
+    """
+    Pool of one-shot processes, spawned ahead of time & left blocked reading their stdin.
+
+    Processes are keyed by their full arguments, so each can only be handed to a request
+    that would have spawned an identical process.
+    The pool is replenished, and processes left idle for too long are killed,
+    by a single background thread.
+    """
+
+    @override
+    def __init__(self, size: int, *, idle_timeout: float) -> None:
+        if size < 1:
+            INVALID_SIZE_MESSAGE: Final[str] = "'size' must be at least 1."
+            raise ValueError(INVALID_SIZE_MESSAGE)
+
+        if idle_timeout <= 0:
+            INVALID_IDLE_TIMEOUT_MESSAGE: Final[str] = "'idle_timeout' must be positive."
+            raise ValueError(INVALID_IDLE_TIMEOUT_MESSAGE)
+
+        self.size: int = size
+        self.idle_timeout: float = idle_timeout
+        self._idle_processes: dict[
+            tuple[str, ...], collections.deque[tuple[subprocess.Popen[str], float]]
+        ] = {}
+        self._idle_processes_lock: threading.Lock = threading.Lock()
+        self._spawn_requests: queue.SimpleQueue[tuple[str, ...] | None] = queue.SimpleQueue()
+        self._is_closed: bool = False
+        self._maintainer: threading.Thread = threading.Thread(
+            target=self._maintain, name="pydowndoc-process-pool", daemon=True
+        )
+        self._maintainer.start()
+
+    @classmethod
+    def _spawn(cls, arguments: "Sequence[str]") -> subprocess.Popen[str]:
+        return tracing._ResourceAccountedPopen(  # noqa: SLF001
+            arguments,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+    @classmethod
+    def _kill(cls, process: subprocess.Popen[str]) -> None:
+        process.kill()
+        process.communicate()
+
+    def _is_replenishment_required(self, arguments: tuple[str, ...]) -> bool:
+        with self._idle_processes_lock:
+            return not self._is_closed and (
+                len(self._idle_processes.get(arguments, ())) < self.size
+            )
+
+    def _add_idle_process(
+        self, arguments: tuple[str, ...], process: subprocess.Popen[str]
+    ) -> bool:
+        with self._idle_processes_lock:
+            if self._is_closed:
+                return False
+
+            self._idle_processes.setdefault(arguments, collections.deque()).append(
+                (process, time.monotonic())
+            )
+            return True
+
+    def _replenish(self, arguments: tuple[str, ...]) -> None:
+        while self._is_replenishment_required(arguments):
+            process: subprocess.Popen[str] = self._spawn(arguments)
+
+            if not self._add_idle_process(arguments, process):
+                self._kill(process)
+                return
+
+    def _reap_idle_processes(self) -> None:
+        expired_processes: list[subprocess.Popen[str]] = []
+        expiry_time: float = time.monotonic() - self.idle_timeout
+
+        with self._idle_processes_lock:
+            for arguments, idle_processes in tuple(self._idle_processes.items()):
+                while idle_processes and idle_processes[0][1] < expiry_time:
+                    expired_processes.append(idle_processes.popleft()[0])
+
+                if not idle_processes:
+                    del self._idle_processes[arguments]
+
+        for process in expired_processes:
+            self._kill(process)
+
+    def _maintain(self) -> None:
+        while True:
+            try:
+                arguments: tuple[str, ...] | None = self._spawn_requests.get(
+                    timeout=self.idle_timeout / 2
+                )
+            except queue.Empty:
+                arguments = None
+
+            if self._is_closed:
+                return
+
+            if arguments is not None:
+                self._replenish(arguments)
+
+            self._reap_idle_processes()
+
+    def acquire(self, arguments: "Sequence[str]") -> subprocess.Popen[str]:
+        """Retrieve a running process for the given arguments, spawning the next in advance."""
+        arguments = tuple(arguments)
+        acquired_process: subprocess.Popen[str] | None = None
+
+        with self._idle_processes_lock:
+            idle_processes: collections.deque[tuple[subprocess.Popen[str], float]] = (
+                self._idle_processes.get(arguments, collections.deque())
+            )
+            while idle_processes and acquired_process is None:
+                process: subprocess.Popen[str] = idle_processes.popleft()[0]
+                if process.poll() is None:
+                    acquired_process = process
+
+        self._spawn_requests.put(arguments)
+
+        return acquired_process if acquired_process is not None else self._spawn(arguments)
+
+    def close(self) -> None:
+        """Stop replenishing the pool & kill every idle process."""
+        with self._idle_processes_lock:
+            self._is_closed = True
+            idle_processes: list[subprocess.Popen[str]] = [
+                process
+                for arguments_idle_processes in self._idle_processes.values()
+                for process, _ in arguments_idle_processes
+            ]
+            self._idle_processes.clear()
+
+        self._spawn_requests.put(None)
+
+        for process in idle_processes:
+            self._kill(process)
+
+
+_asciidoctor_worker_pool: _AsciidoctorWorkerPool | None = None
+_downdoc_process_pool: _PrespawnedProcessPool | None = None
+
+
+def enable_asciidoctor_workers(max_workers: int = 1) -> None:
+    """
+    Convert to DocBook using long-lived Asciidoctor workers within the pandoc backends.
+
+    Each worker is a Ruby process, started upon its first use,
+    that is reused for every subsequent conversion.
+    Workers are run by the Ruby interpreter named by the `asciidoctor` executable's shebang,
+    & conversions fall back to one-shot Asciidoctor processes if the first worker cannot
+    load the same version of Asciidoctor as that executable.
+    Workers that crash are restarted,
+    and all workers are shut down when the interpreter exits.
+
+    Arguments:
+        max_workers: The maximum number of workers to run at once.
+    """
+    global _asciidoctor_worker_pool  # noqa: PLW0603
+    disable_asciidoctor_workers()
+    _asciidoctor_worker_pool = _AsciidoctorWorkerPool(max_workers)
+
+
+def disable_asciidoctor_workers() -> None:
+    """Shut down every idle Asciidoctor worker, reverting to one process per conversion."""
+    global _asciidoctor_worker_pool  # noqa: PLW0603
+    if _asciidoctor_worker_pool is not None:
+        _asciidoctor_worker_pool.close()
+    _asciidoctor_worker_pool = None
+
+
+def _get_asciidoctor_worker_pool() -> _AsciidoctorWorkerPool | None:
+    asciidoctor_worker_pool: _AsciidoctorWorkerPool | None = _asciidoctor_worker_pool
+
+    session: _session_state._SessionState | None = _session_state._current_session.get()  # noqa: SLF001
+    if session is not None and session.asciidoctor_worker_pool is not None:
+        asciidoctor_worker_pool = session.asciidoctor_worker_pool
+
+    # NOTE: Pools whose workers cannot start are never returned, so that conversions fall back to one-shot Asciidoctor processes
+    if asciidoctor_worker_pool is not None and not asciidoctor_worker_pool.is_available():
+        return None
+
+    return asciidoctor_worker_pool
+
+
+def enable_downdoc_process_pool(size: int = 2, *, idle_timeout: float = 30.0) -> None:
+    """
+    Spawn downdoc processes ahead of time, to hide their startup behind prior conversions.
+
+    Because downdoc is a one-shot executable, each process can only be used once.
+    Processes are spawned with their full arguments (including any AsciiDoc attributes),
+    then left waiting for their input, ready to be handed to the next matching conversion.
+
+    Arguments:
+        size: The number of processes to keep waiting, for each distinct set of arguments.
+        idle_timeout: The number of seconds after which unused waiting processes are killed.
+    """
+    global _downdoc_process_pool  # noqa: PLW0603
+    disable_downdoc_process_pool()
+    _downdoc_process_pool = _PrespawnedProcessPool(size, idle_timeout=idle_timeout)
+
+
+def disable_downdoc_process_pool() -> None:
+    """Kill every waiting downdoc process, reverting to spawning one per conversion."""
+    global _downdoc_process_pool  # noqa: PLW0603
+    if _downdoc_process_pool is not None:
+        _downdoc_process_pool.close()
+    _downdoc_process_pool = None
+
+
+def _get_downdoc_process_pool() -> _PrespawnedProcessPool | None:
+    session: _session_state._SessionState | None = _session_state._current_session.get()  # noqa: SLF001
+    if session is not None and session.downdoc_process_pool is not None:
+        return session.downdoc_process_pool
+
+    return _downdoc_process_pool
+
+
+atexit.register(disable_asciidoctor_workers)
+atexit.register(disable_downdoc_process_pool)